@@ -0,0 +1,501 @@
+# Registro degli algoritmi animabili e protocollo comune degli eventi di passo
+# Ogni algoritmo è un generatore che lavora sul buffer ricevuto e produce eventi standard
+# (confronto, sonda, scambio, scrittura, fase, scansione, allocazione); il risultato è il valore di
+# ritorno del generatore. Visualizzazione, esecuzione headless e benchmark sono quindi
+# disponibili per qualunque algoritmo registrato, senza modifiche all'interfaccia
+import time
+from bisect import bisect_left
+from collections import Counter, namedtuple
+
+from learned_index import model_for
+from parallel_sort import parallel_counting_sort
+from typed_arrays import make_array, zeros, itemsize_of
+
+# Tipi di evento del protocollo
+COMPARE = 'compare'
+PROBE = 'probe'
+SWAP = 'swap'
+WRITE = 'write'
+PHASE = 'phase'
+SCAN = 'scan'
+ALLOC = 'alloc'
+EVENT_KINDS = (COMPARE, PROBE, SWAP, WRITE, PHASE, SCAN, ALLOC)
+
+# Famiglie di algoritmi
+SEARCH = 'search'
+SORT = 'sort'
+
+
+class StepEvent(namedtuple('StepEvent', 'kind index other left right value text note')):
+    """Evento di un passo dell'algoritmo.
+
+    ``index`` e ``other`` sono le posizioni coinvolte, ``left``/``right``
+    l'intervallo attivo (solo per le ricerche), ``value`` il valore scritto o
+    confrontato; ``text`` e ``note`` sono le descrizioni facoltative del passo
+    e della sua motivazione, mostrate dall'interfaccia se presenti.
+    """
+
+    __slots__ = ()
+
+
+StepEvent.__new__.__defaults__ = (None,) * 7
+
+
+def compare(index, other=None, value=None, text=None, note=None):
+    """Confronto dell'elemento ``index`` con ``other`` oppure con ``value``."""
+    return StepEvent(COMPARE, index, other, value=value, text=text, note=note)
+
+
+def probe(index, left=None, right=None, text=None, note=None):
+    """Lettura dell'elemento ``index``, con l'eventuale intervallo attivo della ricerca."""
+    return StepEvent(PROBE, index, left=left, right=right, text=text, note=note)
+
+
+def swap(index, other, text=None, note=None):
+    return StepEvent(SWAP, index, other, text=text, note=note)
+
+
+def write(index, value, text=None, note=None):
+    return StepEvent(WRITE, index, value=value, text=text, note=note)
+
+
+def phase(text, note=None):
+    return StepEvent(PHASE, text=text, note=note)
+
+
+def scan(count, text=None):
+    """Lettura sequenziale di ``count`` elementi non animata (minimo, massimo, copie)."""
+    return StepEvent(SCAN, value=count, text=text)
+
+
+def alloc(nbytes, text=None):
+    """Allocazione di ``nbytes`` byte di memoria ausiliaria."""
+    return StepEvent(ALLOC, value=nbytes, text=text)
+
+
+class OperationCounts:
+    """Contatori delle operazioni di un'esecuzione, ricavati dai suoi eventi.
+
+    Le letture e le scritture sono quelle sugli elementi dei buffer
+    dell'algoritmo; un confronto con il target non aggiunge letture,
+    perché l'elemento è già stato letto dalla sonda che lo precede.
+    """
+
+    def __init__(self):
+        self.comparisons = 0
+        self.reads = 0
+        self.writes = 0
+        self.aux_bytes = 0
+        self.events = Counter()
+
+    def record(self, event):
+        kind = event.kind
+        self.events[kind] += 1
+        if kind == COMPARE:
+            self.comparisons += 1
+            if event.other is not None:
+                self.reads += 2
+        elif kind == PROBE:
+            self.reads += 1
+        elif kind == WRITE:
+            self.writes += 1
+        elif kind == SWAP:
+            self.reads += 2
+            self.writes += 2
+        elif kind == SCAN:
+            self.reads += event.value
+        elif kind == ALLOC:
+            self.aux_bytes += event.value
+
+    @property
+    def operations(self):
+        """Operazioni elementari: confronti, letture e scritture."""
+        return self.comparisons + self.reads + self.writes
+
+    def as_dict(self):
+        return {'comparisons': self.comparisons, 'reads': self.reads, 'writes': self.writes,
+                'aux_bytes': self.aux_bytes, 'operations': self.operations}
+
+
+class Algorithm:
+    """Descrizione di un algoritmo registrato.
+
+    ``run(array, target, label=str)`` è il generatore di eventi: le
+    ricerche restituiscono l'indice trovato (o -1), gli ordinamenti
+    ordinano ``array`` sul posto; ``label`` converte le chiavi codificate
+    nel testo delle descrizioni. ``steps(n)`` stima il numero di eventi
+    per la riproduzione a budget; ``fast`` è un nucleo facoltativo senza
+    eventi con lo stesso risultato, usato dall'esecuzione headless.
+    ``max_span`` limita l'intervallo delle chiavi gestibile (``None`` se
+    illimitato), come la dimensione dell'array dei conteggi.
+    """
+
+    def __init__(self, name, kind, run, steps, fast=None, complexity='', max_span=None):
+        self.name = name
+        self.kind = kind
+        self.run = run
+        self.steps = steps
+        self.fast = fast
+        self.complexity = complexity
+        self.max_span = max_span
+
+    def accepts(self, array):
+        """``True`` se l'intervallo delle chiavi di ``array`` rientra nei limiti dell'algoritmo."""
+        if self.max_span is None or not len(array):
+            return True
+        return max(array) - min(array) <= self.max_span
+
+    def __repr__(self):
+        return f"Algorithm({self.name!r}, {self.kind!r})"
+
+
+# Registro globale: nome visualizzato -> Algorithm, in ordine di registrazione
+ALGORITHMS = {}
+
+
+def register(name, kind, steps, fast=None, complexity='', max_span=None):
+    """Decoratore che registra un generatore di eventi come algoritmo ``kind``."""
+    def decorator(run):
+        ALGORITHMS[name] = Algorithm(name, kind, run, steps, fast, complexity, max_span)
+        return run
+    return decorator
+
+
+def get_algorithm(name):
+    try:
+        return ALGORITHMS[name]
+    except KeyError:
+        raise KeyError(f"Algoritmo non registrato: {name}") from None
+
+
+def algorithm_names(kind):
+    """Nomi degli algoritmi registrati della famiglia ``kind``."""
+    return [name for name, algorithm in ALGORITHMS.items() if algorithm.kind == kind]
+
+
+def _drain(events):
+    """Consuma il generatore e restituisce il suo valore di ritorno."""
+    while True:
+        try:
+            next(events)
+        except StopIteration as stop:
+            return stop.value
+
+
+def run_headless(algorithm, array, target=None):
+    """Esegue l'algoritmo senza interfaccia: nucleo veloce se disponibile, altrimenti eventi."""
+    if algorithm.fast is not None:
+        return algorithm.fast(array, target)
+    return _drain(algorithm.run(array, target))
+
+
+def count_events(algorithm, array, target=None):
+    """Esegue il generatore di eventi e restituisce (risultato, ``OperationCounts``)."""
+    counts = OperationCounts()
+    events = algorithm.run(array, target)
+    while True:
+        try:
+            event = next(events)
+        except StopIteration as stop:
+            return stop.value, counts
+        counts.record(event)
+
+
+def benchmark(algorithm, array, target=None, min_time=0.005, repeat=3, counted=False):
+    """Secondi per esecuzione headless, migliore di ``repeat`` misure.
+
+    Gli ordinamenti lavorano su una copia dell'array, il cui costo è
+    incluso nella misura; come in ``time_search`` il numero di esecuzioni
+    per misura cresce finché una misura non dura almeno ``min_time``.
+    Con ``counted`` viene cronometrato il generatore di eventi, cioè la
+    stessa implementazione di cui ``count_events`` conta le operazioni,
+    invece del nucleo veloce.
+    """
+    if counted:
+        def execute(data):
+            _drain(algorithm.run(data, target))
+    else:
+        def execute(data):
+            run_headless(algorithm, data, target)
+    if algorithm.kind == SORT:
+        def call():
+            execute(make_array(array))
+    else:
+        def call():
+            execute(array)
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            call()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            call()
+        best = min(best, time.perf_counter() - start)
+    return best / calls
+
+
+def measure(algorithm, array, target=None):
+    """Contatori e tempo headless di un'esecuzione: (risultato, contatori, secondi, operazioni/s).
+
+    I contatori vengono dall'esecuzione con eventi su una copia dei dati e
+    il throughput divide le operazioni per il tempo della stessa esecuzione
+    con eventi; ``secondi`` è invece il tempo del nucleo headless, che può
+    essere un'implementazione diversa (``bisect``, counting sort parallelo).
+    """
+    data = make_array(array) if algorithm.kind == SORT else array
+    result, counts = count_events(algorithm, data, target)
+    seconds = benchmark(algorithm, array, target)
+    counted = benchmark(algorithm, array, target, counted=True)
+    return result, counts, seconds, counts.operations / counted if counted > 0 else 0.0
+
+
+# Ricerche
+
+def _binary_search_fast(array, target):
+    index = bisect_left(array, target)
+    return index if index < len(array) and array[index] == target else -1
+
+
+@register("Ricerca binaria", SEARCH, steps=lambda n: 2 * n.bit_length() + 1,
+          fast=_binary_search_fast, complexity="O(log n)")
+def binary_search_events(array, target, label=str):
+    left, right = 0, len(array) - 1
+    yield phase(f"🎯 Cerco il numero {label(target)} nell'array ordinato ✨",
+                f"🚀 Iniziamo con l'intero array! Left=0, Right={right}. Andiamo a trovare il nostro numero!")
+    step = 0
+    while left <= right:
+        step += 1
+        mid = (left + right) // 2
+        value = array[mid]
+        yield probe(mid, left, right,
+                    text=f"📍 Passo {step}: Controllo elemento centrale [indice {mid}] = {label(value)} ✨")
+        if value == target:
+            yield compare(mid, value=target,
+                          note=f"🎊 Fantastico! L'elemento centrale {label(value)} è esattamente quello che cercavamo! Missione compiuta! 🎊")
+            return mid
+        if value < target:
+            yield compare(mid, value=target,
+                          note=f"🔍 Il valore centrale {label(value)} è minore di {label(target)}. Elimino la metà sinistra e cerco a destra! ➡️")
+            left = mid + 1
+        else:
+            yield compare(mid, value=target,
+                          note=f"🔍 Il valore centrale {label(value)} è maggiore di {label(target)}. Elimino la metà destra e cerco a sinistra! ⬅️")
+            right = mid - 1
+    return -1
+
+
+@register("Ricerca esponenziale", SEARCH, steps=lambda n: 4 * n.bit_length() + 5,
+          complexity="O(log i)")
+def exponential_search_events(array, target, label=str):
+    n = len(array)
+    yield phase(f"🎯 Cerco il numero {label(target)} raddoppiando il limite ✨",
+                "🚀 Il limite raddoppia finché non supera il numero cercato, poi parte una ricerca binaria nell'ultimo tratto!")
+    if n == 0:
+        return -1
+    bound = 1
+    yield probe(0, 0, n - 1, text=f"📍 Controllo il primo elemento = {label(array[0])} ✨")
+    yield compare(0, value=target)
+    if array[0] == target:
+        return 0
+    while bound < n:
+        yield probe(bound, bound // 2, n - 1, text=f"📍 Limite {bound}: elemento = {label(array[bound])} ✨")
+        yield compare(bound, value=target)
+        if array[bound] >= target:
+            break
+        bound *= 2
+    left, right = bound // 2, min(bound, n - 1)
+    while left <= right:
+        mid = (left + right) // 2
+        yield probe(mid, left, right, text=f"📍 Ricerca binaria in [{left}, {right}]: elemento [{mid}] = {label(array[mid])} ✨")
+        yield compare(mid, value=target)
+        if array[mid] == target:
+            return mid
+        if array[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return -1
+
+
+def _linear_search_fast(array, target):
+    try:
+        return array.index(target)
+    except ValueError:
+        return -1
+
+
+@register("Ricerca lineare", SEARCH, steps=lambda n: 2 * n + 1,
+          fast=_linear_search_fast, complexity="O(n)")
+def linear_search_events(array, target, label=str):
+    n = len(array)
+    yield phase(f"🎯 Cerco il numero {label(target)} scorrendo l'array dall'inizio ✨",
+                "🚶 Nessun ordinamento necessario: controllo un elemento alla volta, funziona anche su dati non ordinati!")
+    for i in range(n):
+        yield probe(i, i, n - 1, text=f"📍 Passo {i + 1}: elemento [{i}] = {label(array[i])} ✨")
+        yield compare(i, value=target)
+        if array[i] == target:
+            return i
+    return -1
+
+
+@register("Indice appreso", SEARCH, steps=lambda n: 2 * n.bit_length() + 4,
+          fast=lambda array, target: model_for(array).search(target), complexity="O(1) + O(log e)")
+def learned_search_events(array, target, label=str):
+    model = model_for(array)
+    predicted, lo, hi = model.predict(target)
+    yield phase(f"🎯 Il modello predice la posizione di {label(target)} ✨",
+                f"🧠 Segmento lineare → posizione {predicted}, errore garantito ±{model.max_error}: cerco solo in [{lo}, {hi - 1}]!")
+    if not len(array):
+        return -1
+    yield probe(min(predicted, len(array) - 1), lo, max(lo, hi - 1),
+                text=f"📍 Predizione: indice {predicted}, finestra di {hi - lo} elementi ✨")
+    if not model.window_holds(target, lo, hi):
+        yield phase("⚠️ Il numero è fuori dalla finestra predetta: ripiego sulla ricerca binaria completa",
+                    "🔁 L'array è cambiato dopo la costruzione del modello")
+        lo, hi = 0, len(array)
+    # Ricerca della prima occorrenza (come bisect_left) nella finestra [lo, hi)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        yield probe(mid, lo, hi - 1, text=f"📍 Finestra [{lo}, {hi - 1}]: elemento [{mid}] = {label(array[mid])} ✨")
+        yield compare(mid, value=target)
+        if array[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo < len(array) and array[lo] == target:
+        yield compare(lo, value=target,
+                      note=f"🎊 Trovato {label(target)} all'indice {lo}, a {abs(lo - predicted)} posizioni dalla predizione! 🎊")
+        return lo
+    return -1
+
+
+# Ordinamenti (sul posto, sul buffer ricevuto)
+
+def _counting_sort_fast(array, target=None):
+    # Istogrammi per blocco e riscrittura a tratti, in parallelo sugli array grandi
+    parallel_counting_sort(array)
+
+
+# Intervallo massimo delle chiavi per il counting sort (array dei conteggi da 128 MiB)
+COUNTING_MAX_SPAN = 1 << 24
+
+
+@register("Counting sort", SORT, steps=lambda n: 2 * n + 4,
+          fast=_counting_sort_fast, complexity="O(n+k)", max_span=COUNTING_MAX_SPAN)
+def counting_sort_events(array, target=None, label=str):
+    yield phase("🎯 Iniziamo il COUNTING SORT! Preparati per uno spettacolo incredibile! ✨",
+                "🚀 Il Counting Sort conta le occorrenze di ogni elemento e poi li ricostruisce in ordine!")
+    if not len(array):
+        return
+    # Fase 1: valori minimo e massimo (il minimo consente anche chiavi negative)
+    low, high = min(array), max(array)
+    yield scan(2 * len(array))
+    yield phase(f"📊 Fase 1: Trovato valore massimo = {label(high)}! Creiamo l'array di conteggio...",
+                f"🔍 Abbiamo bisogno di un array di conteggio di dimensione {high - low + 1} per contare ogni numero!")
+    # Fase 2: conteggio in un buffer tipizzato di zeri
+    count = zeros(high - low + 1)
+    yield alloc(count.itemsize * len(count))
+    yield phase("📈 Fase 2: Contiamo le occorrenze di ogni elemento! Guarda la magia! ✨")
+    for i, num in enumerate(array):
+        count[num - low] += 1
+        yield probe(i, text=f"🎯 Elemento {label(num)} trovato! Conteggio aggiornato: {count[num - low]} occorrenze",
+                    note=f"📊 Incrementiamo il contatore per il numero {label(num)}. Ogni numero ha il suo 'cassetto' nell'array di conteggio!")
+    # Fase 3: ricostruzione sul posto, i conteggi contengono già tutta l'informazione
+    yield phase("🎨 Fase 3: Ricostruiamo l'array ordinato! Ecco dove avviene la magia! ✨",
+                "🚀 Ora ricostruiamo l'array in ordine, usando i conteggi per sapere quante volte inserire ogni numero!")
+    position = 0
+    for offset, times in enumerate(count):
+        for _ in range(times):
+            array[position] = offset + low
+            yield write(position, offset + low, text=f"🎯 Inserito {label(offset + low)} in posizione {position}! Array in costruzione...",
+                        note="🔧 Stiamo ricostruendo l'array elemento per elemento, in ordine crescente perfetto!")
+            position += 1
+
+
+# Cifre del radix sort: 8 bit per passata
+RADIX_BITS = 8
+
+
+def _radix_passes(span):
+    passes = 1
+    while span >> (RADIX_BITS * passes):
+        passes += 1
+    return passes
+
+
+@register("Radix sort", SORT, steps=lambda n: 4 * n + 10, complexity="O(d·(n+b))")
+def radix_sort_events(array, target=None, label=str):
+    yield phase("🎯 Iniziamo il RADIX SORT! Ordiniamo una cifra alla volta ✨",
+                f"🚀 Ad ogni passata gli elementi vengono distribuiti stabilmente in base a una cifra di {RADIX_BITS} bit, dalla meno significativa!")
+    n = len(array)
+    if not n:
+        return
+    low = min(array)
+    passes = _radix_passes(max(array) - low)
+    yield scan(2 * n)
+    mask = (1 << RADIX_BITS) - 1
+    # Buffer di uscita e conteggi allocati una sola volta e riusati ad ogni passata
+    # (le liste di interi oltre i 64 bit occupano un puntatore da 8 byte per elemento)
+    output = array[:]
+    count = zeros(mask + 2)
+    yield alloc((itemsize_of(output) or 8) * n + count.itemsize * len(count))
+    for p in range(passes):
+        shift = p * RADIX_BITS
+        yield phase(f"📊 Passata {p + 1} di {passes}: cifra dei bit {shift}–{shift + RADIX_BITS - 1}")
+        for digit in range(mask + 2):
+            count[digit] = 0
+        for i in range(n):
+            count[((array[i] - low) >> shift & mask) + 1] += 1
+            yield probe(i)
+        for digit in range(mask + 1):
+            count[digit + 1] += count[digit]
+        # Distribuzione stabile nel buffer di uscita: una lettura per elemento
+        for i in range(n):
+            digit = (array[i] - low) >> shift & mask
+            output[count[digit]] = array[i]
+            count[digit] += 1
+        yield scan(n)
+        # Copia di ritorno nel buffer visualizzato, una scrittura per elemento
+        for i in range(n):
+            array[i] = output[i]
+            yield write(i, output[i], text=f"🎯 Passata {p + 1}: posizione {i} = {label(output[i])}")
+
+
+@register("Merge sort", SORT, steps=lambda n: 2 * n * max(1, (n - 1).bit_length()) + 2,
+          complexity="O(n log n)")
+def merge_sort_events(array, target=None, label=str):
+    yield phase("🎯 Iniziamo il MERGE SORT! Fondiamo sequenze ordinate sempre più lunghe ✨",
+                "🚀 Versione iterativa: blocchi di 1, 2, 4... elementi vengono fusi a coppie in un buffer ausiliario!")
+    n = len(array)
+    # Buffer ausiliario allocato una sola volta e ricopiato ad ogni livello
+    source = array[:]
+    yield alloc((itemsize_of(source) or 8) * n)
+    width = 1
+    while width < n:
+        yield phase(f"📊 Fusione di blocchi di {width} elementi")
+        source[:] = array
+        yield scan(n)
+        for start in range(0, n, 2 * width):
+            middle, end = min(start + width, n), min(start + 2 * width, n)
+            i, j = start, middle
+            for k in range(start, end):
+                if i < middle and j < end:
+                    yield compare(i, j)
+                    take_left = source[i] <= source[j]
+                else:
+                    take_left = i < middle
+                if take_left:
+                    array[k] = source[i]
+                    i += 1
+                else:
+                    array[k] = source[j]
+                    j += 1
+                yield write(k, array[k], text=f"🎯 Posizione {k} = {label(array[k])}")
+        width *= 2
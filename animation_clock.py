@@ -0,0 +1,155 @@
+# Orologio centralizzato per tutte le animazioni dell'interfaccia grafica
+# Un unico timer raggruppa gli effetti attivi e si ferma del tutto quando non serve
+import time
+
+# Intervallo del tick comune in millisecondi
+TICK_MS = 100
+# Secondi di inattività dell'utente dopo i quali gli effetti ambientali vengono sospesi
+IDLE_TIMEOUT = 30.0
+
+
+class AnimationClock:
+    """Orologio unico che esegue gli effetti di animazione in un solo tick.
+
+    Ogni effetto è un generatore: ad ogni avanzamento applica un fotogramma
+    e restituisce il controllo; quando si esaurisce viene rimosso. Gli effetti
+    con ``every > 1`` avanzano solo un tick ogni ``every``. Il timer ``after``
+    viene programmato solo per il primo effetto in scadenza, per cui a
+    riposo l'orologio non genera alcun risveglio. Gli effetti ambientali
+    (come il titolo animato) non mantengono attivo l'orologio oltre
+    ``idle_timeout`` secondi senza input dell'utente, e tutto si sospende
+    quando la finestra è ridotta a icona o perde il focus.
+    """
+
+    def __init__(self, root, tick_ms=TICK_MS, idle_timeout=IDLE_TIMEOUT, tolerated_errors=()):
+        self.root = root
+        self.tick_ms = tick_ms
+        self.idle_timeout = idle_timeout
+        # Eccezioni che indicano un widget distrutto: l'effetto viene semplicemente scartato
+        self.tolerated_errors = tuple(tolerated_errors)
+        self._effects = {}
+        self._tick = 0
+        self._pending = None
+        self._target = 0
+        self._paused = False
+        self._last_input = time.monotonic()
+        self._next_key = 0
+        # Numero di risvegli eseguiti, utile per misurare il costo a riposo
+        self.wakeups = 0
+
+    def bind_window_events(self):
+        """Collega la sospensione a riduzione a icona, focus e input dell'utente."""
+        self.root.bind('<Unmap>', lambda e: self._on_visibility(e, False), add='+')
+        self.root.bind('<Map>', lambda e: self._on_visibility(e, True), add='+')
+        self.root.bind('<FocusIn>', lambda e: self.resume(), add='+')
+        self.root.bind('<FocusOut>', lambda e: self.root.after_idle(self._check_focus), add='+')
+        for sequence in ('<Any-KeyPress>', '<Any-ButtonPress>', '<Motion>'):
+            self.root.bind_all(sequence, lambda e: self.touch(), add='+')
+
+    def _on_visibility(self, event, visible):
+        # Gli eventi Map/Unmap dei widget figli non riguardano la finestra principale
+        if event.widget is not self.root:
+            return
+        if visible:
+            self.resume()
+        else:
+            self.pause()
+
+    def _check_focus(self):
+        try:
+            focused = self.root.focus_get()
+        except KeyError:
+            focused = None
+        if focused is None:
+            self.pause()
+
+    def start(self, effect, every=1, ambient=False, key=None):
+        """Registra un effetto (generatore) e restituisce la sua chiave.
+
+        Il primo fotogramma viene applicato subito; i successivi ad ogni
+        ``every`` tick. Se ``key`` è già registrata l'effetto precedente viene
+        sostituito (e chiuso, così che esegua il proprio ripristino), per cui
+        riavviare la stessa animazione non ne accumula più copie.
+        """
+        if key is None:
+            key = self._next_key
+            self._next_key += 1
+        self.stop(key)
+        if not self._advance(key, effect):
+            return key
+        every = max(1, every)
+        self._effects[key] = [effect, every, ambient, self._tick + every]
+        self._reschedule()
+        return key
+
+    def stop(self, key):
+        """Rimuove l'effetto ``key`` se ancora attivo, chiudendo il suo generatore."""
+        entry = self._effects.pop(key, None)
+        if entry is not None:
+            try:
+                entry[0].close()
+            except self.tolerated_errors:
+                pass
+
+    def touch(self):
+        """Segnala attività dell'utente e riattiva gli effetti ambientali."""
+        self._last_input = time.monotonic()
+        self._schedule()
+
+    def pause(self):
+        self._paused = True
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+
+    def resume(self):
+        self._paused = False
+        self._schedule()
+
+    def _advance(self, key, effect):
+        """Applica un fotogramma; ``False`` se l'effetto è terminato o non più valido."""
+        try:
+            next(effect)
+        except StopIteration:
+            self._effects.pop(key, None)
+            return False
+        except self.tolerated_errors:
+            self._effects.pop(key, None)
+            return False
+        return True
+
+    def _next_due(self):
+        """Tick del prossimo effetto da eseguire, oppure ``None`` se non c'è lavoro."""
+        idle = time.monotonic() - self._last_input > self.idle_timeout
+        dues = [due for _, _, ambient, due in self._effects.values() if not (ambient and idle)]
+        return min(dues) if dues else None
+
+    def _schedule(self):
+        if self._pending is not None or self._paused:
+            return
+        due = self._next_due()
+        if due is not None:
+            # Il timer dorme fino al primo effetto in scadenza, non ad ogni tick
+            self._target = max(due, self._tick + 1)
+            self._pending = self.root.after(self.tick_ms * (self._target - self._tick), self._run)
+
+    def _reschedule(self):
+        """Anticipa il timer se un nuovo effetto scade prima di quello programmato."""
+        due = self._next_due()
+        if self._pending is not None and due is not None and due < self._target:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+        self._schedule()
+
+    def _run(self):
+        self._pending = None
+        self.wakeups += 1
+        self._tick = self._target
+        idle = time.monotonic() - self._last_input > self.idle_timeout
+        for key, entry in list(self._effects.items()):
+            effect, every, ambient, due = entry
+            if due > self._tick or (ambient and idle):
+                continue
+            if self._advance(key, effect):
+                entry[3] = self._tick + every
+        self._schedule()
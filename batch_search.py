@@ -0,0 +1,82 @@
+# Ricerca a lotti di più target su un array ordinato tramite finger search (galoppo)
+# Riutilizza la posizione della risposta precedente come limite inferiore della successiva
+import math
+
+
+def _gallop_left(array, target, start, counter):
+    """Restituisce il primo indice ``i >= start`` con ``array[i] >= target``.
+
+    Avanza con passi esponenziali (1, 2, 4, ...) a partire da ``start`` finché
+    non supera il target, poi completa con una ricerca binaria nell'ultimo
+    intervallo: il costo è O(log d), dove d è la distanza dal dito precedente.
+    ``counter`` è una lista di un elemento usata per accumulare i confronti.
+    """
+    n = len(array)
+    if start >= n:
+        return n
+    counter[0] += 1
+    if array[start] >= target:
+        return start
+    # Fase di galoppo: array[lo] < target è garantito ad ogni iterazione
+    lo = start
+    step = 1
+    hi = start + step
+    while hi < n:
+        counter[0] += 1
+        if array[hi] >= target:
+            break
+        lo = hi
+        step *= 2
+        hi = start + step
+    else:
+        hi = n
+    # Ricerca binaria nell'intervallo (lo, hi]
+    lo += 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        counter[0] += 1
+        if array[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def is_sorted_sequence(values):
+    """Verifica in tempo lineare se una sequenza è in ordine non decrescente."""
+    return all(values[i] <= values[i + 1] for i in range(len(values) - 1))
+
+
+def search_sorted_batch(array, targets):
+    """Cerca ogni valore di ``targets`` nell'array ordinato ``array``.
+
+    Se i target non sono già ordinati vengono ordinati internamente e le
+    risposte sono riportate nell'ordine originale. Restituisce la coppia
+    ``(indici, confronti)`` dove ``indici[i]`` è la posizione della prima
+    occorrenza di ``targets[i]`` oppure -1 se il valore non è presente.
+    """
+    targets = list(targets)
+    if is_sorted_sequence(targets):
+        order = range(len(targets))
+    else:
+        order = sorted(range(len(targets)), key=targets.__getitem__)
+    counter = [0]
+    results = [-1] * len(targets)
+    finger = 0
+    n = len(array)
+    for i in order:
+        target = targets[i]
+        # La risposta precedente è un limite inferiore valido per il target successivo
+        finger = _gallop_left(array, target, finger, counter)
+        if finger < n:
+            counter[0] += 1
+            if array[finger] == target:
+                results[i] = finger
+    return results, counter[0]
+
+
+def independent_search_cost(n, m):
+    """Stima dei confronti di m ricerche binarie indipendenti su n elementi."""
+    if n == 0:
+        return 0
+    return m * (math.floor(math.log2(n)) + 1)
@@ -1,11 +1,29 @@
 # Importazione delle librerie fondamentali per l'implementazione dell'interfaccia grafica
 # e delle funzionalità algoritmiche del visualizzatore di ricerca binaria
-import tkinter as tk  # Framework GUI principale per la creazione dell'interfaccia utente
-from tkinter import ttk, messagebox  # Componenti avanzati e dialoghi modali per l'interazione utente
 import time  # Modulo per la gestione temporale delle animazioni e dei ritardi computazionali
+# Istante di inizio degli import, origine delle misure dei tempi di avvio
+IMPORT_STARTED = time.perf_counter()
+import tkinter as tk  # Framework GUI principale per la creazione dell'interfaccia utente
+from tkinter import ttk, messagebox, filedialog  # Componenti avanzati e dialoghi modali per l'interazione utente
 import threading  # Libreria per l'esecuzione asincrona degli algoritmi senza bloccare l'interfaccia
 import random  # Generatore di numeri pseudocasuali per la creazione di dataset di test
 import math  # Libreria matematica per calcoli logaritmici e operazioni di complessità computazionale
+import argparse  # Argomenti della riga di comando (istantanea, ricerca iniziale, misure di avvio)
+import sys  # Codice di uscita e messaggi di errore per l'avvio da script
+from array import array  # Copia dei byte di un'istantanea in buffer tipizzati modificabili
+from versioned_blocks import SortedVersion, VersionedSortedList  # Versioni immutabili della lista a blocchi
+from batch_search import search_sorted_batch, independent_search_cost  # Finger search per lotti di target
+from prefilter import build_prefilter, prefilter_from_state, format_bytes  # Prefiltro di appartenenza per i target assenti
+from typed_arrays import make_array, widen_for, can_hold, as_view, itemsize_of  # Buffer tipizzati compatti
+from animation_clock import AnimationClock  # Orologio unico per tutte le animazioni dell'interfaccia
+from search_algorithms import SEARCHES  # Algoritmi in gara: uno per corsia
+from playback import FixedPlayback, BudgetPlayback, RenderMeter  # Temporizzazione delle animazioni
+from key_encoding import KEY_TYPES, IntCodec, FloatCodec, StrCodec, encode_keys  # Codifiche delle chiavi float e stringa
+from query_planner import QueryPlanner, SORT_THEN_SEARCH, LINEAR_SCAN, HASH_SET  # Scelta tra scansione, insieme hash e ordinamento
+from cascading import FractionalCascade, independent_cost  # Cascata frazionaria: una chiave in più array ordinati
+from learned_index import LearnedIndex, model_for, install  # Indice appreso: predizione della posizione e ricerca in una finestra
+from startup_timer import StartupTimer, FIRST_PAINT, PANELS_READY, FIRST_QUERY  # Tempi di avvio dall'inizio degli import
+from algorithms import get_algorithm, algorithm_names, benchmark, run_headless, OperationCounts, SEARCH, SORT, PROBE, COMPARE, PHASE, SCAN, ALLOC  # Registro degli algoritmi animabili
 
 # Definizione della classe principale che implementa il pattern Model-View-Controller
 # per la visualizzazione interattiva dell'algoritmo di ricerca binaria
@@ -23,10 +41,15 @@ class BinarySearchGUI:
         self.root.configure(bg='#faf8f3')
         
         # Strutture dati e variabili di stato per l'implementazione dell'algoritmo di ricerca binaria
-        # Array dinamico che contiene la sequenza di elementi su cui operare
-        self.array = []
+        # Buffer tipizzato contiguo (array.array) che contiene la sequenza di elementi su cui operare
+        self.array = make_array([])
+        # Scrittore delle versioni dell'array ordinato: ogni modifica pubblica una versione
+        # immutabile e self.array punta all'ultima, che i thread di lavoro fissano all'avvio
+        self.versions = VersionedSortedList()
         # Valore target da ricercare nell'array ordinato
         self.target = 0
+        # Lotto di target per la ricerca a lotti (None in modalità singola)
+        self.batch_targets = None
         # Indice sinistro del sottointervallo di ricerca corrente
         self.left = 0
         # Indice destro del sottointervallo di ricerca corrente
@@ -41,10 +64,46 @@ class BinarySearchGUI:
         self.sorting = False
         # Invariante booleano che certifica l'ordinamento dell'array
         self.is_sorted = False
-        # Intervallo temporale in secondi per la sincronizzazione delle animazioni
-        self.delay = 1.5
+        # Budget di tempo totale in secondi per la riproduzione a durata fissa
+        self.delay = 10.0
+        # Attivazione della riproduzione a budget (altrimenti ritardi fissi per dimensione)
+        self.budget_enabled = False
+        # Misuratore del costo reale dei fotogrammi, condiviso tra le esecuzioni
+        # per adattare ritardi e salto dei fotogrammi alla macchina corrente
+        self.render_meter = RenderMeter()
         # Cardinalità predefinita dell'insieme di elementi da processare
         self.array_size = 10
+        # Prefiltro di appartenenza costruito dopo l'ordinamento (None se disattivato)
+        self.prefilter = None
+        # Attivazione del prefiltro e tasso di falsi positivi del filtro di Bloom
+        self.prefilter_enabled = True
+        self.prefilter_fp_rate = 0.01
+        # Algoritmi registrati scelti per la ricerca e per l'ordinamento automatico
+        self.search_algorithm = "Ricerca binaria"
+        self.sort_algorithm = "Counting sort"
+        # Storico delle esecuzioni: algoritmo, dimensione, contatori e throughput headless
+        self.run_history = []
+        # Codifica delle chiavi: gli elementi dell'array sono codici interi che ne preservano l'ordine
+        self.codec = IntCodec()
+        # Pianificatore delle ricerche su array non ordinati e piano dell'ultima ricerca
+        self.planner = QueryPlanner()
+        self.planner_enabled = True
+        self.plan = None
+        # Numero di array correlati cercati insieme nella modalità cascata
+        self.cascade_arrays = 6
+        # Server locale delle ricerche (None se spento) e porta TCP su cui ascolta
+        self.server = None
+        self.server_port = 8765
+        # Tempi di avvio: i pannelli secondari sono costruiti dopo la prima visualizzazione
+        # e l'eventuale ricerca iniziale (da riga di comando) parte quando sono pronti
+        self.startup = StartupTimer(IMPORT_STARTED)
+        self.panels_built = False
+        self.pending_query = None
+        # Motivo per cui la ricerca indicata all'avvio non è stata eseguita (None se riuscita)
+        self.query_error = None
+        # Terna (versione ordinata, codifica, prefiltro) letta dai thread esterni come il server:
+        # viene sostituita in blocco, per cui chi la legge non mescola stati diversi
+        self.published = None
         
         # Dizionario contenente la palette cromatica dell'interfaccia utente
         # Implementa un sistema di design coerente basato su teoria del colore
@@ -67,6 +126,10 @@ class BinarySearchGUI:
         self.animation_step = 0
         # Direzione del movimento nell'animazione pulsante (1 = espansione, -1 = contrazione)
         self.pulse_direction = 1
+        # Orologio centralizzato che esegue tutti gli effetti in un unico tick
+        # e si sospende quando la finestra è ridotta a icona, senza focus o inattiva
+        self.clock = AnimationClock(self.root, tolerated_errors=(tk.TclError,))
+        self.clock.bind_window_events()
         
         # Invocazione sequenziale dei metodi di inizializzazione dell'interfaccia utente
         # Costruzione della gerarchia di widget secondo il pattern compositivo
@@ -77,6 +140,8 @@ class BinarySearchGUI:
         self.generate_array()
         # Attivazione del sistema di animazioni continue per il titolo
         self.animate_title()
+        # Alla prima comparsa della finestra si misura la visualizzazione e si completano i pannelli
+        self.root.bind('<Map>', self.on_first_map, add='+')
         
     # Metodo responsabile della costruzione dell'interfaccia utente principale
     # Implementa il layout gerarchico utilizzando il geometry manager pack()
@@ -89,7 +154,7 @@ class BinarySearchGUI:
         
         # Widget Label per la visualizzazione del titolo principale
         # Utilizza Unicode emoji per migliorare l'appeal visivo
-        title_label = tk.Label(
+        self.title_label = tk.Label(
             title_frame,
             text="🔍 VISUALIZZATORE RICERCA BINARIA 🔍",
             font=('Segoe UI', 28, 'bold'),  # Font sans-serif con dimensione 28pt e peso bold
@@ -97,7 +162,7 @@ class BinarySearchGUI:
             bg=self.colors['bg']  # Colore di sfondo coerente con il tema
         )
         # Posizionamento del widget nel contenitore padre
-        title_label.pack()
+        self.title_label.pack()
         
         # Widget Label per il sottotitolo esplicativo dell'applicazione
         # Fornisce contesto educativo sull'obiettivo del software
@@ -122,6 +187,8 @@ class BinarySearchGUI:
         control_container = tk.Frame(self.root, bg=self.colors['bg'])
         # Posizionamento con spaziatura verticale per separazione logica delle sezioni
         control_container.pack(pady=25)
+        # Riferimento conservato per il pannello delle opzioni, costruito dopo la prima visualizzazione
+        self.control_container = control_container
         
         # Implementazione dell'effetto ombra mediante sovrapposizione di frame
         # Tecnica di design per simulare profondità tridimensionale
@@ -286,6 +353,156 @@ class BinarySearchGUI:
         # Posizionamento con padding per effetto di elevazione
         self.reset_btn.pack(padx=2, pady=2)
         
+        # Container per il pulsante di inserimento incrementale con effetto ombra
+        # Permette di aggiungere chiavi senza rigenerare o riordinare l'array
+        insert_container = tk.Frame(button_frame, bg=self.colors['shadow'])
+        # Posizionamento laterale con spaziatura uniforme
+        insert_container.pack(side=tk.LEFT, padx=8)
+        
+        # Widget Button per l'inserimento ordinato del valore indicato nel campo di input
+        self.insert_btn = tk.Button(
+            insert_container,
+            text="➕ INSERISCI",  # Testo con emoji per identificazione funzionale
+            font=('Segoe UI', 10, 'bold'),  # Tipografia coerente con altri controlli
+            bg=self.colors['primary'],  # Colore primario per azione di modifica dei dati
+            fg='white',  # Colore del testo per contrasto ottimale
+            command=self.insert_value,  # Callback per l'inserimento incrementale
+            padx=15,  # Padding orizzontale per dimensionamento uniforme
+            pady=8,  # Padding verticale per proporzioni coerenti
+            relief='flat',  # Stile del bordo piatto per design moderno
+            bd=0,  # Spessore del bordo nullo
+            cursor='hand2'  # Cursore a mano per indicare interattività
+        )
+        # Posizionamento con padding per effetto di elevazione
+        self.insert_btn.pack(padx=2, pady=2)
+        
+        # Container per il pulsante di cancellazione incrementale con effetto ombra
+        delete_container = tk.Frame(button_frame, bg=self.colors['shadow'])
+        # Posizionamento laterale con spaziatura uniforme
+        delete_container.pack(side=tk.LEFT, padx=8)
+        
+        # Widget Button per la rimozione del valore indicato mantenendo l'ordinamento
+        self.delete_btn = tk.Button(
+            delete_container,
+            text="➖ ELIMINA",  # Testo con emoji per identificazione funzionale
+            font=('Segoe UI', 10, 'bold'),  # Tipografia coerente con altri controlli
+            bg=self.colors['secondary'],  # Colore secondario per azione distruttiva
+            fg='white',  # Colore del testo per contrasto ottimale
+            command=self.delete_value,  # Callback per la cancellazione incrementale
+            padx=15,  # Padding orizzontale per dimensionamento uniforme
+            pady=8,  # Padding verticale per proporzioni coerenti
+            relief='flat',  # Stile del bordo piatto per design moderno
+            bd=0,  # Spessore del bordo nullo
+            cursor='hand2'  # Cursore a mano per indicare interattività
+        )
+        # Posizionamento con padding per effetto di elevazione
+        self.delete_btn.pack(padx=2, pady=2)
+        
+        # Container per il pulsante della modalità gara con effetto ombra
+        race_container = tk.Frame(button_frame, bg=self.colors['shadow'])
+        # Posizionamento laterale con spaziatura uniforme
+        race_container.pack(side=tk.LEFT, padx=8)
+        
+        # Widget Button per il confronto simultaneo di più algoritmi di ricerca
+        self.race_btn = tk.Button(
+            race_container,
+            text="🏁 GARA",  # Testo con emoji per identificazione funzionale
+            font=('Segoe UI', 10, 'bold'),  # Tipografia coerente con altri controlli
+            bg=self.colors['gradient_end'],  # Colore distintivo per la modalità di confronto
+            fg='white',  # Colore del testo per contrasto ottimale
+            command=self.start_race,  # Callback per l'apertura della finestra di gara
+            padx=15,  # Padding orizzontale per dimensionamento uniforme
+            pady=8,  # Padding verticale per proporzioni coerenti
+            relief='flat',  # Stile del bordo piatto per design moderno
+            bd=0,  # Spessore del bordo nullo
+            cursor='hand2'  # Cursore a mano per indicare interattività
+        )
+        # Posizionamento con padding per effetto di elevazione
+        self.race_btn.pack(padx=2, pady=2)
+        
+        # Container per il pulsante della modalità cascata con effetto ombra
+        cascade_container = tk.Frame(button_frame, bg=self.colors['shadow'])
+        # Posizionamento laterale con spaziatura uniforme
+        cascade_container.pack(side=tk.LEFT, padx=8)
+        
+        # Widget Button per la ricerca dello stesso numero in più array ordinati
+        self.cascade_btn = tk.Button(
+            cascade_container,
+            text="🪜 CASCATA",  # Testo con emoji per identificazione funzionale
+            font=('Segoe UI', 10, 'bold'),  # Tipografia coerente con altri controlli
+            bg=self.colors['primary'],  # Colore primario per la modalità multi-array
+            fg='white',  # Colore del testo per contrasto ottimale
+            command=self.start_cascade,  # Callback per l'apertura della finestra della cascata
+            padx=15,  # Padding orizzontale per dimensionamento uniforme
+            pady=8,  # Padding verticale per proporzioni coerenti
+            relief='flat',  # Stile del bordo piatto per design moderno
+            bd=0,  # Spessore del bordo nullo
+            cursor='hand2'  # Cursore a mano per indicare interattività
+        )
+        # Posizionamento con padding per effetto di elevazione
+        self.cascade_btn.pack(padx=2, pady=2)
+        
+        # Container per i pulsanti delle istantanee con effetto ombra
+        snapshot_container = tk.Frame(button_frame, bg=self.colors['shadow'])
+        # Posizionamento laterale con spaziatura uniforme
+        snapshot_container.pack(side=tk.LEFT, padx=8)
+        
+        # Widget Button per il salvataggio dell'array ordinato e degli indici su file
+        self.save_btn = tk.Button(
+            snapshot_container,
+            text="💾 SALVA",  # Testo con emoji per identificazione funzionale
+            font=('Segoe UI', 10, 'bold'),  # Tipografia coerente con altri controlli
+            bg=self.colors['success'],  # Colore di stato positivo per la persistenza
+            fg='white',  # Colore del testo per contrasto ottimale
+            command=self.save_snapshot,  # Callback per la scrittura dell'istantanea
+            padx=15,  # Padding orizzontale per dimensionamento uniforme
+            pady=8,  # Padding verticale per proporzioni coerenti
+            relief='flat',  # Stile del bordo piatto per design moderno
+            bd=0,  # Spessore del bordo nullo
+            cursor='hand2'  # Cursore a mano per indicare interattività
+        )
+        # Posizionamento affiancato con padding per effetto di elevazione
+        self.save_btn.pack(side=tk.LEFT, padx=2, pady=2)
+        
+        # Widget Button per il caricamento di un'istantanea senza ricostruire gli indici
+        self.load_btn = tk.Button(
+            snapshot_container,
+            text="📂 CARICA",  # Testo con emoji per identificazione funzionale
+            font=('Segoe UI', 10, 'bold'),  # Tipografia coerente con altri controlli
+            bg=self.colors['success'],  # Colore coerente con il pulsante di salvataggio
+            fg='white',  # Colore del testo per contrasto ottimale
+            command=self.open_snapshot,  # Callback per la scelta e la lettura dell'istantanea
+            padx=15,  # Padding orizzontale per dimensionamento uniforme
+            pady=8,  # Padding verticale per proporzioni coerenti
+            relief='flat',  # Stile del bordo piatto per design moderno
+            bd=0,  # Spessore del bordo nullo
+            cursor='hand2'  # Cursore a mano per indicare interattività
+        )
+        # Posizionamento affiancato con padding per effetto di elevazione
+        self.load_btn.pack(side=tk.LEFT, padx=2, pady=2)
+        
+        # Container per il pulsante del server locale con effetto ombra
+        server_container = tk.Frame(button_frame, bg=self.colors['shadow'])
+        # Posizionamento laterale con spaziatura uniforme
+        server_container.pack(side=tk.LEFT, padx=8)
+        
+        # Widget Button per l'avvio e l'arresto del server delle ricerche per altri processi locali
+        self.server_btn = tk.Button(
+            server_container,
+            text="🔌 SERVER",  # Testo con emoji per identificazione funzionale
+            font=('Segoe UI', 10, 'bold'),  # Tipografia coerente con altri controlli
+            bg=self.colors['text'],  # Colore neutro per un servizio in background
+            fg='white',  # Colore del testo per contrasto ottimale
+            command=self.toggle_server,  # Callback per l'avvio o l'arresto del server
+            padx=15,  # Padding orizzontale per dimensionamento uniforme
+            pady=8,  # Padding verticale per proporzioni coerenti
+            relief='flat',  # Stile del bordo piatto per design moderno
+            bd=0,  # Spessore del bordo nullo
+            cursor='hand2'  # Cursore a mano per indicare interattività
+        )
+        # Posizionamento con padding per effetto di elevazione
+        self.server_btn.pack(padx=2, pady=2)
+        
 
         
         # Sezione principale dedicata alla visualizzazione dell'array
@@ -355,13 +572,332 @@ class BinarySearchGUI:
         # Posizionamento con padding verticale per spaziatura
         self.stats_label.pack(pady=8)
         
+    # Metodo di callback per la prima comparsa della finestra principale
+    # Il ridisegno in sospeso viene completato subito per misurare la prima visualizzazione
+    def on_first_map(self, event):
+        if event.widget is not self.root or self.panels_built:
+            return
+        self.root.update_idletasks()
+        self.startup.mark(FIRST_PAINT)
+        self.root.after_idle(self.build_secondary_panels)
+    
+    # Metodo per la risposta immediata a una ricerca indicata all'avvio, senza animazione
+    # Su un array ordinato si usa l'algoritmo scelto (con il prefiltro), altrimenti il piano
+    # senza ordinamento: la prima risposta non attende l'ordinamento dell'array
+    def answer_query(self, text):
+        try:
+            values = self.parse_keys(text)
+        except ValueError:
+            values = []
+        if not values:
+            # Nessuna finestra modale: chi lancia da script con --exit resterebbe in attesa.
+            # L'evento viene generato comunque, così che l'avvio risulti concluso
+            self.query_error = f"chiavi non valide per il tipo {self.codec.name}: {text!r}"
+            self.step_label.config(text=f"❌ Ricerca iniziale non eseguita: {self.query_error}")
+            self.root.event_generate('<<FirstQuery>>')
+            return
+        if self.is_sorted:
+            algorithm = get_algorithm(self.search_algorithm)
+            results = [run_headless(algorithm, self.array, value)
+                       if self.prefilter is None or self.prefilter.might_contain(value) else -1
+                       for value in values]
+        else:
+            plan = self.planner.plan(self.array, len(values))
+            strategy = HASH_SET if plan.strategy == SORT_THEN_SEARCH else plan.strategy
+            results = self.planner.lookup(strategy, self.array, values)
+        seconds = self.startup.mark(FIRST_QUERY)
+        summary = ", ".join(f"{self.key_text(t)}→[{i}]" if i != -1 else f"{self.key_text(t)}→❌"
+                            for t, i in zip(values, results))
+        found = [i for i in results if i != -1]
+        self.display_array(found_index=found[-1] if found else -1)
+        self.step_label.config(text=f"⚡ Prima risposta dopo {seconds * 1000:.1f} ms dall'avvio: {summary}")
+        self.stats_label.config(text=f"📊 ⏱️ {self.startup.describe()} 🚀")
+        # Evento virtuale per chi misura l'avvio da script (vedi main)
+        self.root.event_generate('<<FirstQuery>>')
+    
+    # Metodo per la costruzione dei pannelli secondari (opzioni e legenda) dopo la prima visualizzazione
+    # La finestra diventa interattiva con titolo, comandi, array e riquadro informativo;
+    # il resto viene costruito una sola volta quando il ciclo degli eventi è libero
+    def build_secondary_panels(self):
+        if self.panels_built:
+            return
+        self.panels_built = True
+        self.build_options_panel()
+        self.build_legend()
+        self.startup.mark(PANELS_READY)
+        if self.pending_query is not None:
+            self.root.after_idle(self.answer_query, self.pending_query)
+        else:
+            self.root.event_generate('<<PanelsReady>>')
+    
+    # Metodo per la costruzione della seconda riga di controlli: prefiltro, riproduzione, algoritmi e tipo di chiave
+    # I controlli leggono lo stato corrente, per cui riflettono le scelte fatte prima della costruzione
+    def build_options_panel(self):
+        # Seconda riga di controlli dedicata alle opzioni di esecuzione
+        # Frame container posizionato sotto la riga principale dei comandi
+        options_frame = tk.Frame(self.control_container, bg=self.colors['card'], relief='flat', bd=0)
+        # Posizionamento con espansione orizzontale e padding interno
+        options_frame.pack(fill='x', padx=20, pady=(0, 5), ipady=10)
+        
+        # Sezione dedicata alla configurazione del prefiltro per i target assenti
+        # Frame container per l'attivazione e il tasso di falsi positivi
+        prefilter_frame = tk.Frame(options_frame, bg=self.colors['card'])
+        # Posizionamento laterale con spaziatura orizzontale uniforme
+        prefilter_frame.pack(side=tk.LEFT, padx=25)
+        
+        # Variabile di controllo collegata alla casella di attivazione del prefiltro
+        self.prefilter_var = tk.BooleanVar(value=self.prefilter_enabled)
+        # Widget Checkbutton per abilitare lo scarto immediato dei target assenti
+        tk.Checkbutton(
+            prefilter_frame,
+            text="🛡️ Prefiltro",
+            variable=self.prefilter_var,
+            command=self.on_prefilter_change,  # Callback per la ricostruzione del filtro
+            font=('Segoe UI', 13, 'bold'),  # Tipografia coerente con le altre etichette
+            fg=self.colors['text'],  # Colore del testo per leggibilità ottimale
+            bg=self.colors['card'],  # Sfondo coerente con il design system
+            activebackground=self.colors['card'],  # Sfondo invariato al passaggio del mouse
+            selectcolor=self.colors['bg']  # Colore della casella di spunta
+        ).pack()
+        
+        # Widget Spinbox per la scelta del tasso di falsi positivi in percentuale
+        self.fp_rate_spinbox = tk.Spinbox(
+            prefilter_frame,
+            values=("0.1", "0.5", "1", "5", "10"),  # Percentuali di falsi positivi disponibili
+            font=('Segoe UI', 12, 'bold'),  # Font con peso bold per leggibilità
+            width=6,  # Larghezza in caratteri del widget
+            justify='center',  # Allineamento centrale del testo
+            command=self.on_prefilter_change,  # Callback per la ricostruzione del filtro
+            bg=self.colors['bg'],  # Colore di sfondo del campo
+            fg=self.colors['text']  # Colore del testo
+        )
+        # Impostazione del valore iniziale coerente con il tasso predefinito
+        self.fp_rate_spinbox.delete(0, tk.END)
+        self.fp_rate_spinbox.insert(0, "1")
+        # Posizionamento con padding verticale per spaziatura
+        self.fp_rate_spinbox.pack(pady=8)
+        
+        # Sezione dedicata alla riproduzione a budget di tempo totale
+        # Frame container per l'attivazione e la durata desiderata dell'animazione
+        playback_frame = tk.Frame(options_frame, bg=self.colors['card'])
+        # Posizionamento laterale con spaziatura orizzontale uniforme
+        playback_frame.pack(side=tk.LEFT, padx=25)
+        
+        # Variabile di controllo collegata alla casella di attivazione del budget
+        self.budget_var = tk.BooleanVar(value=self.budget_enabled)
+        # Widget Checkbutton per passare dai ritardi fissi alla durata totale
+        tk.Checkbutton(
+            playback_frame,
+            text="⏱️ Durata totale (s)",
+            variable=self.budget_var,
+            command=self.on_budget_toggle,  # Callback per il cambio di modalità
+            font=('Segoe UI', 13, 'bold'),  # Tipografia coerente con le altre etichette
+            fg=self.colors['text'],  # Colore del testo per leggibilità ottimale
+            bg=self.colors['card'],  # Sfondo coerente con il design system
+            activebackground=self.colors['card'],  # Sfondo invariato al passaggio del mouse
+            selectcolor=self.colors['bg']  # Colore della casella di spunta
+        ).pack()
+        
+        # Widget Scale per la scelta del budget di tempo dell'intera animazione
+        self.speed_scale = tk.Scale(
+            playback_frame,
+            from_=1,  # Durata minima in secondi
+            to=60,  # Durata massima in secondi
+            orient=tk.HORIZONTAL,  # Orientamento orizzontale dello slider
+            length=200,  # Lunghezza dello slider in pixel
+            command=self.update_speed,  # Callback per l'aggiornamento del budget
+            font=('Segoe UI', 10, 'bold'),  # Font per i valori dello slider
+            fg=self.colors['text'],  # Colore del testo
+            bg=self.colors['card'],  # Sfondo coerente con il contenitore
+            highlightthickness=0,  # Nessun bordo di evidenziazione
+            troughcolor=self.colors['shadow']  # Colore della guida dello slider
+        )
+        # Impostazione del valore iniziale coerente con il budget predefinito
+        self.speed_scale.set(self.delay)
+        # Posizionamento con padding verticale per spaziatura
+        self.speed_scale.pack(pady=4)
+        
+        # Sezione dedicata alla scelta degli algoritmi dal registro
+        # Frame container per i selettori di ricerca e ordinamento
+        algorithm_frame = tk.Frame(options_frame, bg=self.colors['card'])
+        # Posizionamento laterale con spaziatura orizzontale uniforme
+        algorithm_frame.pack(side=tk.LEFT, padx=25)
+        
+        # Etichetta descrittiva della sezione
+        tk.Label(
+            algorithm_frame,
+            text="🧩 Algoritmi",
+            font=('Segoe UI', 13, 'bold'),
+            fg=self.colors['text'],
+            bg=self.colors['card']
+        ).pack()
+        
+        # Selettori a sola lettura popolati con gli algoritmi registrati
+        self.search_choice = ttk.Combobox(
+            algorithm_frame,
+            values=algorithm_names(SEARCH),
+            state='readonly',
+            width=18,
+            font=('Segoe UI', 11)
+        )
+        self.search_choice.set(self.search_algorithm)
+        self.search_choice.bind('<<ComboboxSelected>>', self.on_algorithm_select)
+        self.search_choice.pack(pady=(6, 2))
+        self.sort_choice = ttk.Combobox(
+            algorithm_frame,
+            values=algorithm_names(SORT),
+            state='readonly',
+            width=18,
+            font=('Segoe UI', 11)
+        )
+        self.sort_choice.set(self.sort_algorithm)
+        self.sort_choice.bind('<<ComboboxSelected>>', self.on_algorithm_select)
+        self.sort_choice.pack(pady=2)
+        
+        # Variabile di controllo collegata alla casella del pianificatore delle ricerche
+        self.planner_var = tk.BooleanVar(value=self.planner_enabled)
+        # Widget Checkbutton per evitare l'ordinamento quando le ricerche attese sono poche
+        tk.Checkbutton(
+            algorithm_frame,
+            text="🧭 Pianificatore",
+            variable=self.planner_var,
+            command=self.on_planner_toggle,  # Callback per l'attivazione del pianificatore
+            font=('Segoe UI', 11, 'bold'),
+            fg=self.colors['text'],
+            bg=self.colors['card'],
+            activebackground=self.colors['card'],
+            selectcolor=self.colors['bg']
+        ).pack(pady=(2, 0))
+        
+        # Sezione dedicata al tipo delle chiavi (interi, decimali o codici testuali)
+        key_frame = tk.Frame(options_frame, bg=self.colors['card'])
+        # Posizionamento laterale con spaziatura orizzontale uniforme
+        key_frame.pack(side=tk.LEFT, padx=25)
+        
+        # Etichetta descrittiva della sezione
+        tk.Label(
+            key_frame,
+            text="🔑 Tipo di chiave",
+            font=('Segoe UI', 13, 'bold'),
+            fg=self.colors['text'],
+            bg=self.colors['card']
+        ).pack()
+        
+        # Selettore a sola lettura: il cambio di tipo genera un nuovo array
+        self.key_choice = ttk.Combobox(
+            key_frame,
+            values=list(KEY_TYPES),
+            state='readonly',
+            width=12,
+            font=('Segoe UI', 11)
+        )
+        self.key_choice.set(self.codec.name)
+        self.key_choice.bind('<<ComboboxSelected>>', self.on_key_type_select)
+        self.key_choice.pack(pady=6)
+    
+    # Metodo per la costruzione della legenda dei colori, una sola volta sotto l'area dell'array
+    def build_legend(self):
+        # Creazione della sezione legenda con design moderno e layout compatto
+        # Il riquadro è fisso sotto l'area dell'array e non viene ridisegnato a ogni fotogramma
+        legend_container = tk.Frame(self.root, bg=self.colors['bg'])
+        legend_container.pack(pady=15, after=self.array_frame)
+        
+        # Istanziazione del titolo per la sezione legenda
+        # Utilizzo di emoji Unicode per miglioramento dell'appeal visivo
+        legend_title = tk.Label(
+            legend_container,
+            text="🎨 LEGENDA COLORI",  # Titolo con emoji per identificazione immediata
+            font=('Segoe UI', 12, 'bold'),  # Font di dimensione media con peso bold
+            fg=self.colors['text'],  # Colore del testo per leggibilità
+            bg=self.colors['bg']  # Background trasparente per integrazione
+        )
+        # Posizionamento con padding inferiore per separazione dal contenuto
+        legend_title.pack(pady=(0, 5))
+        
+        # Creazione del frame contenitore per gli elementi della legenda
+        # Configurazione con background card per distinzione visiva
+        legend_frame = tk.Frame(legend_container, bg=self.colors['card'], relief='flat')
+        legend_frame.pack(padx=30, pady=3, ipady=8)
+        
+        # Definizione della struttura dati per gli elementi della legenda
+        # Array di tuple contenenti descrizione testuale e colore associato
+        legends = [
+            ("👆 Elemento centrale (mid)", self.colors['primary']),  # Elemento mediano nell'algoritmo
+            ("⚡ Area di ricerca attiva", self.colors['warning']),  # Intervallo di ricerca corrente
+            ("🎉 Elemento trovato!", self.colors['success']),  # Elemento target localizzato
+            ("💤 Elementi esclusi", self.colors['shadow'])  # Elementi fuori dall'intervallo
+        ]
+        
+        # Iterazione attraverso gli elementi della legenda per rendering individuale
+        # Utilizzo di enumerate per accesso sia all'indice che al contenuto
+        for i, (text, color) in enumerate(legends):
+            # Creazione del contenitore per ogni elemento della legenda
+            # Frame individuale per layout orizzontale degli elementi
+            legend_item = tk.Frame(legend_frame, bg=self.colors['card'])
+            legend_item.pack(side=tk.LEFT, padx=15)
+            
+            # Implementazione di un indicatore cromatico circolare
+            # Sostituzione del quadrato tradizionale con forma geometrica moderna
+            color_container = tk.Frame(legend_item, bg=color, width=18, height=18, relief='flat')
+            color_container.pack(side=tk.LEFT)
+            # Disabilitazione della propagazione per mantenere dimensioni fisse
+            color_container.pack_propagate(False)
+            
+            # Istanziazione del widget Label per il testo descrittivo
+            # Configurazione tipografica per leggibilità e coerenza stilistica
+            legend_text = tk.Label(
+                legend_item,
+                text=text,  # Testo descrittivo con emoji per identificazione rapida
+                font=('Segoe UI', 10, 'bold'),  # Font di dimensione media con peso bold
+                fg=self.colors['text'],  # Colore del testo per leggibilità
+                bg=self.colors['card']  # Background neutro per integrazione
+            )
+            # Posizionamento con padding sinistro per separazione dall'indicatore
+            legend_text.pack(side=tk.LEFT, padx=(6, 0))
+    
     # Metodo per l'aggiornamento dinamico della velocità di animazione
-    # Modifica il parametro temporale per la sincronizzazione delle transizioni visive
+    # Modifica il budget di tempo totale usato dalla riproduzione a durata fissa
     def update_speed(self, value):
         # Conversione del valore di input in numero a virgola mobile
-        # Aggiornamento della variabile di delay per controllo temporale
+        # Aggiornamento del budget in secondi per l'intera animazione
         self.delay = float(value)
     
+    # Metodo di callback per l'attivazione della riproduzione a budget di tempo
+    def on_budget_toggle(self):
+        self.budget_enabled = self.budget_var.get()
+    
+    # Metodo di callback per l'attivazione del pianificatore: se disattivato
+    # un array non ordinato viene sempre ordinato prima della ricerca
+    def on_planner_toggle(self):
+        self.planner_enabled = self.planner_var.get()
+    
+    # Metodo di callback per la scelta degli algoritmi di ricerca e ordinamento
+    def on_algorithm_select(self, event=None):
+        self.search_algorithm = self.search_choice.get()
+        self.sort_algorithm = self.sort_choice.get()
+    
+    # Metodo di callback per la scelta del tipo di chiave
+    # Le chiavi di tipo diverso non sono confrontabili, per cui si genera un nuovo array
+    def on_key_type_select(self, event=None):
+        if self.searching or self.sorting:
+            self.key_choice.set(self.codec.name)
+            return
+        self.codec = KEY_TYPES[self.key_choice.get()]
+        self.generate_array()
+    
+    # Metodo per la creazione del temporizzatore di un'animazione di ``steps`` passi
+    # Con il budget attivo il ritardo per passo deriva dalla durata totale scelta,
+    # altrimenti si usano i ritardi fissi calcolati in base alla dimensione dell'array
+    def make_playback(self, steps):
+        if self.budget_enabled:
+            return BudgetPlayback(self.delay, steps, meter=self.render_meter)
+        return FixedPlayback(meter=self.render_meter)
+    
+    # Metodo per l'invio di un fotogramma al thread dell'interfaccia dal worker
+    # Il fotogramma viene cronometrato per stimare il costo reale del rendering
+    def post_frame(self, render):
+        self.render_meter.post(self.root, render)
+    
     # Metodo per il calcolo adattivo del ritardo delle animazioni
     # Implementa una funzione di mapping inversamente proporzionale alla cardinalità dell'array
     def get_animation_delay(self):
@@ -442,9 +978,24 @@ class BinarySearchGUI:
         max_value = max(100, self.array_size * 2)
         # Utilizzo di random.sample per campionamento senza ripetizione
         # Genera una sequenza di elementi distinti nell'intervallo [1, max_value]
-        self.array = random.sample(range(1, max_value), self.array_size)
+        # memorizzata in un buffer tipizzato compatto invece che in una lista di interi Python
+        keys = random.sample(range(1, max_value), self.array_size)
+        if isinstance(self.codec, FloatCodec):
+            # Decimali con segno a due cifre, centrati sullo zero
+            keys = [(key - max_value // 2) / 4 for key in keys]
+        elif isinstance(self.codec, StrCodec):
+            # Codici di tre lettere maiuscole distinti
+            keys = [''.join(chr(65 + key // 26 ** p % 26) for p in (2, 1, 0))
+                    for key in random.sample(range(26 ** 3), self.array_size)]
+        # Le chiavi sono memorizzate come codici interi che ne preservano l'ordine
+        self.array = encode_keys(self.codec, keys)
         # Impostazione dell'invariante di ordinamento a falso
         self.is_sorted = False
+        # Il prefiltro dell'array precedente non è più valido
+        self.prefilter = None
+        self.publish_state()
+        # Nuova versione dei dati: il pianificatore riparte dal conteggio delle ricerche
+        self.planner.new_version()
         # Invocazione del metodo di rendering per aggiornamento visivo
         self.display_array()
         
@@ -467,9 +1018,311 @@ class BinarySearchGUI:
         # Riabilitazione del pulsante di ricerca con testo appropriato
         self.search_btn.config(state='normal', text="🚀 ESEGUI RICERCA")
         
+    # Metodo di lettura e validazione della chiave presente nel campo di input
+    # Restituisce il codice della chiave, oppure None dopo aver mostrato un messaggio di errore
+    def read_entry_value(self):
+        try:
+            return self.parse_keys(self.target_entry.get().strip())[0]
+        except (ValueError, IndexError):
+            self.show_key_error()
+            return None
+    
+    # Metodo di conversione del testo in codici di chiave del tipo selezionato
+    # Accetta uno o più valori separati da virgole o spazi
+    def parse_keys(self, text):
+        return [self.codec.encode(self.codec.parse(token)) for token in text.replace(',', ' ').split()]
+    
+    # Metodo per la segnalazione di una chiave non valida per il tipo selezionato
+    def show_key_error(self):
+        if isinstance(self.codec, IntCodec):
+            messagebox.showerror("Errore", "Inserisci un numero valido!")
+        else:
+            messagebox.showerror("Errore", f"Inserisci una chiave valida di tipo {self.codec.name}!")
+    
+    # Metodo per la rappresentazione testuale di un codice di chiave
+    def key_text(self, code):
+        return self.codec.format(code)
+    
+    # Metodo per l'inserimento incrementale di una chiave nell'array
+    # Se l'array è ordinato la chiave viene inserita nel blocco corretto senza riordinare
+    def insert_value(self):
+        # Controllo dei semafori per prevenire modifiche durante le animazioni
+        if self.searching or self.sorting:
+            return
+        value = self.read_entry_value()
+        if value is None:
+            return
+        # Controllo prima di ogni modifica, sui valori presenti: nessun buffer a 64 bit contiene
+        # chiavi oltre 2**64, né chiavi negative insieme a chiavi oltre 2**63 - 1
+        if not can_hold(self.array, value):
+            messagebox.showerror("Errore", f"Il numero {self.key_text(value)} non è rappresentabile "
+                                           f"insieme alle chiavi dell'array (interi a 64 bit)!")
+            return
+        if self.is_sorted:
+            # Inserimento sub-lineare: una nuova versione copia solo il blocco toccato
+            version, position = self.versions.add(value)
+            # Il prefiltro è pronto prima della pubblicazione: aggiungere la chiave al filtro
+            # condiviso non cambia le risposte sulla versione precedente, e se la chiave esce
+            # dall'intervallo del bitset il filtro viene ricostruito sulla nuova versione
+            if self.prefilter is not None and not self.prefilter.add(value):
+                self.prefilter = build_prefilter(version, self.prefilter_fp_rate)
+            self.array = version
+            self.publish_state()
+        else:
+            # Array non ordinato: l'elemento viene semplicemente accodato,
+            # ampliando il tipo del buffer se il valore non è rappresentabile
+            self.array = widen_for(self.array, value)
+            self.array.append(value)
+            position = len(self.array) - 1
+            # L'indice hash del pianificatore descrive il contenuto precedente
+            self.planner.changed()
+        self.array_size = len(self.array)
+        self.right = len(self.array) - 1
+        self.display_array(found_index=position)
+        self.step_label.config(text=f"➕ Inserito {self.key_text(value)} in posizione {position}! ✨")
+        self.explanation_label.config(
+            text="🧱 L'array è diviso in blocchi ordinati: l'inserimento tocca un solo blocco, senza riordinare tutto!"
+            if self.is_sorted else
+            "📥 L'array non è ancora ordinato: il nuovo elemento viene aggiunto in coda."
+        )
+        self.update_array_stats()
+    
+    # Metodo per la cancellazione incrementale di una chiave dall'array
+    # Rimuove una sola occorrenza mantenendo l'invariante di ordinamento
+    def delete_value(self):
+        # Controllo dei semafori per prevenire modifiche durante le animazioni
+        if self.searching or self.sorting:
+            return
+        value = self.read_entry_value()
+        if value is None:
+            return
+        if self.is_sorted:
+            removed = self.versions.discard(value)
+            self.array = self.versions.pin()
+            self.publish_state()
+            # Il bitset resta esatto solo azzerando il bit dell'ultima occorrenza; l'azzeramento
+            # segue la pubblicazione, così la versione precedente non viene mai scartata a torto
+            if removed and self.prefilter is not None and value not in self.array:
+                self.prefilter.discard(value)
+        else:
+            removed = value in self.array
+            if removed:
+                self.array.remove(value)
+                self.planner.changed()
+        if not removed:
+            messagebox.showinfo("Elemento assente", f"Il numero {self.key_text(value)} non è presente nell'array!")
+            return
+        self.array_size = len(self.array)
+        self.right = len(self.array) - 1
+        self.display_array()
+        self.step_label.config(text=f"➖ Rimosso {self.key_text(value)} dall'array! ✨")
+        self.update_array_stats()
+    
+    # Metodo per l'avvio della gara tra algoritmi di ricerca sullo stesso array
+    # Se l'array non è ordinato la gara usa una copia ordinata senza modificare lo stato
+    def start_race(self):
+        if self.searching or self.sorting:
+            return
+        value = self.read_entry_value()
+        if value is None:
+            return
+        data = make_array(self.array) if self.is_sorted else make_array(sorted(self.array))
+        # Con la riproduzione a budget la gara dura quanto il budget scelto
+        # Le finestre di gara sono importate al primo uso, non all'avvio
+        from race_mode import RaceWindow, DEFAULT_DURATION as RACE_DURATION
+        duration = self.delay if self.budget_enabled else RACE_DURATION
+        RaceWindow(self.root, data, value, self.colors, duration=duration, label=self.key_text)
+        self.step_label.config(text=f"🏁 Gara avviata: {len(SEARCHES)} algoritmi cercano il numero {self.key_text(value)}! ✨")
+    
+    # Metodo per l'avvio della ricerca a cascata su più array ordinati correlati
+    # Gli array sono sottoinsiemi casuali dell'array corrente, il primo è l'array intero
+    def start_cascade(self):
+        if self.searching or self.sorting:
+            return
+        value = self.read_entry_value()
+        if value is None:
+            return
+        keys = sorted(self.array)
+        arrays = [keys] + [sorted(random.sample(keys, min(len(keys), max(1, len(keys) * 3 // 5))))
+                           for _ in range(self.cascade_arrays - 1)]
+        cascade = FractionalCascade(arrays)
+        from race_mode import CascadeWindow, DEFAULT_DURATION as RACE_DURATION
+        duration = self.delay if self.budget_enabled else RACE_DURATION
+        window = CascadeWindow(self.root, cascade, value, self.colors, duration=duration, label=self.key_text)
+        self.step_label.config(
+            text=f"🪜 Cascata avviata: {self.key_text(value)} cercato in {len(cascade)} array ordinati! ✨")
+        self.explanation_label.config(
+            text=f"⚡ Una sola ricerca binaria, poi ogni array costa pochi passi: {window.probes} letture "
+                 f"invece di {independent_cost(arrays)} con {len(cascade)} ricerche indipendenti!")
+    
+    # Metodo per il salvataggio dell'array ordinato, del prefiltro e dell'indice appreso
+    # Se l'array non è ordinato si salva una copia ordinata con indici costruiti per l'occasione
+    def save_snapshot(self):
+        if self.searching or self.sorting:
+            return
+        path = filedialog.asksaveasfilename(
+            title="Salva istantanea", defaultextension=".bss",
+            filetypes=[("Istantanee", "*.bss"), ("Tutti i file", "*")])
+        if not path:
+            return
+        from snapshot import save_snapshot
+        if self.is_sorted:
+            keys, prefilter = self.array, self.prefilter
+            learned = model_for(keys)
+        else:
+            keys = make_array(sorted(self.array))
+            prefilter = build_prefilter(keys, self.prefilter_fp_rate) if self.prefilter_enabled else None
+            # Modello costruito a parte: la copia temporanea non sostituisce quello in cache
+            learned = LearnedIndex(keys)
+        try:
+            size = save_snapshot(path, keys, self.codec, prefilter, learned)
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Errore", f"Impossibile salvare l'istantanea: {error}")
+            return
+        self.step_label.config(text=f"💾 Istantanea salvata: {len(keys)} chiavi, {format_bytes(size)}! ✨")
+        self.explanation_label.config(
+            text="📦 Array ordinato, prefiltro e indice appreso sono scritti come buffer binari: "
+                 "al caricamento non serve riordinare né ricostruire nulla!")
+    
+    # Metodo di callback per la scelta dell'istantanea da caricare
+    def open_snapshot(self):
+        if self.searching or self.sorting:
+            return
+        path = filedialog.askopenfilename(
+            title="Carica istantanea", filetypes=[("Istantanee", "*.bss"), ("Tutti i file", "*")])
+        if path:
+            self.load_snapshot(path)
+    
+    # Metodo per il caricamento di un'istantanea: le chiavi e gli indici sono copiati
+    # dal file mappato in memoria nei buffer modificabili dell'interfaccia, senza ordinare
+    # e senza ricostruire prefiltro e modello
+    def load_snapshot(self, path):
+        from snapshot import Snapshot
+        start = time.perf_counter()
+        try:
+            with Snapshot(path) as snapshot:
+                self.array = self.versions.publish(array(snapshot.keys.format, snapshot.keys.tobytes()))
+                self.codec = snapshot.codec
+                self.prefilter = None
+                if snapshot.prefilter is not None and self.prefilter_enabled:
+                    self.prefilter = prefilter_from_state(snapshot.meta['prefilter'], bytearray(snapshot.prefilter.bits))
+                if snapshot.learned is not None:
+                    segments = tuple(array(buffer.format, buffer.tobytes()) for buffer in snapshot.learned.state())
+                    install(LearnedIndex(self.array, snapshot.learned.max_error, segments=segments))
+        except (OSError, ValueError, KeyError) as error:
+            # SnapshotError è un ValueError, come i metadati JSON non validi
+            messagebox.showerror("Errore", f"Impossibile caricare l'istantanea: {error}")
+            return
+        seconds = time.perf_counter() - start
+        if self.panels_built:
+            self.key_choice.set(self.codec.name)
+        self.is_sorted = True
+        self.publish_state()
+        self.array_size = len(self.array)
+        self.left, self.right, self.found = 0, len(self.array) - 1, False
+        # Dati nuovi per il pianificatore, già ordinati
+        self.planner.new_version()
+        self.display_array()
+        self.step_label.config(text=f"📂 Istantanea caricata in {seconds * 1000:.1f} ms: {len(self.array)} chiavi ordinate! ✨")
+        self.explanation_label.config(
+            text="⚡ Nessun ordinamento e nessuna costruzione: array, prefiltro e indice appreso arrivano già pronti dal file!")
+        self.update_array_stats()
+    
+    # Metodo per l'avvio e l'arresto del server locale delle ricerche
+    # Gli altri processi interrogano l'array ordinato corrente senza ricaricarlo
+    def toggle_server(self):
+        from query_server import QueryServer, DEFAULT_HOST, format_address
+        if self.server is not None:
+            self.server.stop()
+            summary = self.server.stats.describe()
+            self.server = None
+            self.server_btn.config(text="🔌 SERVER")
+            self.step_label.config(text="🔌 Server delle ricerche arrestato ✨")
+            self.explanation_label.config(text=f"📊 {summary}")
+            return
+        try:
+            self.server = QueryServer(self.served_dataset, (DEFAULT_HOST, self.server_port)).start()
+        except OSError as error:
+            self.server = None
+            messagebox.showerror("Errore", f"Impossibile avviare il server: {error}")
+            return
+        self.server_btn.config(text="⏹️ SERVER")
+        self.step_label.config(text=f"🔌 Server delle ricerche in ascolto su {format_address(self.server.address)}! ✨")
+        self.explanation_label.config(
+            text="📡 Altri processi possono cercare nell'array ordinato corrente (query_server.py query/bench): "
+                 "le richieste concorrenti sono unite in lotti e cercate in ordine.")
+    
+    # Metodo per i dati serviti dal server: l'array corrente, solo se ordinato
+    def served_dataset(self):
+        from query_server import Dataset
+        # Una sola lettura della terna pubblicata: versione, codifica e prefiltro coerenti
+        published = self.published
+        if published is None:
+            return None
+        return Dataset(*published)
+    
+    # Metodo per la pubblicazione dello stato ordinato ai thread esterni
+    # Va chiamato dopo ogni modifica di array, codifica o prefiltro
+    def publish_state(self):
+        data = self.array
+        self.published = (data, self.codec, self.prefilter) if isinstance(data, SortedVersion) else None
+    
+    # Metodo per l'aggiornamento delle statistiche di stato dell'array
+    def update_array_stats(self):
+        state = "ORDINATO ✅" if self.is_sorted else "NON ORDINATO ❌"
+        self.stats_label.config(
+            text=f"📊 Array di {len(self.array)} elementi ({itemsize_of(self.array)} B/elemento) | Stato: {state}"
+                 f"{self.prefilter_stats_text()} | Pronto per la ricerca! 🚀"
+        )
+    
+    # Metodo di callback per le modifiche alla configurazione del prefiltro
+    # Sincronizza i controlli con lo stato e ricostruisce il filtro se l'array è ordinato
+    def on_prefilter_change(self):
+        self.prefilter_enabled = self.prefilter_var.get()
+        try:
+            self.prefilter_fp_rate = float(self.fp_rate_spinbox.get()) / 100
+        except ValueError:
+            pass
+        if self.searching or self.sorting:
+            return
+        self.rebuild_prefilter()
+        self.publish_state()
+        self.update_array_stats()
+    
+    # Metodo per la costruzione del prefiltro sulle chiavi dell'array ordinato
+    def rebuild_prefilter(self):
+        if self.prefilter_enabled and self.is_sorted:
+            self.prefilter = build_prefilter(self.array, self.prefilter_fp_rate)
+        else:
+            self.prefilter = None
+    
+    # Metodo per la descrizione del prefiltro e del suo costo in memoria nelle statistiche
+    def prefilter_stats_text(self):
+        if self.prefilter is None:
+            return ""
+        return f" | 🛡️ {self.prefilter.describe()}: {format_bytes(self.prefilter.memory_bytes)}"
+    
+    # Metodo per la descrizione della decisione del pianificatore e del risparmio stimato
+    def planner_stats_text(self):
+        if self.plan is None:
+            return ""
+        return f" | 🧭 Piano: {self.plan.describe()}"
+    
+    # Metodo per la descrizione dell'indice appreso: segmenti, errore garantito, memoria e finestra media
+    def learned_index_stats_text(self):
+        model = model_for(self.array, build=False)
+        if model is None or self.search_algorithm != "Indice appreso":
+            return ""
+        return f" | 🧠 {model.describe()}: {format_bytes(model.memory_bytes)}"
+    
     # Metodo per il rendering visuale dell'array con evidenziazione parametrica degli elementi
     # Implementa algoritmi di visualizzazione adattiva con supporto per animazioni e highlighting
-    def display_array(self, highlight_left=-1, highlight_right=-1, highlight_mid=-1, found_index=-1, animate=False):
+    def display_array(self, highlight_left=-1, highlight_right=-1, highlight_mid=-1, found_index=-1, animate=False,
+                      data=None):
+        # I fotogrammi dei thread disegnano la versione fissata all'inizio del lavoro,
+        # non quella corrente al momento dell'esecuzione della callback
+        data = self.array if data is None else data
+        sorted_view = isinstance(data, SortedVersion)
         # Operazione di garbage collection per i widget esistenti nel frame dell'array
         # Rimozione completa di tutti i componenti figlio per prevenire memory leaks
         for widget in self.array_frame.winfo_children():
@@ -482,9 +1335,9 @@ class BinarySearchGUI:
         
         # Algoritmo di determinazione del colore del titolo basato sullo stato di ordinamento
         # Mappatura condizionale tra invariante di ordinamento e schema cromatico
-        title_bg_color = self.colors['success'] if self.is_sorted else self.colors['warning']
+        title_bg_color = self.colors['success'] if sorted_view else self.colors['warning']
         # Generazione del testo del titolo con indicatori visivi Unicode
-        title_text = "📊 ARRAY ORDINATO 📊" if self.is_sorted else "📊 ARRAY NON ORDINATO 📊"
+        title_text = "📊 ARRAY ORDINATO 📊" if sorted_view else "📊 ARRAY NON ORDINATO 📊"
         
         # Creazione del contenitore per il titolo con styling avanzato
         # Configurazione del relief per effetto piatto moderno
@@ -533,9 +1386,12 @@ class BinarySearchGUI:
         arrows_frame = tk.Frame(main_array_frame, bg=self.colors['card'])
         arrows_frame.pack(pady=(0, 5))
         
+        # Vista senza copia sul buffer tipizzato: il rendering legge direttamente i dati
+        values = as_view(data)
+        
         # Iterazione attraverso gli elementi dell'array per rendering individuale
         # Implementazione del pattern Iterator per processamento sequenziale
-        for i, value in enumerate(self.array):
+        for i, value in enumerate(values):
             # Algoritmo di determinazione dello schema cromatico per ogni elemento
             # Inizializzazione con valori di default per elementi neutri
             color = self.colors['card']  # Colore di background di default
@@ -568,7 +1424,7 @@ class BinarySearchGUI:
             
             # Algoritmo di calcolo delle dimensioni responsive per elementi dell'array
             # Determinazione della cardinalità dell'array per scaling adattivo
-            array_size = len(self.array)
+            array_size = len(data)
             
             # Implementazione di una funzione a tratti per dimensionamento ottimale
             # Mappatura tra cardinalità dell'array e parametri di visualizzazione
@@ -631,7 +1487,7 @@ class BinarySearchGUI:
             # Configurazione con parametri di styling dinamici calcolati precedentemente
             element = tk.Label(
                 element_container,
-                text=str(value),  # Conversione del valore numerico a rappresentazione stringa
+                text=self.key_text(value),  # Conversione del codice nella rappresentazione della chiave
                 font=('Segoe UI', font_size, 'bold'),  # Font system-native con peso bold
                 bg=color,  # Background color determinato dall'algoritmo di stato
                 fg=text_color,  # Foreground color per contrasto ottimale
@@ -685,63 +1541,9 @@ class BinarySearchGUI:
                 # Invocazione del metodo di animazione per feedback visivo dinamico
                 self.animate_element_pulse(element)
         
-        # Creazione della sezione legenda con design moderno e layout compatto
-        # Implementazione di un sistema di documentazione visiva per l'utente
-        legend_container = tk.Frame(container, bg=self.colors['bg'])
-        legend_container.pack(pady=15)
-        
-        # Istanziazione del titolo per la sezione legenda
-        # Utilizzo di emoji Unicode per miglioramento dell'appeal visivo
-        legend_title = tk.Label(
-            legend_container,
-            text="🎨 LEGENDA COLORI",  # Titolo con emoji per identificazione immediata
-            font=('Segoe UI', 12, 'bold'),  # Font di dimensione media con peso bold
-            fg=self.colors['text'],  # Colore del testo per leggibilità
-            bg=self.colors['bg']  # Background trasparente per integrazione
-        )
-        # Posizionamento con padding inferiore per separazione dal contenuto
-        legend_title.pack(pady=(0, 5))
-        
-        # Creazione del frame contenitore per gli elementi della legenda
-        # Configurazione con background card per distinzione visiva
-        legend_frame = tk.Frame(legend_container, bg=self.colors['card'], relief='flat')
-        legend_frame.pack(padx=30, pady=3, ipady=8)
-        
-        # Definizione della struttura dati per gli elementi della legenda
-        # Array di tuple contenenti descrizione testuale e colore associato
-        legends = [
-            ("👆 Elemento centrale (mid)", self.colors['primary']),  # Elemento mediano nell'algoritmo
-            ("⚡ Area di ricerca attiva", self.colors['warning']),  # Intervallo di ricerca corrente
-            ("🎉 Elemento trovato!", self.colors['success']),  # Elemento target localizzato
-            ("💤 Elementi esclusi", self.colors['shadow'])  # Elementi fuori dall'intervallo
-        ]
-        
-        # Iterazione attraverso gli elementi della legenda per rendering individuale
-        # Utilizzo di enumerate per accesso sia all'indice che al contenuto
-        for i, (text, color) in enumerate(legends):
-            # Creazione del contenitore per ogni elemento della legenda
-            # Frame individuale per layout orizzontale degli elementi
-            legend_item = tk.Frame(legend_frame, bg=self.colors['card'])
-            legend_item.pack(side=tk.LEFT, padx=15)
-            
-            # Implementazione di un indicatore cromatico circolare
-            # Sostituzione del quadrato tradizionale con forma geometrica moderna
-            color_container = tk.Frame(legend_item, bg=color, width=18, height=18, relief='flat')
-            color_container.pack(side=tk.LEFT)
-            # Disabilitazione della propagazione per mantenere dimensioni fisse
-            color_container.pack_propagate(False)
-            
-            # Istanziazione del widget Label per il testo descrittivo
-            # Configurazione tipografica per leggibilità e coerenza stilistica
-            legend_text = tk.Label(
-                legend_item,
-                text=text,  # Testo descrittivo con emoji per identificazione rapida
-                font=('Segoe UI', 10, 'bold'),  # Font di dimensione media con peso bold
-                fg=self.colors['text'],  # Colore del testo per leggibilità
-                bg=self.colors['card']  # Background neutro per integrazione
-            )
-            # Posizionamento con padding sinistro per separazione dall'indicatore
-            legend_text.pack(side=tk.LEFT, padx=(6, 0))
+        # Rilascio della vista per consentire successivi ridimensionamenti del buffer
+        if isinstance(values, memoryview):
+            values.release()
     
     # Metodo per l'inizializzazione del processo di ricerca binaria
     # Implementa validazione dell'input e gestione automatica dell'ordinamento
@@ -752,20 +1554,42 @@ class BinarySearchGUI:
             return
         
         # Blocco di gestione delle eccezioni per validazione dell'input utente
-        # Tentativo di conversione del valore target da stringa a intero
+        # Il campo accetta una singola chiave oppure un lotto separato da virgole o spazi
+        # e ogni chiave viene convertita nel codice che ne preserva l'ordine
         try:
-            self.target = int(self.target_entry.get())
+            values = self.parse_keys(self.target_entry.get())
         except ValueError:
+            values = []
+        if not values:
             # Gestione dell'errore di conversione con messagebox informativo
             # Utilizzo di messagebox.showerror per feedback immediato all'utente
-            messagebox.showerror("Errore", "Inserisci un numero valido!")
+            self.show_key_error()
             return
+        # Più valori attivano la modalità a lotti con finger search
+        self.batch_targets = values if len(values) > 1 else None
+        self.target = values[0]
+        
+        # Su un array non ordinato il pianificatore confronta il costo ammortizzato
+        # di scansione, insieme hash e ordinamento sulle ricerche attese
+        self.plan = None
+        if not self.is_sorted and self.planner_enabled:
+            self.plan = self.planner.plan(self.array, len(values))
+            if self.plan.strategy != SORT_THEN_SEARCH:
+                self.searching = True
+                self.search_btn.config(state='disabled', text="🔍 RICERCA IN CORSO...")
+                self.reset_btn.config(state='disabled')
+                thread = threading.Thread(target=self.planned_search)
+                thread.daemon = True
+                thread.start()
+                return
+        self.planner.record(len(values))
         
         # Verifica dell'invariante di ordinamento dell'array
         # Attivazione automatica dell'ordinamento se necessario per la ricerca binaria
         if not self.is_sorted:
             # Aggiornamento del messaggio di stato per informare l'utente
-            self.step_label.config(text="🔄 L'array non è ordinato. Ordino automaticamente prima della ricerca...")
+            plan = f" 🧭 {self.plan.describe()}:" if self.plan else ""
+            self.step_label.config(text=f"🔄 L'array non è ordinato.{plan} Ordino automaticamente prima della ricerca...")
             # Attivazione del semaforo di ordinamento per controllo del flusso
             self.sorting = True
             # Disabilitazione del pulsante di ricerca con aggiornamento del testo
@@ -784,95 +1608,244 @@ class BinarySearchGUI:
         self.reset_btn.config(state='disabled')
         
         # Avvia ricerca in thread separato
-        thread = threading.Thread(target=self.binary_search_animated)
+        thread = threading.Thread(target=self.run_search)
         thread.daemon = True
         thread.start()
     
     def auto_sort_and_search(self):
         # Prima ordina
-        self.counting_sort_animated()
+        self.sort_animated()
         # Poi avvia la ricerca
         self.searching = True
         self.sorting = False
         self.search_btn.config(state='disabled', text="🔍 RICERCA IN CORSO...")
-        self.binary_search_animated()
+        self.run_search()
     
-    def binary_search_animated(self):
-        self.left = 0
-        self.right = len(self.array) - 1
-        steps = 0
+    def run_search(self):
+        """Sceglie tra ricerca singola animata e ricerca a lotti"""
+        if self.batch_targets:
+            self.batch_search_animated()
+        else:
+            self.search_animated()
+    
+    def planned_search(self):
+        """Ricerca senza ordinamento secondo il piano: scansione animata oppure insieme hash"""
+        plan = self.plan
+        if plan.strategy == LINEAR_SCAN and not self.batch_targets:
+            self.planner.record()
+            self.search_animated(get_algorithm("Ricerca lineare"))
+            return
+        targets = self.batch_targets or [self.target]
+        data = self.array
+        start = time.perf_counter()
+        results = self.planner.lookup(plan.strategy, data, targets)
+        seconds = time.perf_counter() - start
+        found = [(t, i) for t, i in zip(targets, results) if i != -1]
+        
+        last_found = found[-1][1] if found else -1
+        self.post_frame(lambda: self.display_array(found_index=last_found, animate=last_found != -1, data=data))
+        self.root.after(0, lambda: self.step_label.config(
+            text=f"🧭 {plan.strategy}: trovati {len(found)} numeri su {len(targets)} senza ordinare l'array! ✨"
+        ))
+        summary = ", ".join(f"{self.key_text(t)}→[{i}]" if i != -1 else f"{self.key_text(t)}→❌"
+                            for t, i in zip(targets, results))
+        self.root.after(0, lambda: self.explanation_label.config(text=f"📋 Risultati: {summary}"))
+        self.root.after(0, lambda: self.stats_label.config(
+            text=f"📊 Ricerche: {len(targets)} | Tempo: {seconds * 1e6:.2f} µs{self.planner_stats_text()} 🚀"
+        ))
         
+        # Riabilita pulsanti
+        self.searching = False
+        self.root.after(0, lambda: self.search_btn.config(state='normal', text="🚀 ESEGUI RICERCA"))
+        self.root.after(0, lambda: self.reset_btn.config(state='normal'))
+    
+    def batch_search_animated(self):
+        """Ricerca a lotti: riusa la risposta precedente come dito e galoppa in avanti"""
+        targets = self.batch_targets
+        data = self.array
         self.root.after(0, lambda: self.step_label.config(
-            text=f"🎯 Cerco il numero {self.target} nell'array ordinato ✨"
+            text=f"🎯 Ricerca a lotti di {len(targets)} numeri nell'array ordinato ✨"
         ))
         self.root.after(0, lambda: self.explanation_label.config(
-            text=f"🚀 Iniziamo con l'intero array! Left=0, Right={len(self.array)-1}. Andiamo a trovare il nostro numero!"
+            text="🏃 I numeri vengono cercati in ordine crescente: ogni risposta diventa il punto di partenza "
+                 "della ricerca successiva, che galoppa in avanti invece di ripartire da capo!"
         ))
-        
         time.sleep(self.get_sort_animation_delay())
         
-        while self.left <= self.right:
-            steps += 1
-            self.mid = (self.left + self.right) // 2
+        # I target scartati dal prefiltro non partecipano alla finger search
+        if self.prefilter is not None:
+            candidates = [t for t in targets if self.prefilter.might_contain(t)]
+        else:
+            candidates = targets
+        answers, comparisons = search_sorted_batch(data, candidates)
+        positions = dict(zip(candidates, answers))
+        results = [positions.get(t, -1) for t in targets]
+        found = [(t, i) for t, i in zip(targets, results) if i != -1]
+        baseline = independent_search_cost(len(data), len(targets))
+        
+        last_found = found[-1][1] if found else -1
+        self.post_frame(lambda: self.display_array(found_index=last_found, animate=last_found != -1, data=data))
+        self.root.after(0, lambda: self.step_label.config(
+            text=f"🎉 Ricerca a lotti completata: trovati {len(found)} numeri su {len(targets)}! ✨"
+        ))
+        summary = ", ".join(f"{self.key_text(t)}→[{i}]" if i != -1 else f"{self.key_text(t)}→❌"
+                            for t, i in zip(targets, results))
+        self.root.after(0, lambda: self.explanation_label.config(text=f"📋 Risultati: {summary}"))
+        self.root.after(0, lambda: self.stats_label.config(
+            text=f"📊 Confronti: {comparisons} | Ricerche indipendenti: ~{baseline} | "
+                 f"Scartati dal prefiltro: {len(targets) - len(candidates)}{self.prefilter_stats_text()} 🚀"
+        ))
+        
+        # Riabilita pulsanti
+        self.searching = False
+        self.root.after(0, lambda: self.search_btn.config(state='normal', text="🚀 ESEGUI RICERCA"))
+        self.root.after(0, lambda: self.reset_btn.config(state='normal'))
+    
+    def play_events(self, algorithm, target=None):
+        """Riproduce gli eventi di un algoritmo registrato; restituisce (risultato, passi, contatori)"""
+        searching = algorithm.kind == SEARCH
+        # Temporizzatore dell'animazione: ritardi fissi oppure budget di tempo totale
+        data = self.array
+        playback = self.make_playback(algorithm.steps(len(data)))
+        frame_delay = self.get_animation_delay() if searching else self.get_sort_animation_delay() * 0.5
+        events = algorithm.run(data, target, label=self.key_text)
+        counts = OperationCounts()
+        steps = 0
+        while True:
+            try:
+                event = next(events)
+            except StopIteration as stop:
+                return stop.value, steps, counts
+            counts.record(event)
             
-            # Aggiorna display con animazione
-            self.root.after(0, lambda: self.display_array(
-                highlight_left=self.left,
-                highlight_right=self.right,
-                highlight_mid=self.mid,
-                animate=True
-            ))
+            # Scansioni e allocazioni aggiornano solo i contatori
+            if event.kind in (SCAN, ALLOC):
+                continue
+            # I cambi di fase vengono sempre mostrati
+            if event.kind == PHASE:
+                playback.step(force=True)
+                self.show_event_text(event)
+                playback.pace(self.get_sort_animation_delay())
+                continue
+            if event.kind == PROBE or not searching:
+                steps += 1
             
-            self.root.after(0, lambda s=steps: self.step_label.config(
-                text=f"📍 Passo {s}: Controllo elemento centrale [indice {self.mid}] = {self.array[self.mid]} ✨"
+            # In modalità turbo i passi intermedi vengono eseguiti senza disegnarli
+            if playback.step():
+                # Nelle ricerche il confronto aggiorna solo la spiegazione del passo
+                if not (searching and event.kind == COMPARE):
+                    self.post_frame(lambda e=event: self.render_event(e, searching, data))
+                self.show_event_text(event)
+                # Contatori dal vivo: il testo viene composto subito, i valori cambiano ad ogni evento
+                text = f"📊 Passi: {steps} | {self.counters_text(counts)}"
+                if searching and event.kind == PROBE:
+                    text += f" | Elementi rimanenti: {event.right - event.left + 1}"
+                self.root.after(0, lambda t=text: self.stats_label.config(text=f"{t}{self.prefilter_stats_text()} 🚀"))
+            playback.pace(frame_delay)
+    
+    def counters_text(self, counts, seconds=None):
+        """Descrizione dei contatori di operazioni, con il throughput se misurato.
+
+        ``seconds`` deve essere il tempo dell'esecuzione con eventi (quella contata),
+        non quello del nucleo veloce, che svolge un lavoro diverso.
+        """
+        text = (f"Confronti: {counts.comparisons} | Letture: {counts.reads} | Scritture: {counts.writes} | "
+                f"Memoria aux: {format_bytes(counts.aux_bytes)}")
+        if seconds:
+            text += f" | ⚡ {counts.operations / seconds / 1e6:.2f} Mop/s senza animazione"
+        return text
+    
+    def record_run(self, algorithm, counts, seconds):
+        """Memorizza i contatori di un'esecuzione e restituisce il suo numero progressivo"""
+        self.run_history.append({
+            'algorithm': algorithm.name,
+            'size': len(self.array),
+            'seconds': seconds,
+            **counts.as_dict(),
+        })
+        return len(self.run_history)
+    
+    def show_event_text(self, event):
+        """Mostra le descrizioni facoltative di un evento nelle etichette informative"""
+        if event.text:
+            self.root.after(0, lambda: self.step_label.config(text=event.text))
+        if event.note:
+            self.root.after(0, lambda: self.explanation_label.config(text=event.note))
+    
+    def render_event(self, event, searching, data=None):
+        """Disegna il fotogramma corrispondente a un evento di passo sulla versione ``data``"""
+        if searching:
+            self.display_array(
+                highlight_left=event.left,
+                highlight_right=event.right,
+                highlight_mid=event.index,
+                animate=True,
+                data=data
+            )
+        elif event.kind in (PROBE, COMPARE):
+            self.display_array_with_highlight(event.index, "counting")
+        else:
+            self.display_array_with_highlight(event.index, "building")
+    
+    def search_animated(self, algorithm=None):
+        """Ricerca animata con l'algoritmo scelto nel registro (o con quello indicato dal piano)"""
+        algorithm = algorithm or get_algorithm(self.search_algorithm)
+        # Versione fissata per tutta la ricerca: fotogrammi e misura leggono gli stessi dati
+        data = self.array
+        self.left = 0
+        self.right = len(data) - 1
+        
+        # Il prefiltro scarta in O(1) i target sicuramente assenti, senza percorrere log n passi
+        if self.prefilter is not None and not self.prefilter.might_contain(self.target):
+            self.found = False
+            self.post_frame(lambda: self.display_array(animate=False, data=data))
+            self.root.after(0, lambda: self.step_label.config(
+                text=f"🛡️ Il numero {self.key_text(self.target)} non è presente nell'array (scartato dal prefiltro in 0 passi) ❌"
             ))
-            
-            if self.array[self.mid] == self.target:
-                # Trovato con animazione speciale!
-                time.sleep(self.get_sort_animation_delay() * 0.5)
-                self.root.after(0, lambda: self.display_array(found_index=self.mid, animate=True))
-                self.root.after(0, lambda s=steps: self.step_label.config(
-                    text=f"🎉✨ TROVATO! ✨🎉 Il numero {self.target} è all'indice {self.mid} dopo {s} passi!"
-                ))
-                self.root.after(0, lambda: self.explanation_label.config(
-                    text=f"🎊 Fantastico! L'elemento centrale {self.array[self.mid]} è esattamente quello che cercavamo! Missione compiuta! 🎊"
-                ))
-                # Animazione di celebrazione
-                self.root.after(0, self.celebrate_found)
-                self.found = True
-                break
-                
-            elif self.array[self.mid] < self.target:
-                # Cerca nella metà destra
-                self.root.after(0, lambda s=steps: self.explanation_label.config(
-                    text=f"🔍 Il valore centrale {self.array[self.mid]} è minore di {self.target}. Elimino la metà sinistra e cerco a destra! ➡️"
-                ))
-                time.sleep(self.get_animation_delay())
-                self.left = self.mid + 1
-                
-            else:
-                # Cerca nella metà sinistra
-                self.root.after(0, lambda s=steps: self.explanation_label.config(
-                    text=f"🔍 Il valore centrale {self.array[self.mid]} è maggiore di {self.target}. Elimino la metà destra e cerco a sinistra! ⬅️"
-                ))
-                time.sleep(self.get_animation_delay())
-                self.right = self.mid - 1
-            
-            self.root.after(0, lambda s=steps: self.stats_label.config(
-                text=f"📊 Passi: {s} | Complessità: O(log n) | Elementi rimanenti: {max(0, self.right - self.left + 1)} | Efficienza: Massima! 🚀"
+            self.root.after(0, lambda: self.explanation_label.config(
+                text=f"⚡ Il prefiltro ({self.prefilter.kind}) garantisce che il numero non è presente: "
+                     f"la ricerca non è nemmeno necessaria!"
             ))
-            
-            time.sleep(self.get_animation_delay())
+            self.root.after(0, lambda: self.stats_label.config(
+                text=f"📊 Passi: 0 | Confronti: 0 | Letture: 0{self.prefilter_stats_text()} 🚀"
+            ))
+            self.searching = False
+            self.root.after(0, lambda: self.search_btn.config(state='normal', text="🚀 ESEGUI RICERCA"))
+            self.root.after(0, lambda: self.reset_btn.config(state='normal'))
+            return
         
-        if not self.found:
+        index, steps, counts = self.play_events(algorithm, self.target)
+        self.found = index != -1
+        
+        if self.found:
+            # Trovato con animazione speciale!
+            self.mid = index
+            self.post_frame(lambda: self.display_array(found_index=index, animate=True, data=data))
+            self.root.after(0, lambda: self.step_label.config(
+                text=f"🎉✨ TROVATO! ✨🎉 Il numero {self.key_text(self.target)} è all'indice {index} dopo {steps} passi!"
+            ))
+            # Animazione di celebrazione
+            self.root.after(0, self.celebrate_found)
+        else:
             # Non trovato
-            self.root.after(0, lambda s=steps: self.step_label.config(
-                text=f"❌ Il numero {self.target} non è presente nell'array (dopo {s} passi) ❌"
+            self.root.after(0, lambda: self.step_label.config(
+                text=f"❌ Il numero {self.key_text(self.target)} non è presente nell'array (dopo {steps} passi) ❌"
             ))
             self.root.after(0, lambda: self.explanation_label.config(
                 text="🔍 La ricerca è terminata senza trovare l'elemento. L'area di ricerca si è ridotta a zero. Prova con un altro numero!"
             ))
-            self.root.after(0, lambda: self.display_array(animate=False))
+            self.post_frame(lambda: self.display_array(animate=False, data=data))
+        
+        # Tempo del nucleo non animato: insieme ai contatori dà il throughput misurato
+        seconds = benchmark(algorithm, data, self.target)
+        # Il throughput usa il tempo della stessa implementazione di cui si contano le operazioni
+        counted = benchmark(algorithm, data, self.target, counted=True)
+        run = self.record_run(algorithm, counts, seconds)
+        self.root.after(0, lambda: self.stats_label.config(
+            text=f"📊 Esecuzione #{run} ({algorithm.name}) | Passi: {steps} | {self.counters_text(counts, counted)} | "
+                 f"Nucleo headless: {seconds * 1e6:.2f} µs{self.prefilter_stats_text()}{self.learned_index_stats_text()}"
+                 f"{self.planner_stats_text()} 🚀"
+        ))
         
         # Riabilita pulsanti
         self.searching = False
@@ -881,36 +1854,36 @@ class BinarySearchGUI:
     
     def animate_element_pulse(self, element):
         """Animazione di pulsazione per gli elementi evidenziati"""
-        def pulse(step=0):
-            if step < 6:  # 3 pulsazioni complete
+        def pulse():
+            for step in range(6):  # 3 pulsazioni complete
                 if step % 2 == 0:
                     # Ingrandisci
                     element.config(font=('Segoe UI', 18, 'bold'))
                 else:
                     # Riduci
                     element.config(font=('Segoe UI', 16, 'bold'))
-                self.root.after(200, lambda: pulse(step + 1))
-        pulse()
+                yield
+        self.clock.start(pulse(), every=2)
     
     def celebrate_found(self):
         """Animazione di celebrazione quando l'elemento è trovato"""
-        def flash_colors(step=0):
-            if step < 8:  # 4 flash completi
-                colors = [self.colors['success'], self.colors['accent'], 
-                         self.colors['primary'], self.colors['secondary']]
-                color = colors[step % len(colors)]
-                
-                # Cambia colore del frame info
-                self.info_frame.config(bg=color)
-                self.step_label.config(bg=color, fg='white')
-                
-                self.root.after(300, lambda: flash_colors(step + 1))
-            else:
-                # Ripristina colori originali
+        def flash_colors():
+            colors = [self.colors['success'], self.colors['accent'], 
+                     self.colors['primary'], self.colors['secondary']]
+            try:
+                for step in range(8):  # 4 flash completi
+                    color = colors[step % len(colors)]
+                    
+                    # Cambia colore del frame info
+                    self.info_frame.config(bg=color)
+                    self.step_label.config(bg=color, fg='white')
+                    yield
+            finally:
+                # Ripristina colori originali, anche se l'effetto viene sostituito
                 self.info_frame.config(bg=self.colors['card'])
                 self.step_label.config(bg=self.colors['card'], fg=self.colors['primary'])
         
-        flash_colors()
+        self.clock.start(flash_colors(), every=3, key='celebration')
     
     def animate_button_hover(self, button, enter=True):
         """Animazione hover per i pulsanti"""
@@ -926,24 +1899,41 @@ class BinarySearchGUI:
         
         self.reset_btn.bind('<Enter>', lambda e: self.animate_button_hover(self.reset_btn, True))
         self.reset_btn.bind('<Leave>', lambda e: self.animate_button_hover(self.reset_btn, False))
+        
+        self.insert_btn.bind('<Enter>', lambda e: self.animate_button_hover(self.insert_btn, True))
+        self.insert_btn.bind('<Leave>', lambda e: self.animate_button_hover(self.insert_btn, False))
+        
+        self.delete_btn.bind('<Enter>', lambda e: self.animate_button_hover(self.delete_btn, True))
+        self.delete_btn.bind('<Leave>', lambda e: self.animate_button_hover(self.delete_btn, False))
+        
+        self.race_btn.bind('<Enter>', lambda e: self.animate_button_hover(self.race_btn, True))
+        self.race_btn.bind('<Leave>', lambda e: self.animate_button_hover(self.race_btn, False))
+        
+        self.cascade_btn.bind('<Enter>', lambda e: self.animate_button_hover(self.cascade_btn, True))
+        self.cascade_btn.bind('<Leave>', lambda e: self.animate_button_hover(self.cascade_btn, False))
+        
+        self.save_btn.bind('<Enter>', lambda e: self.animate_button_hover(self.save_btn, True))
+        self.save_btn.bind('<Leave>', lambda e: self.animate_button_hover(self.save_btn, False))
+        
+        self.load_btn.bind('<Enter>', lambda e: self.animate_button_hover(self.load_btn, True))
+        self.load_btn.bind('<Leave>', lambda e: self.animate_button_hover(self.load_btn, False))
+        
+        self.server_btn.bind('<Enter>', lambda e: self.animate_button_hover(self.server_btn, True))
+        self.server_btn.bind('<Leave>', lambda e: self.animate_button_hover(self.server_btn, False))
 
     def animate_title(self):
-        """Animazione continua per il titolo"""
+        """Animazione continua per il titolo, sospesa a riposo dall'orologio"""
         def pulse_title():
-            current_font = self.root.nametowidget(self.root.winfo_children()[0].winfo_children()[0]).cget('font')
-            if 'bold' in str(current_font):
-                # Cambia colore gradualmente
-                colors = [self.colors['primary'], self.colors['secondary'], 
-                         self.colors['success'], self.colors['warning']]
-                color_index = (self.animation_step // 20) % len(colors)
-                
-                title_widget = self.root.nametowidget(self.root.winfo_children()[0].winfo_children()[0])
-                title_widget.config(fg=colors[color_index])
-                
+            # Cambia colore gradualmente
+            colors = [self.colors['primary'], self.colors['secondary'], 
+                     self.colors['success'], self.colors['warning']]
+            while True:
+                self.title_label.config(fg=colors[self.animation_step % len(colors)])
                 self.animation_step += 1
-                self.root.after(100, pulse_title)
+                yield
         
-        pulse_title()
+        # Un cambio di colore ogni 2 secondi: l'orologio dorme tra un cambio e l'altro
+        self.clock.start(pulse_title(), every=20, ambient=True, key='title')
     
     def start_counting_sort(self):
         """Avvia l'algoritmo di counting sort con animazioni"""
@@ -957,102 +1947,55 @@ class BinarySearchGUI:
         self.sorting = True
         self.search_btn.config(state='disabled')
         self.reset_btn.config(state='disabled')
-        self.sort_btn.config(state='disabled', text="🎯 ORDINAMENTO...")
         
         # Avvia counting sort in thread separato
-        thread = threading.Thread(target=self.counting_sort_animated)
+        thread = threading.Thread(target=self.sort_animated)
         thread.daemon = True
         thread.start()
     
-    def counting_sort_animated(self):
-        """Implementazione animata del counting sort"""
-        self.root.after(0, lambda: self.step_label.config(
-            text="🎯 Iniziamo il COUNTING SORT! Preparati per uno spettacolo incredibile! ✨"
-        ))
-        self.root.after(0, lambda: self.explanation_label.config(
-            text="🚀 Il Counting Sort conta le occorrenze di ogni elemento e poi li ricostruisce in ordine!"
-        ))
-        
-        time.sleep(self.get_sort_animation_delay())
-        
-        # Fase 1: Trova il valore massimo
-        max_val = max(self.array)
-        self.root.after(0, lambda: self.step_label.config(
-            text=f"📊 Fase 1: Trovato valore massimo = {max_val}! Creiamo l'array di conteggio..."
-        ))
-        self.root.after(0, lambda: self.explanation_label.config(
-            text=f"🔍 Abbiamo bisogno di un array di conteggio di dimensione {max_val + 1} per contare ogni numero!"
-        ))
-        
-        time.sleep(self.get_sort_animation_delay())
-        
-        # Fase 2: Crea array di conteggio
-        count = [0] * (max_val + 1)
-        
-        self.root.after(0, lambda: self.step_label.config(
-            text="📈 Fase 2: Contiamo le occorrenze di ogni elemento! Guarda la magia! ✨"
-        ))
-        
-        # Conta ogni elemento con animazione
-        for i, num in enumerate(self.array):
-            count[num] += 1
-            
-            # Evidenzia l'elemento corrente
-            self.root.after(0, lambda idx=i: self.display_array_with_highlight(idx, "counting"))
-            
-            self.root.after(0, lambda n=num, c=count[num]: self.step_label.config(
-                text=f"🎯 Elemento {n} trovato! Conteggio aggiornato: {c} occorrenze"
-            ))
-            self.root.after(0, lambda n=num: self.explanation_label.config(
-                text=f"📊 Incrementiamo il contatore per il numero {n}. Ogni numero ha il suo 'cassetto' nell'array di conteggio!"
+    def sort_animated(self):
+        """Ordinamento animato con l'algoritmo scelto nel registro"""
+        algorithm = get_algorithm(self.sort_algorithm)
+        # Chiavi fuori dai limiti dell'algoritmo scelto (ad esempio i codici dei float
+        # per il counting sort): si passa al radix sort, anch'esso senza confronti
+        if not algorithm.accepts(self.array):
+            algorithm = get_algorithm("Radix sort")
+            self.root.after(0, lambda: self.explanation_label.config(
+                text=f"📏 Intervallo delle chiavi troppo ampio per il {self.sort_algorithm}: uso il Radix sort!"
             ))
-            
-            time.sleep(self.get_sort_animation_delay() * 0.7)
-        
-        time.sleep(self.get_sort_animation_delay())
-        
-        # Fase 3: Ricostruisci l'array ordinato
-        self.root.after(0, lambda: self.step_label.config(
-            text="🎨 Fase 3: Ricostruiamo l'array ordinato! Ecco dove avviene la magia! ✨"
-        ))
-        self.root.after(0, lambda: self.explanation_label.config(
-            text="🚀 Ora ricostruiamo l'array in ordine, usando i conteggi per sapere quante volte inserire ogni numero!"
-        ))
-        
-        time.sleep(self.get_sort_animation_delay())
-        
-        sorted_array = []
-        for num in range(len(count)):
-            for _ in range(count[num]):
-                sorted_array.append(num)
-                
-                # Mostra la ricostruzione progressiva
-                self.array = sorted_array + self.array[len(sorted_array):]
-                self.root.after(0, lambda idx=len(sorted_array)-1: self.display_array_with_highlight(idx, "building"))
-                
-                self.root.after(0, lambda n=num, pos=len(sorted_array): self.step_label.config(
-                    text=f"🎯 Inserito {n} in posizione {pos-1}! Array in costruzione..."
-                ))
-                self.root.after(0, lambda: self.explanation_label.config(
-                    text="🔧 Stiamo ricostruendo l'array elemento per elemento, in ordine crescente perfetto!"
-                ))
-                
-                time.sleep(self.get_sort_animation_delay() * 0.5)
-        
-        # Finalizza
-        self.array = sorted_array
+        # Copia dei dati originali per la misura del nucleo non animato
+        original = make_array(self.array)
+        # Buffer di lavoro preallocato: l'algoritmo ordina sul posto,
+        # senza concatenare liste ad ogni passo
+        self.array = make_array(self.array)
+        _, _, counts = self.play_events(algorithm)
+        
+        # Finalizza: l'array ordinato viene pubblicato come versione a blocchi per gli aggiornamenti incrementali
+        self.array = self.versions.publish(self.array)
         self.is_sorted = True
+        # Costruzione del prefiltro per lo scarto immediato dei target assenti
+        self.rebuild_prefilter()
+        self.publish_state()
+        # Il modello dell'indice appreso si costruisce una volta qui, non alla prima ricerca
+        if self.search_algorithm == "Indice appreso":
+            model_for(self.array)
+        seconds = benchmark(algorithm, original)
+        counted = benchmark(algorithm, original, counted=True)
+        run = self.record_run(algorithm, counts, seconds)
         
         # Animazione finale spettacolare
-        self.root.after(0, lambda: self.display_array())
+        data = self.array
+        self.post_frame(lambda: self.display_array(data=data))
         self.root.after(0, lambda: self.step_label.config(
-            text="🎉✨ COUNTING SORT COMPLETATO! ✨🎉 Array perfettamente ordinato!"
+            text=f"🎉✨ {algorithm.name.upper()} COMPLETATO! ✨🎉 Array perfettamente ordinato!"
         ))
         self.root.after(0, lambda: self.explanation_label.config(
-            text="🎊 Fantastico! L'array è ora ordinato e pronto per la ricerca binaria! Il Counting Sort ha una complessità O(n+k)! 🎊"
+            text=f"🎊 Fantastico! L'array è ora ordinato e pronto per la ricerca! Il {algorithm.name} ha una complessità {algorithm.complexity}! 🎊"
         ))
         self.root.after(0, lambda: self.stats_label.config(
-            text=f"📊 Array di {len(self.array)} elementi | Stato: ORDINATO ✅ | Complessità Counting Sort: O(n+k) | Pronto per ricerca! 🚀"
+            text=f"📊 Esecuzione #{run} ({algorithm.name}) | Array di {len(self.array)} elementi ORDINATO ✅ | "
+                 f"{self.counters_text(counts, counted)} | Nucleo headless: {seconds * 1000:.2f} ms{self.prefilter_stats_text()} | "
+                 f"🖼️ {self.render_meter.cost * 1000:.0f} ms/fotogramma 🚀"
         ))
         
         # Celebrazione finale
@@ -1062,7 +2005,6 @@ class BinarySearchGUI:
         self.sorting = False
         self.root.after(0, lambda: self.search_btn.config(state='normal', text="🚀 INIZIA RICERCA"))
         self.root.after(0, lambda: self.reset_btn.config(state='normal'))
-        self.root.after(0, lambda: self.sort_btn.config(state='normal', text="✅ GIÀ ORDINATO"))
     
     def display_array_with_highlight(self, highlight_index, mode="normal"):
         """Visualizza l'array con evidenziazione speciale per il sorting"""
@@ -1117,7 +2059,8 @@ class BinarySearchGUI:
         indices_frame = tk.Frame(main_array_frame, bg=self.colors['card'])
         indices_frame.pack(pady=(5, 10))
         
-        for i, value in enumerate(self.array):
+        values = as_view(self.array)
+        for i, value in enumerate(values):
             # Determina il colore e lo stile
             if i == highlight_index:
                 if mode == "counting":
@@ -1149,7 +2092,7 @@ class BinarySearchGUI:
             # Elemento dell'array con stile moderno
             element = tk.Label(
                 element_container,
-                text=str(value),
+                text=self.key_text(value),
                 font=('Segoe UI', 16, 'bold'),
                 bg=color,
                 fg=text_color,
@@ -1173,31 +2116,43 @@ class BinarySearchGUI:
             # Animazione per l'elemento evidenziato
             if i == highlight_index:
                 self.animate_element_pulse(element)
+        
+        # Rilascia la vista sul buffer tipizzato
+        if isinstance(values, memoryview):
+            values.release()
     
     def celebrate_sorting_complete(self):
         """Animazione di celebrazione per il completamento dell'ordinamento"""
-        def flash_colors(step=0):
-            if step < 12:  # 6 flash completi
-                colors = [self.colors['success'], self.colors['accent'], 
-                         self.colors['primary'], self.colors['secondary'],
-                         self.colors['warning'], '#ff6b9d']
-                color = colors[step % len(colors)]
-                
-                # Cambia colore del frame info
-                self.info_frame.config(bg=color)
-                self.step_label.config(bg=color, fg='white')
-                self.explanation_label.config(bg=color, fg='white')
-                
-                self.root.after(200, lambda: flash_colors(step + 1))
-            else:
-                # Ripristina colori originali
+        def flash_colors():
+            colors = [self.colors['success'], self.colors['accent'], 
+                     self.colors['primary'], self.colors['secondary'],
+                     self.colors['warning'], '#ff6b9d']
+            try:
+                for step in range(12):  # 6 flash completi
+                    color = colors[step % len(colors)]
+                    
+                    # Cambia colore del frame info
+                    self.info_frame.config(bg=color)
+                    self.step_label.config(bg=color, fg='white')
+                    self.explanation_label.config(bg=color, fg='white')
+                    yield
+            finally:
+                # Ripristina colori originali, anche se l'effetto viene sostituito
                 self.info_frame.config(bg=self.colors['card'])
                 self.step_label.config(bg=self.colors['card'], fg=self.colors['primary'])
                 self.explanation_label.config(bg=self.colors['card'], fg=self.colors['text'])
         
-        flash_colors()
+        self.clock.start(flash_colors(), every=2, key='celebration')
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Visualizzatore di ricerca binaria.")
+    parser.add_argument('snapshot', nargs='?', help="istantanea da caricare all'avvio (già ordinata e indicizzata)")
+    parser.add_argument('--query', help="chiavi da cercare appena la finestra è pronta, senza animazione")
+    parser.add_argument('--startup-report', action='store_true',
+                        help="stampa i tempi dall'inizio degli import alla prima visualizzazione e alla prima ricerca")
+    parser.add_argument('--exit', action='store_true', help="chiude la finestra quando l'avvio è completo")
+    args = parser.parse_args(argv)
+    
     root = tk.Tk()
     
     # Configura l'icona e altre proprietà della finestra
@@ -1212,13 +2167,30 @@ def main():
     root.geometry(f"1200x800+{x}+{y}")
     
     app = BinarySearchGUI(root)
+    # Istantanea indicata sulla riga di comando: l'array è pronto senza ordinare
+    if args.snapshot:
+        app.load_snapshot(args.snapshot)
+    elif not args.query:
+        # Messaggio di benvenuto
+        root.after(1000, lambda: app.step_label.config(
+            text="🌟 Benvenuto nel Visualizzatore di Ricerca Binaria! Genera un array e inizia l'esplorazione! 🌟"
+        ))
+    app.pending_query = args.query
+    status = []
     
-    # Messaggio di benvenuto
-    root.after(1000, lambda: app.step_label.config(
-        text="🌟 Benvenuto nel Visualizzatore di Ricerca Binaria! Genera un array e inizia l'esplorazione! 🌟"
-    ))
+    # Fine dell'avvio: pannelli completi oppure risposta alla ricerca iniziale
+    def startup_done(event):
+        if app.query_error is not None:
+            print(f"❌ Ricerca iniziale non eseguita: {app.query_error}", file=sys.stderr, flush=True)
+            status.append(1)
+        if args.startup_report:
+            print(app.startup.describe(), flush=True)
+        if args.exit:
+            root.destroy()
+    root.bind('<<FirstQuery>>' if args.query else '<<PanelsReady>>', startup_done)
     
     root.mainloop()
+    return status[0] if status else 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
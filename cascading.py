@@ -0,0 +1,131 @@
+# Cascata frazionaria: una chiave cercata in k array ordinati in O(log n + k)
+# Ogni livello fonde il proprio array con un elemento ogni due del livello successivo
+# e ricorda, per ogni posizione, il rango nel proprio array e il ponte verso il livello
+# sotto: dopo una sola ricerca binaria ogni array successivo costa un numero costante di passi
+from bisect import bisect_left
+from heapq import merge
+
+from typed_arrays import make_array
+
+
+def _ranks(merged, data):
+    """Per ogni chiave di ``merged`` (ordinata) il numero di elementi di ``data`` minori."""
+    ranks = []
+    j, n = 0, len(data)
+    for key in merged:
+        while j < n and data[j] < key:
+            j += 1
+        ranks.append(j)
+    # Sentinella: una chiave oltre l'ultima del livello
+    ranks.append(n)
+    return ranks
+
+
+class FractionalCascade:
+    """Struttura a cascata su una sequenza di array ordinati (anche di lunghezze diverse).
+
+    ``lower_bounds`` restituisce per ogni array la posizione di ``bisect_left``;
+    la prima è trovata con una ricerca binaria sul primo livello, le altre
+    seguendo i ponti e correggendo al più pochi passi all'indietro. La memoria
+    aggiuntiva è al più il doppio degli elementi totali.
+    """
+
+    def __init__(self, arrays):
+        self.arrays = [make_array(array) for array in arrays]
+        self.levels = []
+        self.own = []
+        self.down = []
+        below = None
+        for array in reversed(self.arrays):
+            level = list(merge(array, below[1::2])) if below is not None else list(array)
+            self.own.append(make_array(_ranks(level, array)))
+            self.down.append(make_array(_ranks(level, below)) if below is not None else None)
+            self.levels.append(make_array(level))
+            below = level
+        self.levels.reverse()
+        self.own.reverse()
+        self.down.reverse()
+
+    def __len__(self):
+        return len(self.arrays)
+
+    @property
+    def memory_bytes(self):
+        buffers = [*self.levels, *self.own, *(down for down in self.down if down is not None)]
+        return sum(len(buffer) * buffer.itemsize for buffer in buffers)
+
+    def _walk(self, target):
+        """Posizioni nei livelli e correzioni all'indietro: [(livello, approdo, posizione)]."""
+        if not self.levels:
+            return []
+        position = bisect_left(self.levels[0], target)
+        path = [(0, position, position)]
+        for i in range(1, len(self.levels)):
+            level = self.levels[i]
+            landing = position = self.down[i - 1][path[-1][2]]
+            while position > 0 and level[position - 1] >= target:
+                position -= 1
+            path.append((i, landing, position))
+        return path
+
+    def lower_bounds(self, target):
+        """Posizione di ``bisect_left(array, target)`` in ciascun array."""
+        levels, own, down = self.levels, self.own, self.down
+        if not levels:
+            return []
+        position = bisect_left(levels[0], target)
+        answers = [own[0][position]]
+        for i in range(1, len(levels)):
+            level = levels[i]
+            position = down[i - 1][position]
+            while position and level[position - 1] >= target:
+                position -= 1
+            answers.append(own[i][position])
+        return answers
+
+    def search(self, target):
+        """Indice della prima occorrenza di ``target`` in ciascun array oppure -1."""
+        return [index if index < len(array) and array[index] == target else -1
+                for array, index in zip(self.arrays, self.lower_bounds(target))]
+
+    def search_with_probes(self, target):
+        """Risposte e letture eseguite: ricerca binaria sul primo livello più i passi dei ponti."""
+        probes = len(self.levels[0]).bit_length() if self.levels else 0
+        for _, landing, position in self._walk(target)[1:]:
+            probes += 1 + landing - position
+        return self.search(target), probes
+
+    def trace(self, target):
+        """Tracce (left, right, probe) per corsia, nelle coordinate di ciascun array.
+
+        La prima corsia mostra la ricerca binaria sul primo livello; le altre
+        la finestra costante in cui arriva il ponte e poi la risposta.
+        """
+        traces = []
+        for i, landing, position in self._walk(target):
+            array, own = self.arrays[i], self.own[i]
+            last = len(array) - 1
+            if last < 0:
+                traces.append([])
+                continue
+            steps = []
+            if i == 0:
+                lo, hi = 0, len(self.levels[0])
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    steps.append((min(own[lo], last), min(own[hi], last), min(own[mid], last)))
+                    if self.levels[0][mid] < target:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+            else:
+                steps.append((min(own[position], last), min(own[landing], last), min(own[landing], last)))
+            answer = min(own[position], last)
+            steps.append((answer, answer, answer))
+            traces.append(steps)
+        return traces
+
+
+def independent_cost(arrays):
+    """Letture di k ricerche binarie indipendenti, per il confronto con la cascata."""
+    return sum(len(array).bit_length() for array in arrays)
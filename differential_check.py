@@ -0,0 +1,297 @@
+# Verifica differenziale dei nuclei di ricerca e ordinamento contro bisect e sorted()
+# Ogni caso è generato casualmente (dimensioni, duplicati, chiavi negative, target ai
+# bordi, array vuoti) e cronometrato: la stessa esecuzione verifica la correttezza e,
+# confrontata con una baseline salvata, segnala le regressioni di prestazioni
+import argparse
+import json
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+from algorithms import ALGORITHMS, SEARCH, SORT, count_events, run_headless
+from batch_search import search_sorted_batch
+from cascading import FractionalCascade
+from key_encoding import FloatCodec, StrCodec, encode_keys, sort_keys
+from prefilter import build_prefilter
+from records import RecordArray
+from search_algorithms import SEARCHES
+from sorted_blocks import BlockSortedList
+from versioned_blocks import VersionedSortedList
+from typed_arrays import make_array
+
+# Ampiezze dell'intervallo dei valori: 1 produce soli duplicati, le altre chiavi sparse
+SPREADS = (1, 3, 50, 100_000)
+# Tolleranza predefinita sul tempo per caso rispetto alla baseline (+50%)
+DEFAULT_TOLERANCE = 0.5
+
+
+def random_values(rng, max_size):
+    """Valori non ordinati di un caso: dimensione, duplicati e segno casuali."""
+    size = rng.choice((0, 1, 2, rng.randint(3, max_size)))
+    spread = rng.choice(SPREADS)
+    low = rng.choice((0, -spread // 2, -spread, 1))
+    return [rng.randint(low, low + spread) for _ in range(size)]
+
+
+def edge_targets(rng, ordered):
+    """Target presenti, assenti, agli estremi e appena fuori dall'intervallo."""
+    if not ordered:
+        return [0, -1, 1]
+    lo, hi = ordered[0], ordered[-1]
+    return [lo, hi, lo - 1, hi + 1, (lo + hi) // 2, rng.choice(ordered), rng.randint(lo - 2, hi + 2)]
+
+
+def _expected(ordered, target):
+    """Prima occorrenza secondo bisect, oppure -1 se il target è assente."""
+    first = bisect_left(ordered, target)
+    return first if first < len(ordered) and ordered[first] == target else -1
+
+
+def _valid_answer(ordered, target, index):
+    """Con i duplicati è corretto qualunque indice che contenga il target."""
+    if _expected(ordered, target) == -1:
+        return index == -1
+    return 0 <= index < len(ordered) and ordered[index] == target
+
+
+class DifferentialRun:
+    """Esecuzione della verifica: raccoglie discrepanze e tempi per controllo."""
+
+    def __init__(self):
+        self.failures = []
+        self.seconds = defaultdict(float)
+        self.cases = defaultdict(int)
+
+    def timed(self, name, call, *args):
+        start = time.perf_counter()
+        result = call(*args)
+        self.seconds[name] += time.perf_counter() - start
+        self.cases[name] += 1
+        return result
+
+    def fail(self, name, detail):
+        self.failures.append(f"{name}: {detail}")
+
+    def check_searches(self, ordered, targets):
+        data = make_array(ordered)
+        for name, search, _ in SEARCHES:
+            for target in targets:
+                index, _ = self.timed(f"search_algorithms.{name}", search, data, target)
+                if not _valid_answer(ordered, target, index):
+                    self.fail(f"search_algorithms.{name}", f"array={ordered} target={target} -> {index}")
+        for name, algorithm in ALGORITHMS.items():
+            if algorithm.kind != SEARCH:
+                continue
+            for target in targets:
+                fast = self.timed(f"{name} (headless)", run_headless, algorithm, data, target)
+                traced, _ = self.timed(f"{name} (eventi)", count_events, algorithm, data, target)
+                for label, index in (("headless", fast), ("eventi", traced)):
+                    if not _valid_answer(ordered, target, index):
+                        self.fail(f"{name} ({label})", f"array={ordered} target={target} -> {index}")
+
+    def check_batch(self, ordered, targets):
+        answers, _ = self.timed("search_sorted_batch", search_sorted_batch, make_array(ordered), targets)
+        expected = [_expected(ordered, t) for t in targets]
+        if answers != expected:
+            self.fail("search_sorted_batch", f"array={ordered} targets={targets} -> {answers} invece di {expected}")
+
+    def check_blocks(self, rng, ordered, targets):
+        blocks = self.timed("BlockSortedList.from_sorted", BlockSortedList.from_sorted, ordered, rng.randint(2, 16))
+        if list(blocks) != ordered:
+            self.fail("BlockSortedList.from_sorted", f"{list(blocks)} invece di {ordered}")
+        for target in targets:
+            position = self.timed("BlockSortedList.bisect_left", blocks.bisect_left, target)
+            if position != bisect_left(ordered, target):
+                self.fail("BlockSortedList.bisect_left", f"array={ordered} target={target} -> {position}")
+            if (target in blocks) != (_expected(ordered, target) != -1):
+                self.fail("BlockSortedList.__contains__", f"array={ordered} target={target}")
+        # Aggiornamenti incrementali confrontati con una lista ordinata di riferimento
+        reference = list(ordered)
+        for target in targets:
+            if rng.random() < 0.5:
+                index = self.timed("BlockSortedList.add", blocks.add, target)
+                if index != bisect_right(reference, target):
+                    self.fail("BlockSortedList.add", f"array={reference} target={target} -> {index}")
+                reference.insert(bisect_right(reference, target), target)
+            else:
+                removed = self.timed("BlockSortedList.discard", blocks.discard, target)
+                if removed != (_expected(reference, target) != -1):
+                    self.fail("BlockSortedList.discard", f"array={reference} target={target} -> {removed}")
+                if removed:
+                    reference.pop(bisect_left(reference, target))
+        if list(blocks) != reference or len(blocks) != len(reference):
+            self.fail("BlockSortedList.add/discard", f"{list(blocks)} invece di {reference}")
+
+    def check_versions(self, rng, ordered, targets):
+        versions = self.timed("VersionedSortedList", VersionedSortedList, ordered, rng.randint(2, 16))
+        pinned = versions.pin()
+        reference = list(ordered)
+        for target in targets:
+            if rng.random() < 0.5:
+                _, index = self.timed("VersionedSortedList.add", versions.add, target)
+                if index != bisect_right(reference, target):
+                    self.fail("VersionedSortedList.add", f"array={reference} target={target} -> {index}")
+                reference.insert(bisect_right(reference, target), target)
+            else:
+                removed = self.timed("VersionedSortedList.discard", versions.discard, target)
+                if removed != (_expected(reference, target) != -1):
+                    self.fail("VersionedSortedList.discard", f"array={reference} target={target} -> {removed}")
+                if removed:
+                    reference.pop(bisect_left(reference, target))
+            current = versions.pin()
+            position = self.timed("SortedVersion.bisect_left", current.bisect_left, target)
+            if position != bisect_left(reference, target) or (target in current) != (target in reference):
+                self.fail("SortedVersion.bisect_left", f"array={reference} target={target} -> {position}")
+        if list(versions.pin()) != reference or len(versions.pin()) != len(reference):
+            self.fail("VersionedSortedList.add/discard", f"{list(versions.pin())} invece di {reference}")
+        # La versione fissata all'inizio non vede nessuna delle scritture successive
+        if list(pinned) != ordered or len(pinned) != len(ordered):
+            self.fail("SortedVersion (isolamento)", f"{list(pinned)} invece di {ordered}")
+
+    def check_cascade(self, rng, ordered, targets):
+        # Array correlati: sottoinsiemi casuali del caso, anche vuoti
+        arrays = [ordered] + [sorted(rng.sample(ordered, rng.randint(0, len(ordered)))) for _ in range(rng.randint(0, 5))]
+        cascade = self.timed("FractionalCascade", FractionalCascade, arrays)
+        for target in targets:
+            answers = self.timed("FractionalCascade.search", cascade.search, target)
+            expected = [_expected(array, target) for array in arrays]
+            if answers != expected:
+                self.fail("FractionalCascade.search", f"arrays={arrays} target={target} -> {answers}")
+
+    def check_prefilter(self, ordered, targets):
+        if not ordered:
+            return
+        prefilter = self.timed("build_prefilter", build_prefilter, ordered)
+        # Nessun falso negativo: ogni chiave presente deve superare il filtro
+        missing = [t for t in targets if _expected(ordered, t) != -1 and not prefilter.might_contain(t)]
+        if missing:
+            self.fail("build_prefilter", f"falsi negativi {missing} su {ordered}")
+
+    def check_sorts(self, values):
+        expected = sorted(values)
+        for name, algorithm in ALGORITHMS.items():
+            if algorithm.kind != SORT:
+                continue
+            fast = make_array(values)
+            self.timed(f"{name} (headless)", run_headless, algorithm, fast)
+            traced = make_array(values)
+            self.timed(f"{name} (eventi)", count_events, algorithm, traced)
+            for label, data in (("headless", fast), ("eventi", traced)):
+                if list(data) != expected:
+                    self.fail(f"{name} ({label})", f"{values} -> {list(data)}")
+
+    def check_records(self, values, targets):
+        # Il payload è la posizione di inserimento: l'ordinamento deve essere stabile
+        expected = sorted(zip(values, range(len(values))), key=lambda pair: pair[0])
+        records = RecordArray(values, range(len(values)))
+        self.timed("RecordArray.sort", records.sort)
+        if list(records) != expected:
+            self.fail("RecordArray.sort", f"{values} -> {list(records)}")
+        firsts = {}
+        for key, payload in expected:
+            firsts.setdefault(key, payload)
+        for target in targets:
+            payload = self.timed("RecordArray.get", records.get, target)
+            if payload != firsts.get(target):
+                self.fail("RecordArray.get", f"{values} target={target} -> {payload}")
+        answers = self.timed("RecordArray.lookup_batch", records.lookup_batch, targets)
+        if answers != [firsts.get(t) for t in targets]:
+            self.fail("RecordArray.lookup_batch", f"{values} targets={targets} -> {answers}")
+
+    def check_encoded_keys(self, rng, values):
+        # Float con segno e stringhe di lunghezza variabile mappati sui codici interi
+        floats = [value / rng.choice((1, 3, 7.5)) for value in values] + [0.0, -0.0][:len(values) % 3]
+        words = [''.join(rng.choice('aAbz09é') for _ in range(rng.randint(0, 5))) for _ in values]
+        cases = (("float", floats, FloatCodec(), [0.0, -1e300, float('inf')]),
+                 ("str", words, StrCodec(10), ['', 'zzzzz']))
+        for name, keys, codec, edges in cases:
+            ordered = self.timed(f"sort_keys ({name})", sort_keys, keys, codec)
+            if ordered != sorted(keys):
+                self.fail(f"sort_keys ({name})", f"{keys} -> {ordered}")
+            codes = encode_keys(codec, sorted(keys))
+            for target in keys[:3] + edges:
+                index = self.timed(f"ricerca codificata ({name})", run_headless,
+                                   ALGORITHMS["Ricerca binaria"], codes, codec.encode(target))
+                if not _valid_answer(sorted(keys), target, index):
+                    self.fail(f"ricerca codificata ({name})", f"{keys} target={target!r} -> {index}")
+
+    def run(self, cases, max_size, seed):
+        rng = random.Random(seed)
+        for _ in range(cases):
+            values = random_values(rng, max_size)
+            ordered = sorted(values)
+            targets = edge_targets(rng, ordered)
+            self.check_sorts(values)
+            self.check_searches(ordered, targets)
+            self.check_batch(ordered, targets)
+            self.check_blocks(rng, ordered, targets)
+            self.check_versions(rng, ordered, targets)
+            self.check_cascade(rng, ordered, targets)
+            self.check_prefilter(ordered, targets)
+            self.check_records(values, targets)
+            self.check_encoded_keys(rng, values)
+        return self
+
+    def timings(self):
+        """Microsecondi per caso di ciascun controllo."""
+        return {name: self.seconds[name] / self.cases[name] * 1e6 for name in sorted(self.seconds)}
+
+
+def regressions(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Controlli il cui tempo per caso supera quello della baseline oltre la tolleranza."""
+    return [(name, baseline[name], micros) for name, micros in current.items()
+            if name in baseline and micros > baseline[name] * (1 + tolerance)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifica differenziale contro bisect e sorted().")
+    parser.add_argument('--cases', type=int, default=300, help="numero di casi casuali")
+    parser.add_argument('--max-size', type=int, default=200, help="dimensione massima degli array")
+    parser.add_argument('--seed', type=int, default=0, help="seme del generatore pseudocasuale")
+    parser.add_argument('--repeat', type=int, default=3, help="ripetizioni dei casi per la misura dei tempi")
+    parser.add_argument('--save', help="salva i tempi per caso come baseline JSON")
+    parser.add_argument('--baseline', help="baseline JSON con cui confrontare i tempi")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="aumento relativo del tempo tollerato rispetto alla baseline")
+    args = parser.parse_args(argv)
+
+    # Gli stessi casi vengono ripetuti e per ogni controllo si tiene il tempo migliore,
+    # così che un singolo rallentamento della macchina non sembri una regressione
+    runs = [DifferentialRun().run(args.cases, args.max_size, args.seed) for _ in range(max(1, args.repeat))]
+    run = runs[0]
+    timings = {name: min(r.timings()[name] for r in runs) for name in run.timings()}
+    width = max(map(len, timings), default=0)
+    for name, micros in timings.items():
+        print(f"{name:<{width}}  {run.cases[name]:>7} casi  {micros:>10.2f} µs/caso")
+
+    status = 0
+    if run.failures:
+        status = 1
+        print(f"\n❌ {len(run.failures)} discrepanze:")
+        for failure in run.failures[:20]:
+            print(f"  {failure}")
+    else:
+        print(f"\n✅ Nessuna discrepanza su {args.cases} casi")
+
+    # I tempi sono confrontabili solo a parità di casi generati
+    params = {'cases': args.cases, 'max_size': args.max_size, 'seed': args.seed}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline['params'] != params:
+            print(f"⚠️ Parametri diversi dalla baseline {baseline['params']}: i tempi non sono confrontabili")
+        slow = regressions(timings, baseline['timings'], args.tolerance)
+        for name, before, after in slow:
+            print(f"🐢 Regressione {name}: {before:.2f} → {after:.2f} µs/caso")
+        if slow:
+            status = 1
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'params': params, 'timings': timings}, f, indent=2, sort_keys=True)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+# Esportazione offline dei fotogrammi di un'esecuzione (ricerca o counting sort) senza Tk
+# I fotogrammi sono rasterizzati in Python puro in un pool di processi e codificati
+# come GIF animata (solo il rettangolo modificato per fotogramma) o sequenza di PNG
+import argparse
+import os
+import random
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from search_algorithms import trace_binary
+
+# Ruoli dei pixel: il valore è sia l'indice nella tavolozza sia la priorità
+# usata quando più elementi ricadono nella stessa colonna dell'immagine
+BACKGROUND = 0
+EXCLUDED = 1
+DEFAULT = 2
+RANGE = 3
+BUILT = 4
+COUNTING = 5
+PROBE = 6
+FOUND = 7
+
+# Tavolozza coerente con i colori dell'interfaccia grafica
+PALETTE = [
+    (0xff, 0xff, 0xff),  # Sfondo (card)
+    (0xe2, 0xe8, 0xf0),  # Elementi esclusi (shadow)
+    (0xa0, 0xae, 0xc0),  # Elementi neutri
+    (0xff, 0xb3, 0x47),  # Area di ricerca attiva (warning)
+    (0xff, 0xd9, 0x3d),  # Elementi già ricostruiti (accent)
+    (0xff, 0x6b, 0x9d),  # Elemento in conteggio (secondary)
+    (0x6b, 0x73, 0xff),  # Sonda corrente (primary)
+    (0x00, 0xd4, 0xaa),  # Elemento trovato o appena inserito (success)
+]
+
+# Dimensioni predefinite dei fotogrammi in pixel
+DEFAULT_WIDTH = 320
+DEFAULT_HEIGHT = 180
+# Numero di fotogrammi assegnati a ciascun lavoro del pool di processi
+CHUNK_SIZE = 256
+
+
+def search_run(array, target):
+    """Descrizione di un'esecuzione della ricerca binaria su un array ordinato."""
+    return {'kind': 'search', 'array': list(array), 'target': target,
+            'steps': list(trace_binary(array, target))}
+
+
+def counting_sort_run(array):
+    """Descrizione di un'esecuzione del counting sort: conteggio e ricostruzione."""
+    return {'kind': 'sort', 'array': list(array), 'sorted': sorted(array)}
+
+
+def frame_count(run):
+    """Numero di fotogrammi dell'esecuzione, incluso il fotogramma finale."""
+    if run['kind'] == 'search':
+        return len(run['steps']) + 1
+    return 2 * len(run['array']) + 1
+
+
+def frame_state(run, k):
+    """Valori e ruoli di ciascun elemento nel fotogramma ``k``."""
+    array = run['array']
+    n = len(array)
+    if run['kind'] == 'search':
+        steps = run['steps']
+        if k < len(steps):
+            left, right, mid = steps[k]
+            roles = [EXCLUDED] * left + [RANGE] * (right - left + 1) + [EXCLUDED] * (n - right - 1)
+            roles[mid] = FOUND if k == len(steps) - 1 and array[mid] == run['target'] else PROBE
+            return array, roles
+        # Fotogramma finale: resta evidenziato solo l'elemento trovato
+        roles = [EXCLUDED] * n
+        if steps and array[steps[-1][2]] == run['target']:
+            roles[steps[-1][2]] = FOUND
+        return array, roles
+    if k < n:
+        roles = [DEFAULT] * n
+        roles[k] = COUNTING
+        return array, roles
+    if k < 2 * n:
+        pos = k - n
+        values = run['sorted'][:pos + 1] + array[pos + 1:]
+        return values, [BUILT] * pos + [FOUND] + [DEFAULT] * (n - pos - 1)
+    return run['sorted'], [BUILT] * n
+
+
+class FrameRenderer:
+    """Rasterizzatore a tavolozza di fotogrammi a barre verticali.
+
+    Gli elementi sono raggruppati in al più ``width`` colonne (altezza
+    massima e ruolo più prioritario del gruppo); ogni riga dell'immagine
+    viene derivata dalla precedente attivando le sole barre che la
+    raggiungono, per cui il costo è O(colonne + altezza) copie di righe.
+    """
+
+    def __init__(self, run, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT):
+        self.run = run
+        self.width = width
+        self.height = height
+        n = len(run['array'])
+        self.columns = max(1, min(n, width))
+        self.column_width = max(1, width // self.columns)
+        self.bounds = [(g * n // self.columns, (g + 1) * n // self.columns) for g in range(self.columns)]
+        self.max_value = max([1, *run['array']])
+
+    def columns_at(self, k):
+        """Coppie (altezza in pixel, ruolo) di ogni colonna nel fotogramma ``k``."""
+        values, roles = frame_state(self.run, k)
+        scale = (self.height - 4) / self.max_value
+        state = []
+        for start, stop in self.bounds:
+            if start == stop:
+                state.append((0, BACKGROUND))
+                continue
+            peak = max(values[start:stop])
+            state.append((max(1, int(peak * scale)) if peak > 0 else 0, max(roles[start:stop])))
+        return state
+
+    def raster(self, state):
+        """Righe di pixel (indici di tavolozza) dell'immagine descritta da ``state``."""
+        width, cw = self.width, self.column_width
+        row = bytearray(width)
+        order = sorted(range(len(state)), key=lambda g: state[g][0], reverse=True)
+        rows = []
+        pointer = 0
+        for y in range(self.height):
+            level = self.height - y
+            while pointer < len(order) and state[order[pointer]][0] >= level:
+                g = order[pointer]
+                row[g * cw:(g + 1) * cw] = bytes((state[g][1],)) * cw
+                pointer += 1
+            rows.append(bytes(row))
+        return rows
+
+
+def _lzw_encode(pixels, min_code_size):
+    """Compressione LZW a lunghezza di codice variabile secondo la specifica GIF89a."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    bits = 0
+    nbits = 0
+    code_size = min_code_size + 1
+    table = {}
+    next_code = end + 1
+
+    def emit(code):
+        nonlocal bits, nbits
+        bits |= code << nbits
+        nbits += code_size
+        while nbits >= 8:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            nbits -= 8
+
+    emit(clear)
+    prefix = pixels[0]
+    for byte in pixels[1:]:
+        key = (prefix << 8) | byte
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix)
+        if next_code < 4096:
+            table[key] = next_code
+            next_code += 1
+            if next_code > (1 << code_size) and code_size < 12:
+                code_size += 1
+        else:
+            emit(clear)
+            table = {}
+            next_code = end + 1
+            code_size = min_code_size + 1
+        prefix = byte
+    emit(prefix)
+    emit(end)
+    if nbits:
+        out.append(bits & 0xFF)
+    return bytes(out)
+
+
+def _sub_blocks(data):
+    """Suddivisione dei dati in sotto-blocchi GIF di al più 255 byte."""
+    chunks = [bytes((len(data[i:i + 255]),)) + data[i:i + 255] for i in range(0, len(data), 255)]
+    return b''.join(chunks) + b'\x00'
+
+
+def _gif_frame(rows, x0, x1, delay_cs):
+    """Blocchi GIF (controllo grafico, descrittore, dati LZW) del rettangolo [x0, x1)."""
+    pixels = b''.join(row[x0:x1] for row in rows)
+    control = b'\x21\xf9\x04' + struct.pack('<BHB', 0x04, delay_cs, 0) + b'\x00'
+    descriptor = b'\x2c' + struct.pack('<HHHHB', x0, 0, x1 - x0, len(rows), 0)
+    return control + descriptor + b'\x03' + _sub_blocks(_lzw_encode(pixels, 3))
+
+
+def _png_chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def _png_image(rows, width):
+    """Immagine PNG a tavolozza (tipo colore 3, 8 bit) dalle righe di indici."""
+    header = struct.pack('>IIBBBBB', width, len(rows), 8, 3, 0, 0, 0)
+    palette = b''.join(bytes(color) for color in PALETTE)
+    raw = b''.join(b'\x00' + row for row in rows)
+    return (b'\x89PNG\r\n\x1a\n' + _png_chunk(b'IHDR', header) + _png_chunk(b'PLTE', palette)
+            + _png_chunk(b'IDAT', zlib.compress(raw, 6)) + _png_chunk(b'IEND', b''))
+
+
+# Rasterizzatore del processo di lavoro, creato una sola volta dall'inizializzatore
+_RENDERER = None
+
+
+def _init_worker(run, width, height):
+    global _RENDERER
+    _RENDERER = FrameRenderer(run, width, height)
+
+
+def _render_gif_chunk(job):
+    """Codifica una sequenza di fotogrammi come blocchi GIF con solo le colonne cambiate."""
+    pairs, delay_cs = job
+    renderer = _RENDERER
+    blocks = []
+    # Lo stato del fotogramma precedente viene riutilizzato all'interno dello stesso lavoro
+    before = None
+    for previous, k in pairs:
+        state = renderer.columns_at(k)
+        if previous is None:
+            x0, x1 = 0, renderer.width
+        else:
+            if before is None:
+                before = renderer.columns_at(previous)
+            changed = [g for g in range(len(state)) if state[g] != before[g]]
+            if not changed:
+                # Fotogramma identico: un pixel invariato mantiene il ritmo dell'animazione
+                changed = [0]
+            x0 = changed[0] * renderer.column_width
+            x1 = (changed[-1] + 1) * renderer.column_width
+        blocks.append(_gif_frame(renderer.raster(state), x0, x1, delay_cs))
+        before = state
+    return blocks
+
+
+def _render_png_chunk(frames):
+    renderer = _RENDERER
+    return [_png_image(renderer.raster(renderer.columns_at(k)), renderer.width) for k in frames]
+
+
+def _selected_frames(run, stride):
+    total = frame_count(run)
+    frames = list(range(0, total, max(1, stride)))
+    if frames[-1] != total - 1:
+        frames.append(total - 1)
+    return frames
+
+
+def _chunks(items, size=CHUNK_SIZE):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def export_gif(run, path, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT, delay_cs=2, stride=1, workers=None):
+    """Esporta l'esecuzione come GIF animata; restituisce il numero di fotogrammi scritti."""
+    frames = _selected_frames(run, stride)
+    pairs = list(zip([None] + frames[:-1], frames))
+    jobs = [(chunk, delay_cs) for chunk in _chunks(pairs)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(run, width, height)) as pool:
+        encoded = pool.map(_render_gif_chunk, jobs)
+        with open(path, 'wb') as f:
+            f.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0xF2, 0, 0))
+            f.write(b''.join(bytes(color) for color in PALETTE))
+            # Estensione NETSCAPE2.0 per la ripetizione infinita dell'animazione
+            f.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00')
+            for blocks in encoded:
+                f.writelines(blocks)
+            f.write(b'\x3b')
+    return len(frames)
+
+
+def export_png_sequence(run, directory, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT, stride=1, workers=None):
+    """Esporta l'esecuzione come sequenza di PNG numerati; restituisce il numero di file."""
+    os.makedirs(directory, exist_ok=True)
+    frames = _selected_frames(run, stride)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(run, width, height)) as pool:
+        index = 0
+        for images in pool.map(_render_png_chunk, _chunks(frames)):
+            for image in images:
+                with open(os.path.join(directory, f"frame_{index:06d}.png"), 'wb') as f:
+                    f.write(image)
+                index += 1
+    return len(frames)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Esporta un'esecuzione animata come GIF o sequenza PNG.")
+    parser.add_argument('algorithm', choices=('search', 'sort'), help="ricerca binaria o counting sort")
+    parser.add_argument('--size', type=int, default=5000, help="numero di elementi dell'array")
+    parser.add_argument('--target', type=int, help="numero da cercare (solo per search)")
+    parser.add_argument('--seed', type=int, help="seme del generatore pseudocasuale")
+    parser.add_argument('--gif', help="percorso del file GIF da scrivere")
+    parser.add_argument('--png-dir', help="cartella in cui scrivere la sequenza PNG")
+    parser.add_argument('--width', type=int, default=DEFAULT_WIDTH)
+    parser.add_argument('--height', type=int, default=DEFAULT_HEIGHT)
+    parser.add_argument('--stride', type=int, default=1, help="esporta un fotogramma ogni N passi")
+    parser.add_argument('--workers', type=int, help="numero di processi (predefinito: tutti i core)")
+    args = parser.parse_args(argv)
+    if not args.gif and not args.png_dir:
+        parser.error("indicare --gif oppure --png-dir")
+
+    rng = random.Random(args.seed)
+    array = rng.sample(range(1, max(100, args.size * 2)), args.size)
+    if args.algorithm == 'search':
+        array.sort()
+        target = args.target if args.target is not None else rng.choice(array)
+        run = search_run(array, target)
+    else:
+        run = counting_sort_run(array)
+
+    start = time.perf_counter()
+    if args.gif:
+        written = export_gif(run, args.gif, args.width, args.height, stride=args.stride, workers=args.workers)
+        print(f"{written} fotogrammi scritti in {args.gif}")
+    if args.png_dir:
+        written = export_png_sequence(run, args.png_dir, args.width, args.height,
+                                      stride=args.stride, workers=args.workers)
+        print(f"{written} fotogrammi scritti in {args.png_dir}")
+    print(f"Tempo di esportazione: {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+# Benchmark automatico della reattività dell'interfaccia sotto un server X virtuale
+# Lo script pilota generate_array, start_counting_sort e start_search a diverse dimensioni e
+# velocità di riproduzione, misurando la latenza input → ridisegno, i fotogrammi persi e il
+# tempo totale; il rapporto JSON si confronta con una baseline come in differential_check
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from query_server import percentiles
+
+# Dimensioni degli array e velocità: "fissa" usa i ritardi per dimensione, un intero è il budget in secondi
+DEFAULT_SIZES = (10, 20, 100)
+DEFAULT_SPEEDS = ('fissa', '5', '1')
+FIXED_SPEED = 'fissa'
+# Azioni pilotate per ogni combinazione, nell'ordine in cui le farebbe un utente
+ACTIONS = ('genera', 'ordina', 'cerca')
+# Intervallo delle sonde di input sul ciclo degli eventi in millisecondi
+PROBE_MS = 20
+# Un fotogramma disegnato oltre questo tempo dall'invio conta come perso (due quadri a 60 Hz)
+FRAME_DEADLINE = 2 / 60
+# Controllo periodico della fine di un'azione (ms) e durata massima di un'azione (s)
+POLL_MS = 10
+ACTION_TIMEOUT = 180.0
+# Schermo del server X virtuale, uguale a una finestra 1200x800 centrata
+SCREEN = '1280x1024x24'
+# Metriche confrontate con la baseline (valori più bassi sono migliori)
+TRACKED = ('clic_ms', 'input_p95_ms', 'frame_p95_ms', 'persi', 'totale_ms')
+# Tolleranza relativa e scarto assoluto minimo per segnalare una regressione
+DEFAULT_TOLERANCE = 0.5
+MIN_REGRESSION = 5.0
+
+
+class InputProbe:
+    """Sonda periodica sul ciclo degli eventi di Tk.
+
+    Ogni ``interval_ms`` simula un input e misura il tempo fino al ridisegno
+    successivo (la callback ``after_idle`` viene eseguita dopo i ridisegni
+    già in coda): un ciclo degli eventi occupato da fotogrammi lenti ritarda
+    sia l'input sia il ridisegno, esattamente come per un clic reale.
+    """
+
+    def __init__(self, root, interval_ms=PROBE_MS, clock=time.perf_counter):
+        self.root = root
+        self.interval_ms = interval_ms
+        self._clock = clock
+        self._active = False
+        self.samples = []
+
+    def start(self):
+        self.samples = []
+        self._active = True
+        self._schedule()
+
+    def stop(self):
+        self._active = False
+
+    def _schedule(self):
+        due = self._clock() + self.interval_ms / 1000
+        self.root.after(self.interval_ms, lambda: self._fire(due))
+
+    def _fire(self, due):
+        if not self._active:
+            return
+        self.root.after_idle(lambda: self.samples.append(self._clock() - due))
+        self._schedule()
+
+
+class GuiBenchmark:
+    """Esegue gli scenari (dimensione, velocità, azione) sull'interfaccia ``app``.
+
+    Gli scenari sono un generatore pilotato dal ciclo degli eventi: ogni
+    ``yield`` attende che l'azione sia conclusa (nessun thread di lavoro e
+    nessun fotogramma in coda) senza mai bloccare il thread di Tk.
+    """
+
+    def __init__(self, root, app, sizes=DEFAULT_SIZES, speeds=DEFAULT_SPEEDS, seed=0,
+                 clock=time.perf_counter):
+        self.root = root
+        self.app = app
+        self.sizes = sizes
+        self.speeds = speeds
+        self.seed = seed
+        self._clock = clock
+        self.probe = InputProbe(root, clock=clock)
+        self.results = []
+        self.error = None
+        self.done = False
+        # Temporizzatori creati dall'interfaccia: i passi saltati in modalità turbo sono fotogrammi persi
+        self.playbacks = []
+        make_playback = app.make_playback
+
+        def tracked(steps):
+            playback = make_playback(steps)
+            self.playbacks.append(playback)
+            return playback
+        app.make_playback = tracked
+        app.render_meter.trace = []
+        self._steps = None
+
+    def start(self):
+        random.seed(self.seed)
+        self._steps = self.scenarios()
+        self._advance(None)
+
+    def _advance(self, finished):
+        try:
+            self._steps.send(finished)
+        except StopIteration:
+            self._finish()
+            return
+        except Exception as error:
+            self.error = error
+            self._finish()
+            return
+        self._wait(self._clock() + ACTION_TIMEOUT)
+
+    def _wait(self, deadline):
+        app = self.app
+        if not (app.searching or app.sorting or app.render_meter.backlog):
+            # L'ultima callback inattiva arriva dopo il ridisegno finale
+            self.root.after_idle(lambda: self._advance(True))
+        elif self._clock() > deadline:
+            self._advance(False)
+        else:
+            self.root.after(POLL_MS, lambda: self._wait(deadline))
+
+    def _finish(self):
+        self.done = True
+        self.probe.stop()
+        self.root.after_idle(self.root.destroy)
+
+    def configure(self, size, speed):
+        """Imposta dimensione e velocità tramite gli stessi controlli usati dall'utente."""
+        app = self.app
+        app.array_size = size
+        budget = speed != FIXED_SPEED
+        app.budget_var.set(budget)
+        app.on_budget_toggle()
+        if budget:
+            app.speed_scale.set(int(speed))
+            app.update_speed(speed)
+
+    def press(self, action):
+        """Esegue l'azione come il clic sul pulsante corrispondente."""
+        app = self.app
+        if action == 'genera':
+            app.generate_array()
+        elif action == 'ordina':
+            app.start_counting_sort()
+        else:
+            target = app.array[random.randrange(len(app.array))]
+            app.target_entry.delete(0, 'end')
+            app.target_entry.insert(0, app.key_text(target))
+            app.start_search()
+
+    def scenarios(self):
+        yield  # Primo avanzamento: nessuna attesa
+        for size in self.sizes:
+            for speed in self.speeds:
+                self.configure(size, speed)
+                for action in ACTIONS:
+                    result = yield from self.measure(size, speed, action)
+                    self.results.append(result)
+
+    def measure(self, size, speed, action):
+        """Generatore che misura un'azione e restituisce il dizionario delle metriche."""
+        trace = self.app.render_meter.trace
+        trace.clear()
+        self.playbacks.clear()
+        self.probe.start()
+        started = self._clock()
+        self.press(action)
+        self.root.update_idletasks()
+        clicked = self._clock()
+        finished = yield
+        ended = self._clock()
+        self.probe.stop()
+
+        frames = [end - posted for posted, _, end in trace]
+        late = sum(1 for latency in frames if latency > FRAME_DEADLINE)
+        skipped = sum(playback.steps_done - playback.frames_rendered for playback in self.playbacks)
+        first_frame = (trace[0][2] if trace else clicked) - started
+        inputs = percentiles(self.probe.samples, (50, 95))
+        latencies = percentiles(frames, (95,))
+        return {
+            'dimensione': size,
+            'velocita': speed,
+            'azione': action,
+            'completata': finished,
+            'clic_ms': (clicked - started) * 1e3,
+            'primo_fotogramma_ms': first_frame * 1e3,
+            'input_p50_ms': inputs.get(50, 0.0) * 1e3,
+            'input_p95_ms': inputs.get(95, 0.0) * 1e3,
+            'input_max_ms': max(self.probe.samples, default=0.0) * 1e3,
+            'fotogrammi': len(frames),
+            'frame_p95_ms': latencies.get(95, 0.0) * 1e3,
+            'in_ritardo': late,
+            'saltati': skipped,
+            'persi': late + skipped,
+            'totale_ms': (ended - started) * 1e3,
+        }
+
+
+def scenario_name(result):
+    speed = result['velocita'] if result['velocita'] == FIXED_SPEED else f"{result['velocita']}s"
+    return f"{result['dimensione']}/{speed}/{result['azione']}"
+
+
+def describe(result):
+    text = (f"{scenario_name(result):<16} clic {result['clic_ms']:7.1f} ms | "
+            f"1° fotogramma {result['primo_fotogramma_ms']:7.1f} ms | "
+            f"input p50/p95/max {result['input_p50_ms']:.1f}/{result['input_p95_ms']:.1f}/"
+            f"{result['input_max_ms']:.1f} ms | fotogrammi {result['fotogrammi']} "
+            f"(persi {result['persi']}, p95 {result['frame_p95_ms']:.1f} ms) | "
+            f"totale {result['totale_ms']:.0f} ms")
+    if not result['completata']:
+        text += " ⏰ tempo scaduto"
+    return text
+
+
+def regressions(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Metriche peggiorate oltre la tolleranza relativa e oltre lo scarto minimo assoluto."""
+    before = {scenario_name(result): result for result in baseline}
+    slow = []
+    for result in current:
+        name = scenario_name(result)
+        if name not in before:
+            continue
+        for metric in TRACKED:
+            old, new = before[name][metric], result[metric]
+            if new > old * (1 + tolerance) and new - old > MIN_REGRESSION:
+                slow.append((name, metric, old, new))
+    return slow
+
+
+def environment(root):
+    """Dati della macchina e della revisione, per confrontare rapporti nel tempo."""
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                  cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        revision = None
+    return {
+        'data': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'revisione': revision,
+        'python': platform.python_version(),
+        'tk': root.tk.call('info', 'patchlevel'),
+        'piattaforma': platform.platform(),
+        'schermo': f"{root.winfo_screenwidth()}x{root.winfo_screenheight()}",
+        'cpu': os.cpu_count(),
+    }
+
+
+def run_under_xvfb(argv):
+    """Rilancia lo script sotto xvfb-run; ``None`` se xvfb-run non è installato."""
+    xvfb = shutil.which('xvfb-run')
+    if xvfb is None:
+        return None
+    command = [xvfb, '-a', '-s', f'-screen 0 {SCREEN}', sys.executable, os.path.abspath(__file__),
+               *argv, '--no-xvfb']
+    return subprocess.call(command)
+
+
+def parse_list(text, convert=str):
+    return tuple(convert(item) for item in text.replace(',', ' ').split())
+
+
+def speed_value(text):
+    if text != FIXED_SPEED and not 1 <= int(text) <= 60:
+        raise argparse.ArgumentTypeError("la velocità è 'fissa' oppure un budget da 1 a 60 secondi")
+    return text
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = argparse.ArgumentParser(description="Benchmark della reattività dell'interfaccia su un display virtuale.")
+    parser.add_argument('--sizes', type=lambda text: parse_list(text, int), default=DEFAULT_SIZES,
+                        help="dimensioni degli array separate da virgole")
+    parser.add_argument('--speeds', type=lambda text: parse_list(text, speed_value), default=DEFAULT_SPEEDS,
+                        help="velocità separate da virgole: 'fissa' oppure il budget in secondi")
+    parser.add_argument('--seed', type=int, default=0, help="seme del generatore pseudocasuale")
+    parser.add_argument('--save', help="salva il rapporto JSON (utilizzabile come baseline)")
+    parser.add_argument('--history', help="aggiunge il rapporto come riga JSON a uno storico")
+    parser.add_argument('--baseline', help="rapporto JSON con cui confrontare le metriche")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="peggioramento relativo tollerato rispetto alla baseline")
+    parser.add_argument('--no-xvfb', action='store_true', help="usa il display corrente senza rilanciare sotto xvfb-run")
+    args = parser.parse_args(argv)
+
+    if not os.environ.get('DISPLAY') and not args.no_xvfb:
+        status = run_under_xvfb(argv)
+        if status is None:
+            print("❌ Nessun display disponibile e xvfb-run non è installato (pacchetto xvfb)")
+            return 1
+        return status
+
+    import tkinter as tk
+    from binary_search_gui import BinarySearchGUI
+
+    root = tk.Tk()
+    root.geometry("1200x800")
+    app = BinarySearchGUI(root)
+    bench = GuiBenchmark(root, app, args.sizes, args.speeds, args.seed)
+    # Gli scenari partono quando la finestra è visibile e i pannelli secondari sono costruiti
+    root.bind('<<PanelsReady>>', lambda event: bench.start(), add='+')
+    env = environment(root)
+    root.mainloop()
+
+    if bench.error is not None:
+        print(f"❌ Benchmark interrotto: {bench.error!r}")
+        return 1
+    env['avvio_ms'] = {name: seconds * 1e3 for name, seconds in app.startup.marks.items()}
+    for result in bench.results:
+        print(describe(result))
+    print(f"\n⏱️ {app.startup.describe()}")
+
+    status = 0 if all(result['completata'] for result in bench.results) else 1
+    params = {'sizes': list(args.sizes), 'speeds': list(args.speeds), 'seed': args.seed}
+    report = {'params': params, 'ambiente': env, 'risultati': bench.results}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline['params'] != params:
+            print(f"⚠️ Parametri diversi dalla baseline {baseline['params']}: solo gli scenari comuni sono confrontati")
+        slow = regressions(bench.results, baseline['risultati'], args.tolerance)
+        for name, metric, before, after in slow:
+            print(f"🐢 Regressione {name} {metric}: {before:.1f} → {after:.1f}")
+        if slow:
+            status = 1
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.history:
+        with open(args.history, 'a') as f:
+            f.write(json.dumps(report, sort_keys=True) + "\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
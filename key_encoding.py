@@ -0,0 +1,161 @@
+# Codifiche delle chiavi in interi senza segno che preservano l'ordine
+# Float (anche negativi) e stringhe o byte a lunghezza fissa diventano interi confrontabili,
+# così che counting sort, radix sort, ricerca binaria e prefiltri lavorino senza modifiche
+import struct
+
+from algorithms import get_algorithm, run_headless
+from typed_arrays import make_array
+
+_SIGN64 = 1 << 63
+_MASK64 = (1 << 64) - 1
+
+
+class IntCodec:
+    """Chiavi intere: la codifica è l'identità, i percorsi esistenti restano invariati."""
+
+    name = "Interi"
+
+    def parse(self, token):
+        return int(token)
+
+    def encode(self, key):
+        return int(key)
+
+    def decode(self, code):
+        return code
+
+    def format(self, code):
+        return str(code)
+
+
+class FloatCodec:
+    """Chiavi float a 64 bit codificate come interi senza segno nello stesso ordine.
+
+    Per i positivi si imposta il bit di segno, per i negativi si
+    invertono tutti i bit: l'ordine dei codici coincide con quello numerico,
+    inclusi infiniti. ``-0.0`` è normalizzato a ``0.0`` (sono uguali) e
+    NaN viene rifiutato perché non è ordinabile.
+    """
+
+    name = "Decimali"
+
+    def parse(self, token):
+        return self._check(float(token))
+
+    @staticmethod
+    def _check(key):
+        key = float(key)
+        if key != key:
+            raise ValueError("NaN non è una chiave ordinabile")
+        return key
+
+    def encode(self, key):
+        key = self._check(key)
+        if key == 0:
+            key = 0.0
+        bits = struct.unpack('>Q', struct.pack('>d', key))[0]
+        return bits ^ _MASK64 if bits & _SIGN64 else bits | _SIGN64
+
+    def decode(self, code):
+        bits = code ^ _SIGN64 if code & _SIGN64 else code ^ _MASK64
+        return struct.unpack('>d', struct.pack('>Q', bits))[0]
+
+    def format(self, code):
+        return f"{self.decode(code):g}"
+
+
+class BytesCodec:
+    """Chiavi byte di al più ``width`` byte, completate con zeri e lette come big-endian.
+
+    L'ordine dei codici è quello lessicografico dei byte; gli zeri finali
+    non sono distinguibili dal riempimento e vengono rimossi in decodifica.
+    """
+
+    name = "Byte"
+
+    def __init__(self, width=8):
+        self.width = width
+
+    def _to_bytes(self, key):
+        return key.encode('utf-8') if isinstance(key, str) else bytes(key)
+
+    def _from_bytes(self, data):
+        return data
+
+    def parse(self, token):
+        key = self._from_bytes(self._to_bytes(token))
+        self.encode(key)
+        return key
+
+    def encode(self, key):
+        data = self._to_bytes(key)
+        if len(data) > self.width:
+            raise ValueError(f"Chiave più lunga di {self.width} byte: {key!r}")
+        return int.from_bytes(data.ljust(self.width, b'\0'), 'big')
+
+    def decode(self, code):
+        return self._from_bytes(code.to_bytes(self.width, 'big').rstrip(b'\0'))
+
+    def format(self, code):
+        return str(self.decode(code))
+
+
+class StrCodec(BytesCodec):
+    """Stringhe codificate in UTF-8, il cui ordine dei byte coincide con quello dei code point."""
+
+    name = "Codici"
+
+    def _from_bytes(self, data):
+        return data.decode('utf-8')
+
+    def format(self, code):
+        return self.decode(code)
+
+
+def codec_for(keys):
+    """Codifica adatta a una collezione di chiavi omogenee (interi, float, str o bytes)."""
+    keys = list(keys)
+    if all(isinstance(key, int) for key in keys):
+        return IntCodec()
+    if all(isinstance(key, (int, float)) for key in keys):
+        return FloatCodec()
+    if all(isinstance(key, str) for key in keys):
+        return StrCodec(max([1, *(len(key.encode('utf-8')) for key in keys)]))
+    if all(isinstance(key, (bytes, bytearray)) for key in keys):
+        return BytesCodec(max([1, *(len(key) for key in keys)]))
+    raise TypeError("Le chiavi devono essere tutte numeriche oppure tutte stringhe o byte")
+
+
+def codec_state(codec):
+    """Descrizione serializzabile di una codifica (nome ed eventuale larghezza)."""
+    return {'name': codec.name, 'width': getattr(codec, 'width', None)}
+
+
+def codec_from_state(state):
+    cls = {c.name: c for c in (IntCodec, FloatCodec, BytesCodec, StrCodec)}[state['name']]
+    return cls(state['width']) if state.get('width') is not None else cls()
+
+
+def encode_keys(codec, keys):
+    """Buffer tipizzato dei codici; oltre i 64 bit (stringhe lunghe) una lista di interi."""
+    codes = [codec.encode(key) for key in keys]
+    try:
+        return make_array(codes)
+    except OverflowError:
+        return codes
+
+
+def decode_keys(codec, codes):
+    return [codec.decode(code) for code in codes]
+
+
+def sort_keys(keys, codec=None):
+    """Ordina chiavi di qualunque tipo supportato con il radix sort sui codici."""
+    codec = codec or codec_for(keys)
+    codes = encode_keys(codec, keys)
+    run_headless(get_algorithm("Radix sort"), codes)
+    return decode_keys(codec, codes)
+
+
+# Tipi di chiave selezionabili nell'interfaccia: nome visualizzato -> codifica
+KEY_TYPES = {codec.name: codec for codec in (IntCodec(), FloatCodec(), StrCodec(4))}
@@ -0,0 +1,224 @@
+# Indice appreso: modello lineare a tratti che predice la posizione di una chiave
+# Ogni segmento garantisce un errore massimo sulla posizione, per cui la ricerca
+# si riduce a una ricerca binaria nella piccola finestra attorno alla predizione
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+
+from typed_arrays import make_array
+
+# Errore massimo predefinito (in posizioni) garantito da ogni segmento
+DEFAULT_MAX_ERROR = 8
+
+
+class LearnedIndex:
+    """Modello lineare a tratti sulle posizioni delle chiavi di un array ordinato.
+
+    I segmenti sono costruiti in una sola passata con l'algoritmo del cono
+    che si restringe: un segmento viene esteso finché esiste una pendenza
+    che predice ogni posizione di ``bisect_left`` con errore al più ``max_error``.
+    La ricerca valuta il segmento, cerca nella finestra ``±max_error`` e
+    verifica i bordi della finestra: se la chiave cadesse fuori (array
+    modificato dopo la costruzione) ripiega sulla ricerca binaria completa,
+    per cui il risultato è sempre quello di ``bisect_left``.
+    """
+
+    def __init__(self, keys, max_error=DEFAULT_MAX_ERROR, segments=None):
+        self.keys = keys
+        self.max_error = max_error
+        self.size = len(keys)
+        self.version = getattr(keys, 'version', None)
+        # Statistiche delle ricerche: finestre percorse e ripieghi sulla ricerca completa
+        self.queries = 0
+        self.window_total = 0
+        self.misses = 0
+        if segments is None:
+            self._build()
+        else:
+            # Segmenti già calcolati (ad esempio letti da un'istantanea): nessuna costruzione
+            self._starts, self._positions, self._slopes = segments
+
+    def state(self):
+        """Buffer dei segmenti: inizi, posizioni (con la sentinella finale) e pendenze."""
+        return self._starts, self._positions, self._slopes
+
+    def _points(self):
+        """Punti (chiave, posizione di bisect_left) che il modello deve predire.
+
+        Oltre alla prima occorrenza di ogni chiave c'è il punto ``chiave + 1``
+        con la posizione della chiave successiva: le chiavi sono interi (o
+        codici interi), per cui ogni target assente tra due chiavi, anche dopo
+        una lunga serie di duplicati, cade tra due punti vincolati.
+        """
+        last = None
+        for position, key in enumerate(self.keys):
+            if last is not None and key == last:
+                continue
+            if last is not None and key != last + 1:
+                yield last + 1, position
+            yield key, position
+            last = key
+        if last is not None:
+            yield last + 1, self.size
+
+    def _build(self):
+        e = self.max_error
+        starts, positions, slopes = [], [], []
+        first_key = first_pos = None
+        low, high = 0.0, math.inf
+        for key, position in self._points():
+            if first_key is not None:
+                dx = key - first_key
+                new_low = max(low, (position - first_pos - e) / dx)
+                new_high = min(high, (position - first_pos + e) / dx)
+                if new_low <= new_high:
+                    low, high = new_low, new_high
+                    continue
+                # Il cono è vuoto: si chiude il segmento con la pendenza centrale
+                starts.append(first_key)
+                positions.append(first_pos)
+                slopes.append((low + high) / 2 if high != math.inf else 0.0)
+            first_key, first_pos = key, position
+            low, high = 0.0, math.inf
+        if first_key is not None:
+            starts.append(first_key)
+            positions.append(first_pos)
+            slopes.append((low + high) / 2 if high != math.inf else 0.0)
+        positions.append(self.size)
+        self._starts = make_array(starts)
+        self._positions = make_array(positions)
+        self._slopes = array('d', slopes)
+
+    @property
+    def segments(self):
+        return len(self._slopes)
+
+    @property
+    def memory_bytes(self):
+        return sum(len(buffer) * buffer.itemsize for buffer in (self._starts, self._positions, self._slopes))
+
+    @property
+    def average_window(self):
+        return self.window_total / self.queries if self.queries else 0.0
+
+    def predict(self, key):
+        """Posizione predetta e finestra semiaperta ``[lo, hi)`` che contiene ``bisect_left``."""
+        segment = bisect_right(self._starts, key) - 1
+        if segment < 0:
+            return 0, 0, 0
+        positions = self._positions
+        estimate = positions[segment] + self._slopes[segment] * (key - self._starts[segment])
+        # Oltre l'ultimo punto del segmento la risposta è la posizione di inizio del successivo
+        # (per l'ultimo segmento la sentinella è la lunghezza dell'array)
+        if estimate > positions[segment + 1]:
+            estimate = positions[segment + 1]
+        predicted = int(estimate)
+        lo = predicted - self.max_error
+        hi = predicted + self.max_error + 2
+        return predicted, (lo if lo > 0 else 0), (hi if hi < self.size else self.size)
+
+    def window_holds(self, key, lo, hi):
+        """Verifica ai bordi che ``bisect_left`` cada davvero nella finestra ``[lo, hi]``."""
+        keys = self.keys
+        return (lo == 0 or keys[lo - 1] < key) and (hi == self.size or keys[hi] >= key)
+
+    def lower_bound(self, key):
+        """Prima posizione in cui ``key`` può essere inserita, come ``bisect_left``."""
+        _, lo, hi = self.predict(key)
+        self.queries += 1
+        self.window_total += hi - lo
+        index = bisect_left(self.keys, key, lo, hi)
+        # Un risultato interno alla finestra è certamente corretto: si verificano solo i bordi
+        if (index == lo or index == hi) and not self.window_holds(key, lo, hi):
+            self.misses += 1
+            return bisect_left(self.keys, key)
+        return index
+
+    def search(self, key):
+        """Indice della prima occorrenza di ``key`` oppure -1."""
+        index = self.lower_bound(key)
+        return index if index < self.size and self.keys[index] == key else -1
+
+    def describe(self):
+        return (f"Indice appreso: {self.segments} segmenti ±{self.max_error}, "
+                f"finestra media {self.average_window:.1f}")
+
+
+# Ultimo modello costruito: l'interfaccia lavora su un array alla volta
+_cached = None
+
+
+def install(model):
+    """Rende ``model`` il modello in cache, riusato da ``model_for`` per le sue chiavi."""
+    global _cached
+    _cached = model
+
+
+def model_for(keys, max_error=DEFAULT_MAX_ERROR, build=True):
+    """Modello per ``keys``, riusato finché l'array non cambia (lunghezza e versione).
+
+    Con ``build=False`` restituisce ``None`` invece di costruire un nuovo modello.
+    """
+    global _cached
+    model = _cached
+    if (model is not None and model.keys is keys and model.size == len(keys)
+            and model.version == getattr(keys, 'version', None) and model.max_error == max_error):
+        return model
+    if not build:
+        return None
+    _cached = LearnedIndex(keys, max_error)
+    return _cached
+
+
+def learned_search(array, target):
+    """Nucleo non animato nella forma di ``search_algorithms``: (indice, sonde).
+
+    Le sonde sono la valutazione del modello più i passi della ricerca
+    binaria nella finestra (o nell'intero array in caso di ripiego).
+    """
+    model = model_for(array)
+    _, lo, hi = model.predict(target)
+    n = len(array)
+    probes = 1 if n else 0
+    window_lo, window_hi = lo, hi
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probes += 1
+        if array[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    # Un risultato interno alla finestra è certamente corretto; ai bordi si verifica
+    # che l'array non sia cambiato dopo la costruzione del modello
+    if (lo == window_lo or lo == window_hi) and not model.window_holds(target, window_lo, window_hi):
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probes += 1
+            if array[mid] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+    if lo < n and array[lo] == target:
+        # Lettura di conferma della prima occorrenza
+        return lo, probes + 1
+    return -1, probes
+
+
+def trace_learned(array, target):
+    """Traccia (left, right, probe): prima la predizione con la sua finestra, poi la ricerca."""
+    model = model_for(array)
+    predicted, lo, hi = model.predict(target)
+    if not model.window_holds(target, lo, hi):
+        lo, hi = 0, len(array)
+    if len(array):
+        yield lo, max(lo, hi - 1), min(predicted, len(array) - 1)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        yield lo, hi - 1, mid
+        if array[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo < len(array) and array[lo] == target:
+        yield lo, lo, lo
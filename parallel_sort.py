@@ -0,0 +1,160 @@
+# Counting sort parallelo a blocchi per ordinamenti headless di grandi dimensioni
+# L'array viene copiato in memoria condivisa; ogni processo conta le chiavi di un blocco,
+# gli istogrammi vengono fusi e trasformati in posizioni, poi ogni processo riscrive
+# sul posto un tratto contiguo dell'uscita. Sotto la soglia tutto avviene nel processo corrente
+import os
+import random
+import time
+from array import array
+from collections import Counter
+
+from typed_arrays import make_array
+
+# I moduli dei processi e della memoria condivisa (decine di ms) sono importati solo dal ramo
+# parallelo: il modulo è importato dal registro degli algoritmi a ogni avvio
+
+# Sotto questa dimensione il costo di avvio dei processi supera il guadagno
+PARALLEL_MIN_SIZE = 1 << 20
+
+
+def _histogram(keys):
+    """Conteggio delle chiavi di un blocco (il ciclo di Counter è in C)."""
+    return Counter(keys)
+
+
+def _fill(view, runs, typecode):
+    """Scrive i tratti (posizione, chiave, ripetizioni) con assegnazioni a fette."""
+    for position, key, count in runs:
+        view[position:position + count] = array(typecode, (key,)) * count if typecode else [key] * count
+
+
+def _merge(histograms):
+    """Tratti (chiave, ripetizioni) in ordine di chiave dagli istogrammi dei blocchi."""
+    total = Counter()
+    for histogram in histograms:
+        total.update(histogram)
+    return sorted(total.items())
+
+
+def _split_runs(runs, n, parts):
+    """Divide i tratti in ``parts`` gruppi di uscite contigue di pari lunghezza.
+
+    Un tratto che attraversa un confine viene spezzato, per cui anche
+    una sola chiave ripetuta n volte è scritta da tutti i processi.
+    """
+    size = -(-n // parts)
+    groups = [[] for _ in range(parts)]
+    position = 0
+    for key, count in runs:
+        while count:
+            part = position // size
+            take = min(count, (part + 1) * size - position)
+            groups[part].append((position, key, take))
+            position += take
+            count -= take
+    return [group for group in groups if group]
+
+
+# Vista sulla memoria condivisa del processo di lavoro, aperta dall'inizializzatore
+_SHARED = None
+_VIEW = None
+
+
+def _init_worker(name, nbytes, typecode):
+    from multiprocessing.shared_memory import SharedMemory
+    global _SHARED, _VIEW
+    _SHARED = SharedMemory(name=name)
+    # Il segmento può essere arrotondato alla pagina: la vista copre solo i dati
+    _VIEW = _SHARED.buf[:nbytes].cast(typecode)
+
+
+def _histogram_job(bounds):
+    start, end = bounds
+    # Le fette di una memoryview non copiano i dati
+    return _histogram(_VIEW[start:end])
+
+
+def _fill_job(job):
+    runs, typecode = job
+    _fill(_VIEW, runs, typecode)
+
+
+def _sort_serial(data):
+    for group in _split_runs(_merge([_histogram(data)]), len(data), 1):
+        _fill(data, group, getattr(data, 'typecode', None))
+
+
+def parallel_counting_sort(data, workers=None, chunks=None):
+    """Ordina sul posto ``data`` (buffer tipizzato o lista) con istogrammi per blocco.
+
+    ``workers`` è il numero di processi (predefinito: i core disponibili),
+    ``chunks`` il numero di blocchi dell'istogramma (predefinito: quattro per
+    processo, per bilanciare blocchi di costo diverso). Sotto
+    ``PARALLEL_MIN_SIZE`` elementi o con un solo processo l'ordinamento avviene
+    nel processo corrente con le stesse funzioni.
+    """
+    n = len(data)
+    workers = workers or os.cpu_count() or 1
+    if n < max(2, PARALLEL_MIN_SIZE) or workers == 1:
+        _sort_serial(data)
+        return
+    try:
+        buffer = data if isinstance(data, array) else make_array(data)
+    except OverflowError:
+        # Chiavi oltre i 64 bit (codici di stringhe lunghe): solo la lista è possibile
+        _sort_serial(data)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+    typecode = buffer.typecode
+    nbytes = n * buffer.itemsize
+    shared = SharedMemory(create=True, size=nbytes)
+    try:
+        # Le viste vanno rilasciate prima di close() anche in caso di errore,
+        # altrimenti close() solleva BufferError e nasconde l'eccezione originale
+        with shared.buf[:nbytes] as raw, raw.cast(typecode) as view:
+            view[:] = memoryview(buffer)
+            chunks = chunks or workers * 4
+            step = -(-n // chunks)
+            bounds = [(start, min(n, start + step)) for start in range(0, n, step)]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(shared.name, nbytes, typecode)) as pool:
+                runs = _merge(pool.map(_histogram_job, bounds))
+                # Le chiavi sono già contate: i processi riscrivono l'uscita sul posto
+                list(pool.map(_fill_job, [(group, typecode) for group in _split_runs(runs, n, workers)]))
+            if buffer is data:
+                memoryview(data)[:] = view
+            else:
+                data[:] = view.tolist()
+    finally:
+        try:
+            shared.close()
+        finally:
+            shared.unlink()
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Misura il counting sort parallelo su chiavi casuali.")
+    parser.add_argument('--size', type=int, default=10_000_000, help="numero di chiavi")
+    parser.add_argument('--span', type=int, default=256, help="intervallo delle chiavi [0, span)")
+    parser.add_argument('--workers', type=int, default=None, help="processi (predefinito: tutti i core)")
+    parser.add_argument('--seed', type=int, default=0, help="seme del generatore pseudocasuale")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    keys = make_array([rng.randrange(args.span) for _ in range(args.size)])
+    expected = None
+    for label, workers in (("1 processo", 1), (f"{args.workers or os.cpu_count()} processi", args.workers)):
+        data = make_array(keys)
+        start = time.perf_counter()
+        parallel_counting_sort(data, workers=workers)
+        seconds = time.perf_counter() - start
+        if expected is None:
+            expected = data
+        print(f"{label:<14} {seconds:8.3f} s  {args.size / seconds / 1e6:8.2f} M chiavi/s  "
+              f"{'✅' if data == expected else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# Temporizzazione della riproduzione delle animazioni degli algoritmi
+# Ritardi fissi per passo oppure budget di tempo totale con salto dei fotogrammi (turbo)
+import math
+import threading
+import time
+
+# Costo stimato del rendering di un fotogramma completo in secondi:
+# sotto questa soglia per passo i fotogrammi intermedi vengono saltati
+DEFAULT_RENDER_COST = 0.05
+# Margine applicato al costo misurato per lasciare respiro al thread dell'interfaccia
+RENDER_HEADROOM = 1.5
+# Attesa massima del worker per lo smaltimento dei fotogrammi arretrati
+BACKLOG_TIMEOUT = 2.0
+
+
+class RenderMeter:
+    """Misura il costo reale dei fotogrammi e limita l'arretrato dell'interfaccia.
+
+    I fotogrammi vengono inviati al thread Tk con ``post``: ciascuno viene
+    cronometrato insieme al ridisegno (``update_idletasks``) e il costo
+    entra in una media mobile esponenziale. Il worker chiama
+    ``wait_for_ui`` prima di proseguire, così da non accodare più di
+    ``max_backlog`` fotogrammi non ancora disegnati.
+    """
+
+    def __init__(self, initial_cost=DEFAULT_RENDER_COST, smoothing=0.3, max_backlog=1,
+                 clock=time.perf_counter):
+        self.cost = initial_cost
+        self.smoothing = smoothing
+        self.max_backlog = max_backlog
+        self._clock = clock
+        self._pending = 0
+        self._cond = threading.Condition()
+        # Numero di fotogrammi misurati, utile per le statistiche
+        self.frames = 0
+        # Registro facoltativo (invio, inizio, fine) di ogni fotogramma, usato dai benchmark
+        self.trace = None
+
+    @property
+    def backlog(self):
+        return self._pending
+
+    def post(self, root, render):
+        """Accoda ``render`` sul thread dell'interfaccia misurandone la durata."""
+        with self._cond:
+            self._pending += 1
+        posted = self._clock()
+        root.after(0, lambda: self._run(root, render, posted))
+
+    def _run(self, root, render, posted):
+        start = self._clock()
+        try:
+            render()
+            root.update_idletasks()
+        finally:
+            elapsed = self._clock() - start
+            with self._cond:
+                self.cost += self.smoothing * (elapsed - self.cost)
+                self.frames += 1
+                if self.trace is not None:
+                    self.trace.append((posted, start, start + elapsed))
+                self._pending -= 1
+                self._cond.notify_all()
+
+    def wait_for_ui(self, timeout=BACKLOG_TIMEOUT):
+        """Blocca il worker finché l'interfaccia non ha smaltito l'arretrato."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending <= self.max_backlog, timeout)
+
+
+class FixedPlayback:
+    """Riproduzione classica: ogni passo viene mostrato e seguito dal ritardo indicato.
+
+    Con un ``RenderMeter`` il ritardo non scende mai sotto il costo misurato
+    di un fotogramma e il worker attende che l'interfaccia sia in pari.
+    """
+
+    turbo = False
+    stride = 1
+
+    def __init__(self, meter=None, sleep=time.sleep):
+        self.meter = meter
+        self._sleep = sleep
+        self.steps_done = 0
+        self.frames_rendered = 0
+
+    def step(self, force=False):
+        """Avanza di un passo; restituisce ``True`` se il passo va disegnato."""
+        self.steps_done += 1
+        self.frames_rendered += 1
+        return True
+
+    def pace(self, fixed_delay):
+        """Attende il ritardo fisso previsto per il passo corrente."""
+        if self.meter is not None:
+            self.meter.wait_for_ui()
+            fixed_delay = max(fixed_delay, self.meter.cost * RENDER_HEADROOM)
+        self._sleep(fixed_delay)
+
+
+class BudgetPlayback:
+    """Riproduzione vincolata a un budget di tempo totale.
+
+    Il ritardo per passo è ``budget / steps``; ogni passo ha una scadenza
+    assoluta ``inizio + (i + 1) · ritardo`` e ``pace`` dorme fino ad essa,
+    così che gli errori di temporizzazione non si accumulino. Se il tempo
+    disponibile per passo è inferiore al costo di rendering si entra in
+    modalità turbo: viene disegnato solo un passo ogni ``stride``, gli altri
+    vengono eseguiti senza aggiornare l'interfaccia e senza attese. Con un
+    ``RenderMeter`` il costo di rendering è quello misurato e ``stride``
+    viene ricalcolato ad ogni passo.
+    """
+
+    def __init__(self, budget, steps, render_cost=DEFAULT_RENDER_COST, meter=None,
+                 clock=time.perf_counter, sleep=time.sleep):
+        self.budget = max(0.0, budget)
+        self.steps = max(1, steps)
+        self.render_cost = render_cost
+        self.step_time = self.budget / self.steps
+        self.meter = meter
+        self._clock = clock
+        self._sleep = sleep
+        self._start = None
+        self._rendered = False
+        self.steps_done = 0
+        self.frames_rendered = 0
+        self._update_stride()
+
+    def _update_stride(self):
+        if self.step_time <= 0:
+            self.stride = self.steps
+        else:
+            self.stride = max(1, math.ceil(self.render_cost / self.step_time))
+        self.turbo = self.stride > 1
+
+    def step(self, force=False):
+        """Avanza di un passo; restituisce ``True`` se il passo va disegnato.
+
+        Vengono sempre disegnati i passi forzati (cambi di fase), l'ultimo
+        passo previsto e, in modalità turbo, un passo ogni ``stride``.
+        """
+        if self._start is None:
+            self._start = self._clock()
+        if self.meter is not None:
+            self.render_cost = self.meter.cost * RENDER_HEADROOM
+            self._update_stride()
+        self.steps_done += 1
+        self._rendered = (force or self.steps_done % self.stride == 0
+                          or self.steps_done >= self.steps)
+        if self._rendered:
+            self.frames_rendered += 1
+        return self._rendered
+
+    def pace(self, fixed_delay=None):
+        """Attende la scadenza del passo corrente, solo se il passo è stato disegnato.
+
+        ``fixed_delay`` è accettato per compatibilità con ``FixedPlayback`` e
+        ignorato: il ritmo è determinato unicamente dal budget.
+        """
+        if not self._rendered or self._start is None:
+            return
+        if self.meter is not None:
+            self.meter.wait_for_ui()
+        deadline = self._start + self.step_time * min(self.steps_done, self.steps)
+        remaining = deadline - self._clock()
+        if remaining > 0:
+            self._sleep(remaining)
+
@@ -0,0 +1,161 @@
+# Prefiltri di appartenenza per scartare in O(1) i target sicuramente assenti
+# prima di avviare la ricerca binaria (filtro di Bloom o bitset esatto)
+import math
+
+# Maschera per mantenere gli hash nel dominio degli interi senza segno a 64 bit
+_MASK64 = (1 << 64) - 1
+
+# Un bitset esatto viene preferito al filtro di Bloom quando l'intervallo delle
+# chiavi richiede al più questo multiplo dei bit del filtro di Bloom equivalente
+BITSET_RANGE_FACTOR = 4
+
+
+def _mix64(value):
+    """Funzione di mescolamento splitmix64 applicata a un intero arbitrario."""
+    z = (value + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+class BloomFilter:
+    """Filtro di Bloom su chiavi intere con tasso di falsi positivi configurabile.
+
+    Il numero di bit e di funzioni hash è dimensionato con le formule classiche
+    ``m = -n·ln(p) / ln(2)²`` e ``k = (m / n)·ln(2)``; le k posizioni sono
+    derivate da due hash indipendenti (double hashing).
+    """
+
+    kind = "Bloom"
+
+    def __init__(self, capacity, fp_rate=0.01):
+        if not 0 < fp_rate < 1:
+            raise ValueError("Il tasso di falsi positivi deve essere compreso tra 0 e 1")
+        capacity = max(1, capacity)
+        self.fp_rate = fp_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    @classmethod
+    def from_bits(cls, num_bits, num_hashes, fp_rate, bits):
+        """Filtro ricostruito dai parametri e dai bit salvati (ad esempio una vista su un file)."""
+        instance = cls.__new__(cls)
+        instance.num_bits, instance.num_hashes, instance.fp_rate = num_bits, num_hashes, fp_rate
+        instance.bits = bits
+        return instance
+
+    def state(self):
+        return {'kind': self.kind, 'num_bits': self.num_bits, 'num_hashes': self.num_hashes, 'fp_rate': self.fp_rate}
+
+    def _positions(self, key):
+        h1 = _mix64(key)
+        h2 = _mix64(h1) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key):
+        """Registra la chiave nel filtro; restituisce sempre ``True``."""
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        return True
+
+    def discard(self, key):
+        """I bit sono condivisi tra chiavi: la rimozione non è possibile e restituisce ``False``."""
+        return False
+
+    def might_contain(self, key):
+        """``False`` garantisce l'assenza; ``True`` richiede comunque la ricerca."""
+        for pos in self._positions(key):
+            if not self.bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    @property
+    def memory_bytes(self):
+        return len(self.bits)
+
+    def describe(self):
+        return f"{self.kind} k={self.num_hashes}, FP {self.fp_rate:.1%}"
+
+
+class BitsetFilter:
+    """Bitset esatto sull'intervallo ``[low, high]`` delle chiavi: nessun falso positivo."""
+
+    kind = "Bitset"
+
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+        self.bits = bytearray((high - low + 8) // 8)
+
+    @classmethod
+    def from_bits(cls, low, high, bits):
+        """Bitset ricostruito dall'intervallo e dai bit salvati."""
+        instance = cls.__new__(cls)
+        instance.low, instance.high, instance.bits = low, high, bits
+        return instance
+
+    def state(self):
+        return {'kind': self.kind, 'low': self.low, 'high': self.high}
+
+    def add(self, key):
+        """Registra la chiave; restituisce ``False`` se cade fuori dall'intervallo."""
+        if not self.low <= key <= self.high:
+            return False
+        offset = key - self.low
+        self.bits[offset >> 3] |= 1 << (offset & 7)
+        return True
+
+    def discard(self, key):
+        """Azzera il bit della chiave, da chiamare quando non ne restano occorrenze."""
+        if self.low <= key <= self.high:
+            offset = key - self.low
+            self.bits[offset >> 3] &= ~(1 << (offset & 7)) & 0xFF
+        return True
+
+    def might_contain(self, key):
+        if not self.low <= key <= self.high:
+            return False
+        offset = key - self.low
+        return bool(self.bits[offset >> 3] & (1 << (offset & 7)))
+
+    @property
+    def memory_bytes(self):
+        return len(self.bits)
+
+    def describe(self):
+        return f"{self.kind} esatto [{self.low}, {self.high}]"
+
+
+def build_prefilter(keys, fp_rate=0.01):
+    """Costruisce il prefiltro più compatto per le chiavi intere ``keys``.
+
+    Quando l'intervallo dei valori è piccolo rispetto alla dimensione del
+    filtro di Bloom equivalente viene usato un bitset esatto, altrimenti un
+    filtro di Bloom con il tasso di falsi positivi richiesto.
+    """
+    keys = list(keys)
+    prefilter = BloomFilter(len(keys), fp_rate)
+    if keys:
+        low, high = min(keys), max(keys)
+        if high - low + 1 <= BITSET_RANGE_FACTOR * prefilter.num_bits:
+            prefilter = BitsetFilter(low, high)
+    for key in keys:
+        prefilter.add(key)
+    return prefilter
+
+
+def prefilter_from_state(state, bits):
+    """Prefiltro descritto da ``state()`` con i bit ``bits``."""
+    state = dict(state)
+    kind = state.pop('kind')
+    cls = {BloomFilter.kind: BloomFilter, BitsetFilter.kind: BitsetFilter}[kind]
+    return cls.from_bits(bits=bits, **state)
+
+
+def format_bytes(size):
+    """Rappresentazione leggibile di una dimensione in byte."""
+    if size < 1024:
+        return f"{size} B"
+    return f"{size / 1024:.1f} KB"
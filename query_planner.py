@@ -0,0 +1,144 @@
+# Pianificatore delle ricerche su array non ordinati, consapevole dell'ammortamento
+# Ordinare costa O(n) (conteggio) o O(d·n) (radix) e si ripaga solo su molte ricerche:
+# per poche ricerche su dati appena caricati conviene una scansione o un insieme hash.
+# Il piano confronta i costi stimati sulle ricerche attese per la versione corrente dell'array
+from collections import namedtuple
+
+from algorithms import COUNTING_MAX_SPAN, RADIX_BITS
+
+# Strategie disponibili
+LINEAR_SCAN = "Scansione lineare"
+HASH_SET = "Insieme hash"
+SORT_THEN_SEARCH = "Ordinamento + ricerca binaria"
+STRATEGIES = (LINEAR_SCAN, HASH_SET, SORT_THEN_SEARCH)
+
+# Costo relativo dell'inserimento di una chiave nell'indice hash rispetto a una lettura
+HASH_BUILD_COST = 3
+# Ricerche attese su una versione nuova quando non c'è ancora uno storico
+DEFAULT_EXPECTED = 1
+
+
+class Plan(namedtuple('Plan', 'strategy costs lookups')):
+    """Strategia scelta, costi stimati di ogni strategia (in operazioni) e ricerche considerate."""
+
+    __slots__ = ()
+
+    @property
+    def cost(self):
+        return self.costs[self.strategy]
+
+    @property
+    def savings(self):
+        """Operazioni risparmiate rispetto all'ordinamento obbligatorio."""
+        return self.costs[SORT_THEN_SEARCH] - self.cost
+
+    def describe(self):
+        text = f"{self.strategy} per {self.lookups} ricerche (~{self.cost:,.0f} op)"
+        if self.strategy != SORT_THEN_SEARCH:
+            text += f", risparmio ~{self.savings:,.0f} op rispetto all'ordinamento"
+        return text
+
+
+def sort_cost(n, span):
+    """Operazioni stimate per ordinare: counting sort se l'intervallo lo consente, altrimenti radix."""
+    if span <= COUNTING_MAX_SPAN:
+        return 2 * n + span + 1
+    passes = -(-max(1, span.bit_length()) // RADIX_BITS)
+    return 2 * n * passes + (1 << RADIX_BITS)
+
+
+def estimate_costs(n, span, lookups, hashed=False):
+    """Costo totale di ``lookups`` ricerche per ciascuna strategia.
+
+    La scansione costa n letture per ricerca (i target assenti percorrono
+    tutto l'array), l'insieme hash una costruzione in O(n) più una lettura
+    per ricerca, l'ordinamento il suo costo più log2 n + 1 sonde per ricerca.
+    Con ``hashed`` l'indice hash della versione corrente esiste già.
+    """
+    return {
+        LINEAR_SCAN: n * lookups,
+        HASH_SET: (0 if hashed else HASH_BUILD_COST * n) + lookups,
+        SORT_THEN_SEARCH: sort_cost(n, span) + lookups * (n.bit_length() + 1),
+    }
+
+
+class QueryPlanner:
+    """Conta le ricerche per versione dell'array e sceglie la strategia più economica.
+
+    Una nuova versione (array generato o caricato) parte senza ricerche; le
+    ricerche attese sono le ricerche già fatte più quelle del lotto corrente,
+    ma almeno la media delle versioni precedenti, così che un uso abituale
+    con molte ricerche ordini subito e le ricerche occasionali non ordinino mai.
+    """
+
+    def __init__(self, expected=DEFAULT_EXPECTED):
+        self.version = 0
+        self.lookups = 0
+        self.history = []
+        self.default_expected = expected
+        self.last_plan = None
+        self._index = None
+        self._index_key = None
+        # Modifiche sul posto dell'array: stessa identità e talvolta stessa lunghezza
+        self.mutations = 0
+
+    def new_version(self):
+        """Chiude la versione corrente (dati nuovi): le sue ricerche entrano nello storico."""
+        if self.lookups:
+            self.history.append(self.lookups)
+        self.version += 1
+        self.lookups = 0
+        self.last_plan = None
+        self._index = None
+
+    def changed(self):
+        """Contenuto modificato sul posto (inserimento o cancellazione): l'indice hash
+        non è più valido, mentre le ricerche della versione restano contate."""
+        self.mutations += 1
+
+    @property
+    def expected_per_version(self):
+        if not self.history:
+            return self.default_expected
+        return round(sum(self.history) / len(self.history))
+
+    def record(self, count=1):
+        self.lookups += count
+
+    def _index_for(self, array):
+        """Chiave che identifica il contenuto per cui è stato costruito l'indice hash."""
+        return self.version, self.mutations, id(array), len(array)
+
+    def plan(self, array, batch=1):
+        """Piano per ``batch`` ricerche sull'array non ordinato ``array``."""
+        n = len(array)
+        span = max(array) - min(array) if n else 0
+        lookups = max(self.lookups + batch, self.expected_per_version) - self.lookups
+        hashed = self._index is not None and self._index_key == self._index_for(array)
+        costs = estimate_costs(n, span, lookups, hashed)
+        self.last_plan = Plan(min(STRATEGIES, key=costs.__getitem__), costs, lookups)
+        return self.last_plan
+
+    def hash_index(self, array):
+        """Indice hash chiave -> prima posizione, costruito una volta per versione e contenuto."""
+        key = self._index_for(array)
+        if self._index is None or self._index_key != key:
+            index = {}
+            for i, value in enumerate(array):
+                index.setdefault(value, i)
+            self._index, self._index_key = index, key
+        return self._index
+
+    def lookup(self, strategy, array, targets):
+        """Risposte (prima posizione oppure -1) con una strategia senza ordinamento."""
+        self.record(len(targets))
+        if strategy == HASH_SET:
+            index = self.hash_index(array)
+            return [index.get(t, -1) for t in targets]
+        answers = []
+        for t in targets:
+            try:
+                answers.append(array.index(t))
+            except ValueError:
+                answers.append(-1)
+        return answers
@@ -0,0 +1,422 @@
+# Server locale delle ricerche sull'array ordinato (socket Unix oppure TCP su localhost)
+# Il protocollo è a righe di testo e le risposte tornano nell'ordine delle richieste della stessa
+# connessione, per cui un client può inviarne molte senza attendere (pipelining). Le richieste
+# arrivate insieme da tutte le connessioni formano un lotto: le chiavi distinte vengono ordinate
+# e cercate con un limite inferiore che avanza, poi le risposte sono smistate alle richieste
+#
+#   search K1 K2 ...  ->  ok I1 I2 ...   (prima posizione oppure -1, chiavi nel formato della codifica)
+#   info              ->  ok {"count": ..., "codec": ..., "low": ..., "high": ...}
+#   stats             ->  ok {"requests": ..., "latency_ms": {"50": ...}, ...}
+#   (errori)          ->  err messaggio
+import argparse
+import asyncio
+import json
+import random
+import socket
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import deque, namedtuple
+
+from key_encoding import codec_from_state, codec_state
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+# Richieste al massimo in un lotto e attesa per riempirlo (0: solo le richieste già arrivate)
+MAX_BATCH = 1024
+BATCH_WINDOW = 0.0
+# Lunghezza massima di una riga di richiesta (un lotto di decine di migliaia di chiavi)
+MAX_LINE = 1 << 22
+# Latenze conservate per il calcolo dei percentili
+LATENCY_WINDOW = 10_000
+PERCENTILES = (50, 90, 99)
+
+# Dati serviti: chiavi ordinate (codici), codifica e prefiltro facoltativo
+Dataset = namedtuple('Dataset', 'keys codec prefilter')
+
+
+def lookup_batch(keys, targets, prefilter=None):
+    """Prima posizione di ogni codice di ``targets`` in ``keys`` (-1 se assente), come dizionario.
+
+    Le chiavi distinte sono cercate in ordine crescente, per cui ogni risposta
+    è il limite inferiore della ricerca successiva; i target scartati dal
+    prefiltro non vengono cercati. Le liste a blocchi usano la propria ricerca.
+    """
+    answers = {}
+    n = len(keys)
+    block_search = getattr(keys, 'bisect_left', None)
+    lo = 0
+    for target in sorted(set(targets)):
+        if prefilter is not None and not prefilter.might_contain(target):
+            answers[target] = -1
+            continue
+        lo = block_search(target) if block_search is not None else bisect_left(keys, target, lo)
+        answers[target] = lo if lo < n and keys[lo] == target else -1
+    return answers
+
+
+def percentiles(samples, points=PERCENTILES):
+    """Percentili (metodo del rango più vicino) di una sequenza di misure."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    # Rango più vicino: il p-esimo percentile è il valore di posto ceil(n·p/100) (da 1)
+    return {point: ordered[max(0, -(-len(ordered) * point // 100) - 1)] for point in points}
+
+
+class ServerStats:
+    """Contatori del server: richieste, chiavi, lotti e latenze recenti (arrivo -> risposta)."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.requests = 0
+        self.keys = 0
+        self.batches = 0
+        self.latencies = deque(maxlen=window)
+
+    def record_batch(self, requests, keys):
+        self.batches += 1
+        self.requests += requests
+        self.keys += keys
+
+    def as_dict(self):
+        return {
+            'requests': self.requests,
+            'keys': self.keys,
+            'batches': self.batches,
+            'mean_batch': self.requests / self.batches if self.batches else 0,
+            'latency_ms': {str(p): seconds * 1000 for p, seconds in percentiles(self.latencies).items()},
+        }
+
+    def describe(self):
+        stats = self.as_dict()
+        latency = " ".join(f"p{p}={ms:.3f}" for p, ms in stats['latency_ms'].items())
+        return (f"{stats['requests']} richieste in {stats['batches']} lotti "
+                f"(media {stats['mean_batch']:.1f}) | latenza ms {latency or '-'}")
+
+
+def format_address(address):
+    return address if isinstance(address, str) else f"{address[0]}:{address[1]}"
+
+
+class QueryServer:
+    """Server delle ricerche sui dati restituiti da ``source()``.
+
+    ``source`` è chiamata una volta per lotto e restituisce un ``Dataset``
+    oppure ``None`` se non ci sono dati ordinati da servire; ``address`` è
+    un percorso (socket Unix) oppure una coppia (host, porta), con porta 0
+    per una porta libera. ``serve_forever`` esegue il server nel thread
+    corrente, ``start``/``stop`` in un thread separato (per l'interfaccia).
+    """
+
+    def __init__(self, source, address=(DEFAULT_HOST, DEFAULT_PORT), max_batch=MAX_BATCH, window=BATCH_WINDOW):
+        self.source = source
+        self.address = address
+        self.max_batch = max_batch
+        self.window = window
+        self.stats = ServerStats()
+        self._server = None
+        self._queue = None
+        self._batcher = None
+        self._connections = {}
+        self._loop = None
+        self._thread = None
+
+    async def _open(self):
+        self._queue = asyncio.Queue()
+        if isinstance(self.address, str):
+            self._server = await asyncio.start_unix_server(self._handle, path=self.address, limit=MAX_LINE)
+        else:
+            host, port = self.address
+            self._server = await asyncio.start_server(self._handle, host, port, limit=MAX_LINE)
+            # Con la porta 0 il sistema sceglie una porta libera
+            self.address = self._server.sockets[0].getsockname()[:2]
+        self._batcher = asyncio.create_task(self._batches())
+
+    async def _close(self):
+        self._server.close()
+        await self._server.wait_closed()
+        # Le connessioni aperte vengono chiuse e terminano normalmente dopo le risposte in corso
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        self._batcher.cancel()
+
+    async def _handle(self, reader, writer):
+        self._connections[asyncio.current_task()] = writer
+        pending = asyncio.Queue()
+        sender = asyncio.create_task(self._send(pending, writer))
+        try:
+            while line := await reader.readline():
+                pending.put_nowait((time.perf_counter(), self._dispatch(line)))
+        except (ValueError, asyncio.LimitOverrunError):
+            # Riga oltre MAX_LINE: il resto del flusso non è più allineato alle richieste
+            future = asyncio.get_running_loop().create_future()
+            future.set_result("err richiesta troppo lunga")
+            pending.put_nowait((time.perf_counter(), future))
+        except ConnectionError:
+            pass
+        finally:
+            pending.put_nowait(None)
+            await sender
+            writer.close()
+            del self._connections[asyncio.current_task()]
+
+    async def _send(self, pending, writer):
+        """Risposte nell'ordine delle richieste; lo svuotamento avviene solo a coda vuota."""
+        while (item := await pending.get()) is not None:
+            arrived, future = item
+            response = await future
+            self.stats.latencies.append(time.perf_counter() - arrived)
+            try:
+                writer.write(response.encode() + b'\n')
+                if pending.empty():
+                    await writer.drain()
+            except ConnectionError:
+                return
+
+    def _dispatch(self, line):
+        """Future della risposta: le ricerche vanno in coda al lotto, gli altri comandi rispondono subito."""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            command, *tokens = line.decode().split()
+        except (UnicodeDecodeError, ValueError):
+            future.set_result("err richiesta vuota o non valida")
+            return future
+        command = command.lower()
+        if command == 'search':
+            self._queue.put_nowait((tokens, future))
+        elif command == 'stats':
+            future.set_result("ok " + json.dumps(self.stats.as_dict()))
+        elif command == 'info':
+            dataset = self.source()
+            if dataset is None:
+                future.set_result("err nessun array ordinato disponibile")
+            else:
+                keys = dataset.keys
+                future.set_result("ok " + json.dumps({
+                    'count': len(keys), 'codec': codec_state(dataset.codec),
+                    'low': keys[0] if len(keys) else None, 'high': keys[-1] if len(keys) else None}))
+        else:
+            future.set_result(f"err comando sconosciuto: {command}")
+        return future
+
+    async def _batches(self):
+        while True:
+            batch = [await self._queue.get()]
+            if self.window:
+                await asyncio.sleep(self.window)
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                self._answer(batch)
+            except Exception as error:
+                # Un errore inatteso non deve fermare il task: le richieste del lotto
+                # ancora senza risposta ricevono l'errore e il ciclo prosegue
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(f"err errore interno: {error!r}")
+
+    def _answer(self, batch):
+        dataset = self.source()
+        if dataset is None:
+            for _, future in batch:
+                future.set_result("err nessun array ordinato disponibile")
+            return
+        codec = dataset.codec
+        requests = []
+        for tokens, future in batch:
+            try:
+                requests.append(([codec.encode(codec.parse(token)) for token in tokens], future))
+            except ValueError as error:
+                future.set_result(f"err chiave non valida per {codec.name}: {error}")
+        targets = [code for codes, _ in requests for code in codes]
+        answers = lookup_batch(dataset.keys, targets, dataset.prefilter)
+        for codes, future in requests:
+            future.set_result(" ".join(["ok", *(str(answers[code]) for code in codes)]))
+        self.stats.record_batch(len(batch), len(targets))
+
+    def serve_forever(self):
+        async def main():
+            await self._open()
+            print(f"🔌 In ascolto su {format_address(self.address)}", flush=True)
+            try:
+                await self._server.serve_forever()
+            finally:
+                await self._close()
+
+        asyncio.run(main())
+
+    def start(self):
+        """Avvia il server in un thread separato e attende che sia in ascolto."""
+        ready = threading.Event()
+        failure = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self._open())
+            except OSError as error:
+                failure.append(error)
+                ready.set()
+                self._loop.close()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._close())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+
+class QueryClient:
+    """Client sincrono del protocollo a righe, con invio in pipeline."""
+
+    def __init__(self, address=(DEFAULT_HOST, DEFAULT_PORT), timeout=10.0):
+        if isinstance(address, str):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect(address)
+        else:
+            sock = socket.create_connection(address, timeout=timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket = sock
+        self._file = sock.makefile('rwb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+    def pipeline(self, lines):
+        """Invia tutte le righe e poi legge le risposte, nello stesso ordine."""
+        self._file.write(b"".join(line.encode() + b'\n' for line in lines))
+        self._file.flush()
+        return [self._file.readline().decode().rstrip('\n') for _ in lines]
+
+    def request(self, line):
+        return _payload(self.pipeline([line])[0])
+
+    def search(self, keys):
+        """Prima posizione di ogni chiave (nel formato testuale della codifica) oppure -1."""
+        return [int(index) for index in self.request("search " + " ".join(map(str, keys))).split()]
+
+    def info(self):
+        return json.loads(self.request("info"))
+
+    def stats(self):
+        return json.loads(self.request("stats"))
+
+
+def _payload(response):
+    status, _, payload = response.partition(' ')
+    if status != 'ok':
+        raise ValueError(payload or response)
+    return payload
+
+
+def _bench_connection(address, lines, pipeline, latencies):
+    with QueryClient(address) as client:
+        for start in range(0, len(lines), pipeline):
+            chunk = lines[start:start + pipeline]
+            sent = time.perf_counter()
+            for response in client.pipeline(chunk):
+                _payload(response)
+            # Ogni richiesta del gruppo attende al più la risposta all'ultima
+            latencies.extend([time.perf_counter() - sent] * len(chunk))
+
+
+def bench(address, connections=8, requests=2000, pipeline=16, keys=1, seed=0):
+    """Carico da ``connections`` client concorrenti; restituisce (secondi, latenze, statistiche del server)."""
+    with QueryClient(address) as client:
+        info = client.info()
+    codec = codec_from_state(info['codec'])
+    rng = random.Random(seed)
+    low, high = (info['low'], info['high']) if info['count'] else (0, 0)
+    workload = [[f"search {' '.join(codec.format(rng.randint(low, high)) for _ in range(keys))}"
+                 for _ in range(requests)] for _ in range(connections)]
+    latencies = []
+    threads = [threading.Thread(target=_bench_connection, args=(address, lines, pipeline, latencies))
+               for lines in workload]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    with QueryClient(address) as client:
+        return seconds, latencies, client.stats()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server locale delle ricerche e client di prova.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help="serve un'istantanea salvata")
+    serve.add_argument('snapshot', help="istantanea creata con snapshot.py o dall'interfaccia")
+    serve.add_argument('--window', type=float, default=BATCH_WINDOW * 1000, help="attesa per riempire un lotto (ms)")
+    serve.add_argument('--max-batch', type=int, default=MAX_BATCH, help="richieste al massimo per lotto")
+    load = commands.add_parser('bench', help="genera carico con client concorrenti in pipeline")
+    load.add_argument('--connections', type=int, default=8, help="client concorrenti")
+    load.add_argument('--requests', type=int, default=2000, help="richieste per client")
+    load.add_argument('--pipeline', type=int, default=16, help="richieste inviate prima di leggere le risposte")
+    load.add_argument('--keys', type=int, default=1, help="chiavi per richiesta")
+    load.add_argument('--seed', type=int, default=0, help="seme del generatore pseudocasuale")
+    query = commands.add_parser('query', help="cerca le chiavi indicate")
+    query.add_argument('keys', nargs='+')
+    for command in (serve, load, query):
+        command.add_argument('--unix', help="percorso del socket Unix (invece di TCP)")
+        command.add_argument('--host', default=DEFAULT_HOST)
+        command.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+    address = args.unix or (args.host, args.port)
+
+    if args.command == 'serve':
+        from snapshot import Snapshot
+        with Snapshot(args.snapshot) as snapshot:
+            dataset = Dataset(snapshot.keys, snapshot.codec, snapshot.prefilter)
+            server = QueryServer(lambda: dataset, address, args.max_batch, args.window / 1000)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                print(f"\n📊 {server.stats.describe()}")
+        return 0
+
+    if args.command == 'query':
+        with QueryClient(address) as client:
+            try:
+                answers = client.search(args.keys)
+            except ValueError as error:
+                print(f"❌ {error}")
+                return 1
+        for key, index in zip(args.keys, answers):
+            print(f"  {key} → {index if index != -1 else 'assente'}")
+        return 0
+
+    seconds, latencies, stats = bench(address, args.connections, args.requests, args.pipeline, args.keys, args.seed)
+    client_latency = " ".join(f"p{p}={s * 1000:.3f}" for p, s in percentiles(latencies).items())
+    server_latency = " ".join(f"p{p}={ms:.3f}" for p, ms in stats['latency_ms'].items())
+    print(f"⚡ {len(latencies)} richieste in {seconds:.2f} s ({len(latencies) / seconds:,.0f} richieste/s)")
+    print(f"  client (ms): {client_latency}")
+    print(f"  server (ms): {server_latency} | lotto medio {stats['mean_batch']:.1f} richieste")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
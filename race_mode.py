@@ -0,0 +1,180 @@
+# Modalità gara: più algoritmi di ricerca animati in parallelo sullo stesso array ordinato
+# Ogni algoritmo occupa una corsia di un unico Canvas; le celle vengono disegnate una
+# sola volta e ad ogni passo si aggiornano soltanto quelle che cambiano stato.
+# Le stesse corsie mostrano anche la cascata frazionaria, con un array per corsia
+import tkinter as tk
+
+from cascading import independent_cost
+from prefilter import format_bytes
+from search_algorithms import SEARCHES, time_search
+
+# Durata predefinita della gara in secondi e intervallo minimo tra due passi in millisecondi
+DEFAULT_DURATION = 5.0
+MIN_INTERVAL_MS = 16
+# Oltre questa dimensione i valori non vengono scritti dentro le celle
+MAX_LABELLED_CELLS = 40
+
+
+class _Lane:
+    """Stato di una corsia: array mostrato, celle del Canvas, traccia delle sonde e contatori."""
+
+    def __init__(self, name, array, steps, index, probes, seconds):
+        self.name = name
+        self.array = array
+        self.steps = steps
+        self.index = index
+        self.probes = probes
+        self.seconds = seconds
+        self.position = 0
+        self.left = 0
+        self.right = -1
+        self.probe = -1
+        self.cells = []
+        self.info = None
+
+
+class RaceWindow:
+    """Finestra della gara tra linear, binary, interpolation ed exponential search.
+
+    I tempi mostrati sono quelli dei nuclei non animati misurati prima della
+    gara; l'animazione avanza tutte le corsie di una sonda per tick.
+    """
+
+    def __init__(self, master, array, target, colors, duration=DEFAULT_DURATION, searches=SEARCHES, label=str):
+        # Esecuzione dei nuclei non animati e materializzazione delle tracce
+        lanes = []
+        for name, search, trace in searches:
+            index, probes = search(array, target)
+            seconds = time_search(search, array, target)
+            lanes.append(_Lane(name, array, list(trace(array, target)), index, probes, seconds))
+        self._open(master, f"🏁 Gara di ricerca: target {label(target)}", lanes, target, colors, duration, label)
+
+    def _open(self, master, title, lanes, target, colors, duration, label):
+        """Apre la finestra e disegna le corsie; l'animazione parte dopo il primo intervallo."""
+        self.target = target
+        self.colors = colors
+        # Conversione dei valori (eventualmente codificati) nel testo mostrato
+        self.label = label
+        self._pending = None
+        self.lanes = lanes
+
+        self.window = tk.Toplevel(master)
+        self.window.title(title)
+        self.window.configure(bg=colors['bg'])
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.interval_ms = max(MIN_INTERVAL_MS, int(duration * 1000 / max(1, self._ticks())))
+
+        n = max((len(lane.array) for lane in self.lanes), default=0)
+        self.cell_width = max(2, min(40, 1100 // max(1, n)))
+        self.lane_height = 90
+        width = self.cell_width * max(1, n) + 40
+        height = self.lane_height * len(self.lanes) + 20
+        self.canvas = tk.Canvas(self.window, width=width, height=height,
+                                bg=colors['card'], highlightthickness=0)
+        self.canvas.pack(padx=20, pady=20)
+
+        for row, lane in enumerate(self.lanes):
+            self._draw_lane(row, lane)
+
+        self._pending = self.window.after(self.interval_ms, self._tick)
+
+    def _ticks(self):
+        """Numero di tick dell'animazione: le corsie avanzano insieme."""
+        return max((len(lane.steps) for lane in self.lanes), default=1)
+
+    def _draw_lane(self, row, lane):
+        """Disegna una volta sola il titolo, le celle e la riga dei contatori di una corsia."""
+        top = 10 + row * self.lane_height
+        self.canvas.create_text(20, top, anchor='nw', text=f"🏁 {lane.name}",
+                                font=('Segoe UI', 12, 'bold'), fill=self.colors['text'])
+        labelled = len(lane.array) <= MAX_LABELLED_CELLS
+        for i, value in enumerate(lane.array):
+            x = 20 + i * self.cell_width
+            cell = self.canvas.create_rectangle(x, top + 25, x + self.cell_width - 1, top + 55,
+                                                fill=self.colors['warning'], outline='')
+            lane.cells.append(cell)
+            if labelled:
+                self.canvas.create_text(x + self.cell_width / 2, top + 40, text=self.label(value),
+                                        font=('Segoe UI', 8, 'bold'), fill='white')
+        lane.left, lane.right = 0, len(lane.array) - 1
+        lane.info = self.canvas.create_text(20, top + 60, anchor='nw', text=self._info_text(lane),
+                                            font=('Segoe UI', 10), fill=self.colors['text'])
+
+    def _info_text(self, lane):
+        result = f"indice {lane.index}" if lane.index != -1 else "non presente"
+        return (f"Sonde: {lane.position}/{lane.probes} | Core non animato: "
+                f"{lane.seconds * 1e6:.2f} µs | Risultato: {result}")
+
+    def _paint(self, lane, indices, color):
+        for i in indices:
+            self.canvas.itemconfig(lane.cells[i], fill=color)
+
+    def _advance(self, lane):
+        """Applica la sonda successiva aggiornando solo le celle modificate."""
+        left, right, probe = lane.steps[lane.position]
+        lane.position += 1
+        # Le celle uscite dall'intervallo attivo diventano grigie
+        # (gli intervalli delle tracce sono annidati, quindi bastano i due margini)
+        excluded = [*range(lane.left, min(left, lane.right + 1)),
+                    *range(max(right + 1, lane.left), lane.right + 1)]
+        self._paint(lane, excluded, self.colors['shadow'])
+        # La sonda precedente torna al colore dell'intervallo a cui appartiene
+        if lane.probe != -1 and left <= lane.probe <= right:
+            self._paint(lane, [lane.probe], self.colors['warning'])
+        found = lane.position == len(lane.steps) and probe == lane.index
+        self._paint(lane, [probe], self.colors['success'] if found else self.colors['primary'])
+        lane.left, lane.right, lane.probe = left, right, probe
+        self.canvas.itemconfig(lane.info, text=self._info_text(lane))
+
+    def _tick(self):
+        self._pending = None
+        running = False
+        for lane in self.lanes:
+            if lane.position < len(lane.steps):
+                self._advance(lane)
+                running = True
+        if running:
+            self._pending = self.window.after(self.interval_ms, self._tick)
+
+    def close(self):
+        if self._pending is not None:
+            self.window.after_cancel(self._pending)
+            self._pending = None
+        self.window.destroy()
+
+
+class CascadeWindow(RaceWindow):
+    """Ricerca dello stesso target in più array ordinati con la cascata frazionaria.
+
+    Ogni corsia mostra un array: la prima esegue la ricerca binaria, le
+    successive, una dopo l'altra, ricevono dal ponte una finestra di pochi
+    elementi e trovano la risposta in un numero costante di passi.
+    """
+
+    def __init__(self, master, cascade, target, colors, duration=DEFAULT_DURATION, label=str):
+        answers, self.probes = cascade.search_with_probes(target)
+        seconds = time_search(lambda _, key: cascade.lower_bounds(key), None, target)
+        lanes = [_Lane(f"Array {i + 1}", array, steps, index, len(steps), seconds)
+                 for i, (array, steps, index) in enumerate(zip(cascade.arrays, cascade.trace(target), answers))]
+        self._open(master, f"🪜 Cascata frazionaria: target {label(target)}", lanes, target, colors, duration, label)
+        tk.Label(self.window,
+                 text=f"🪜 {len(cascade)} array: {self.probes} letture invece di "
+                      f"{independent_cost(cascade.arrays)} con ricerche indipendenti | "
+                      f"Query: {seconds * 1e6:.2f} µs | Memoria: {format_bytes(cascade.memory_bytes)}",
+                 font=('Segoe UI', 11, 'bold'), fg=colors['text'], bg=colors['bg']).pack(pady=(0, 15))
+
+    def _ticks(self):
+        """Le corsie avanzano una dopo l'altra, come i livelli della cascata."""
+        return sum(len(lane.steps) for lane in self.lanes)
+
+    def _info_text(self, lane):
+        result = f"indice {lane.index}" if lane.index != -1 else "non presente"
+        return f"Passi: {lane.position}/{lane.probes} | Risultato: {result}"
+
+    def _tick(self):
+        self._pending = None
+        lane = next((lane for lane in self.lanes if lane.position < len(lane.steps)), None)
+        if lane is not None:
+            self._advance(lane)
+            self._pending = self.window.after(self.interval_ms, self._tick)
@@ -0,0 +1,141 @@
+# Record (chiave, payload) memorizzati come struttura di array paralleli tipizzati
+# Le chiavi restano in un buffer denso per la ricerca; l'ordinamento stabile per
+# conteggio o radix sposta i payload insieme alle chiavi senza creare oggetti per record
+from array import array
+from bisect import bisect_left, bisect_right
+
+from batch_search import search_sorted_batch
+from typed_arrays import make_array, typecode_for, widen_for, zeros
+
+# Oltre questo rapporto tra intervallo delle chiavi e numero di record si usa il radix sort
+COUNTING_RANGE_FACTOR = 4
+# Bit per passata del radix sort
+RADIX_BITS = 8
+
+
+def _distribute(keys, payloads, low, shift, mask):
+    """Passata stabile di distribuzione: ordina per la cifra ``(key - low) >> shift & mask``.
+
+    Con ``mask`` uguale a ``None`` la cifra è l'intera chiave traslata
+    (counting sort in una sola passata). Restituisce i nuovi buffer.
+    Le cifre sono calcolate in un buffer tipizzato (un byte per record
+    con le passate da 8 bit), non in una lista di interi Python.
+    """
+    n = len(keys)
+    if mask is None:
+        buckets = max(keys) - low + 1
+        digits = (key - low for key in keys)
+    else:
+        buckets = mask + 1
+        digits = ((key - low) >> shift & mask for key in keys)
+    digits = array('B' if buckets <= 256 else typecode_for(0, buckets - 1), digits)
+    count = zeros(buckets + 1)
+    for digit in digits:
+        count[digit + 1] += 1
+    for digit in range(buckets):
+        count[digit + 1] += count[digit]
+    out_keys = zeros(n, keys.typecode)
+    out_payloads = zeros(n, payloads.typecode)
+    for i, digit in enumerate(digits):
+        position = count[digit]
+        out_keys[position] = keys[i]
+        out_payloads[position] = payloads[i]
+        count[digit] = position + 1
+    return out_keys, out_payloads
+
+
+class RecordArray:
+    """Record (chiave, payload) interi in due buffer tipizzati paralleli.
+
+    Le ricerche usano solo il buffer delle chiavi e restituiscono
+    direttamente il payload; l'ordinamento avviene al primo accesso dopo
+    una modifica ed è stabile, per cui i record con chiavi uguali restano
+    nell'ordine di inserimento.
+    """
+
+    def __init__(self, keys=(), payloads=(), key_typecode=None, payload_typecode=None):
+        keys = list(keys)
+        payloads = list(payloads)
+        if len(keys) != len(payloads):
+            raise ValueError("Chiavi e payload devono avere la stessa lunghezza")
+        self.keys = make_array(keys, key_typecode)
+        self.payloads = make_array(payloads, payload_typecode)
+        self._sorted = len(keys) < 2
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        pairs = list(pairs)
+        return cls((key for key, _ in pairs), (payload for _, payload in pairs))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        """Coppie (chiave, payload) nell'ordine delle chiavi."""
+        self._ensure_sorted()
+        return zip(self.keys, self.payloads)
+
+    def __repr__(self):
+        return f"RecordArray({len(self)} record)"
+
+    @property
+    def memory_bytes(self):
+        return len(self.keys) * self.keys.itemsize + len(self.payloads) * self.payloads.itemsize
+
+    def add(self, key, payload):
+        """Aggiunge un record; l'ordinamento viene rimandato alla prossima ricerca."""
+        self.keys = widen_for(self.keys, key)
+        self.payloads = widen_for(self.payloads, payload)
+        if self._sorted and len(self.keys) and key < self.keys[-1]:
+            self._sorted = False
+        self.keys.append(key)
+        self.payloads.append(payload)
+
+    def sort(self):
+        """Ordinamento stabile per chiave che permuta i payload insieme alle chiavi."""
+        keys, payloads = self.keys, self.payloads
+        if len(keys) > 1:
+            low = min(keys)
+            span = max(keys) - low
+            if span <= COUNTING_RANGE_FACTOR * len(keys):
+                keys, payloads = _distribute(keys, payloads, low, 0, None)
+            else:
+                mask = (1 << RADIX_BITS) - 1
+                shift = 0
+                while span >> shift:
+                    keys, payloads = _distribute(keys, payloads, low, shift, mask)
+                    shift += RADIX_BITS
+        self.keys, self.payloads = keys, payloads
+        self._sorted = True
+
+    def _ensure_sorted(self):
+        if not self._sorted:
+            self.sort()
+
+    def find(self, key):
+        """Indice del primo record con chiave ``key`` oppure -1."""
+        self._ensure_sorted()
+        index = bisect_left(self.keys, key)
+        return index if index < len(self.keys) and self.keys[index] == key else -1
+
+    def lookup(self, key):
+        """Payload del primo record con chiave ``key``; ``KeyError`` se assente."""
+        index = self.find(key)
+        if index == -1:
+            raise KeyError(key)
+        return self.payloads[index]
+
+    def get(self, key, default=None):
+        index = self.find(key)
+        return default if index == -1 else self.payloads[index]
+
+    def lookup_all(self, key):
+        """Payload di tutti i record con chiave ``key``, nell'ordine di inserimento."""
+        self._ensure_sorted()
+        return self.payloads[bisect_left(self.keys, key):bisect_right(self.keys, key)]
+
+    def lookup_batch(self, keys, default=None):
+        """Payload di un lotto di chiavi con una sola finger search sul buffer delle chiavi."""
+        self._ensure_sorted()
+        indices, _ = search_sorted_batch(self.keys, keys)
+        return [default if index == -1 else self.payloads[index] for index in indices]
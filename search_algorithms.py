@@ -0,0 +1,192 @@
+# Algoritmi di ricerca su array ordinati in due forme: nucleo non animato e traccia delle sonde
+# Il nucleo restituisce (indice, sonde) ed è usato per le misure di tempo; la traccia
+# produce una tupla (left, right, probe) per ogni sonda e alimenta le animazioni
+import time
+
+from learned_index import learned_search, trace_learned
+
+
+def linear_search(array, target):
+    """Scansione sequenziale: si ferma al primo elemento >= target."""
+    probes = 0
+    for i in range(len(array)):
+        probes += 1
+        value = array[i]
+        if value == target:
+            return i, probes
+        if value > target:
+            break
+    return -1, probes
+
+
+def trace_linear(array, target):
+    n = len(array)
+    for i in range(n):
+        yield i, n - 1, i
+        if array[i] >= target:
+            return
+
+
+def binary_search(array, target):
+    """Ricerca binaria classica con mid = (left + right) // 2."""
+    left, right = 0, len(array) - 1
+    probes = 0
+    while left <= right:
+        mid = (left + right) // 2
+        probes += 1
+        value = array[mid]
+        if value == target:
+            return mid, probes
+        if value < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return -1, probes
+
+
+def trace_binary(array, target):
+    left, right = 0, len(array) - 1
+    while left <= right:
+        mid = (left + right) // 2
+        yield left, right, mid
+        value = array[mid]
+        if value == target:
+            return
+        if value < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+
+def _interpolate(array, target, left, right):
+    """Posizione stimata del target per interpolazione lineare tra gli estremi."""
+    low, high = array[left], array[right]
+    if high == low:
+        return left
+    return left + (target - low) * (right - left) // (high - low)
+
+
+def interpolation_search(array, target):
+    """Ricerca per interpolazione: ottima su chiavi distribuite uniformemente."""
+    left, right = 0, len(array) - 1
+    probes = 0
+    while left <= right and array[left] <= target <= array[right]:
+        pos = _interpolate(array, target, left, right)
+        probes += 1
+        value = array[pos]
+        if value == target:
+            return pos, probes
+        if value < target:
+            left = pos + 1
+        else:
+            right = pos - 1
+    return -1, probes
+
+
+def trace_interpolation(array, target):
+    left, right = 0, len(array) - 1
+    while left <= right and array[left] <= target <= array[right]:
+        pos = _interpolate(array, target, left, right)
+        yield left, right, pos
+        value = array[pos]
+        if value == target:
+            return
+        if value < target:
+            left = pos + 1
+        else:
+            right = pos - 1
+
+
+def binary_search_range(array, target, left, right):
+    """Ricerca binaria ristretta all'intervallo chiuso [left, right]."""
+    probes = 0
+    while left <= right:
+        mid = (left + right) // 2
+        probes += 1
+        value = array[mid]
+        if value == target:
+            return mid, probes
+        if value < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return -1, probes
+
+
+def exponential_search(array, target):
+    """Ricerca esponenziale: raddoppia il limite, poi ricerca binaria nell'ultimo tratto."""
+    n = len(array)
+    if n == 0:
+        return -1, 0
+    probes = 1
+    if array[0] == target:
+        return 0, probes
+    bound = 1
+    while bound < n:
+        probes += 1
+        if array[bound] >= target:
+            break
+        bound *= 2
+    left, right = bound // 2, min(bound, n - 1)
+    index, extra = binary_search_range(array, target, left, right)
+    return index, probes + extra
+
+
+def trace_exponential(array, target):
+    n = len(array)
+    if n == 0:
+        return
+    yield 0, n - 1, 0
+    if array[0] == target:
+        return
+    bound = 1
+    while bound < n:
+        yield bound // 2, n - 1, bound
+        if array[bound] >= target:
+            break
+        bound *= 2
+    left, right = bound // 2, min(bound, n - 1)
+    while left <= right:
+        mid = (left + right) // 2
+        yield left, right, mid
+        value = array[mid]
+        if value == target:
+            return
+        if value < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+
+# Elenco degli algoritmi confrontabili: (nome, nucleo, traccia)
+SEARCHES = [
+    ("Lineare", linear_search, trace_linear),
+    ("Binaria", binary_search, trace_binary),
+    ("Interpolazione", interpolation_search, trace_interpolation),
+    ("Esponenziale", exponential_search, trace_exponential),
+    ("Appreso", learned_search, trace_learned),
+]
+
+
+def time_search(search, array, target, min_time=0.005, repeat=3):
+    """Tempo per chiamata (in secondi) del nucleo non animato, migliore di ``repeat`` misure.
+
+    Il numero di chiamate per misura cresce finché una misura non dura
+    almeno ``min_time`` secondi, come fa ``timeit.Timer.autorange``.
+    """
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            search(array, target)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            search(array, target)
+        best = min(best, time.perf_counter() - start)
+    return best / calls
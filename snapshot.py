@@ -0,0 +1,236 @@
+# Istantanee binarie dell'array ordinato e degli indici costruiti (prefiltro, indice appreso)
+# Il file ha un'intestazione fissa, i metadati JSON e le sezioni dei buffer allineate a 8 byte,
+# protette da un CRC32. La rilettura mappa il file in memoria: chiavi e indici sono viste
+# senza copia sul file, per cui la prima ricerca è possibile subito dopo l'apertura
+import argparse
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+
+from key_encoding import IntCodec, codec_from_state, codec_state
+from learned_index import DEFAULT_MAX_ERROR, LearnedIndex
+from parallel_sort import parallel_counting_sort
+from prefilter import build_prefilter, prefilter_from_state
+from typed_arrays import make_array
+
+MAGIC = b'BSSNAP'
+FORMAT_VERSION = 1
+# Intestazione: magic, versione, CRC32 di metadati e dati, lunghezza dei metadati, inizio e lunghezza dei dati
+_HEADER = struct.Struct('<6sHIIQQ')
+_ALIGN = 8
+
+
+class SnapshotError(ValueError):
+    """File che non è un'istantanea valida (formato, versione o checksum)."""
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _buffer(values):
+    """Buffer tipizzato delle chiavi; le chiavi oltre i 64 bit non sono salvabili."""
+    if isinstance(values, array):
+        return values
+    if isinstance(values, memoryview):
+        # Sezione di un'istantanea aperta: copia dei byte con lo stesso tipo
+        return array(values.format, values.tobytes())
+    try:
+        return make_array(values)
+    except OverflowError:
+        raise ValueError("Chiavi oltre i 64 bit: l'istantanea richiede un buffer tipizzato") from None
+
+
+def save_snapshot(path, keys, codec=None, prefilter=None, learned=None):
+    """Scrive l'istantanea delle chiavi ordinate ``keys`` e degli indici indicati.
+
+    Il file viene scritto accanto alla destinazione e poi rinominato, per cui
+    un'istantanea esistente non resta mai scritta a metà. Restituisce la
+    dimensione in byte.
+    """
+    sections = [('keys', _buffer(keys))]
+    meta = {'codec': codec_state(codec or IntCodec()), 'count': len(keys),
+            'prefilter': None, 'learned': None, 'sections': {}}
+    if prefilter is not None:
+        meta['prefilter'] = prefilter.state()
+        sections.append(('prefilter', array('B', bytes(prefilter.bits))))
+    if learned is not None:
+        meta['learned'] = {'max_error': learned.max_error}
+        for name, buffer in zip(('starts', 'positions', 'slopes'), learned.state()):
+            sections.append((f'learned.{name}', _buffer(buffer)))
+
+    offset = 0
+    for name, buffer in sections:
+        meta['sections'][name] = {'offset': offset, 'typecode': buffer.typecode, 'count': len(buffer)}
+        offset = _aligned(offset + len(buffer) * buffer.itemsize)
+    meta_bytes = json.dumps(meta, separators=(',', ':')).encode('utf-8')
+    data_start = _aligned(_HEADER.size + len(meta_bytes))
+
+    payload = bytearray(offset)
+    for name, buffer in sections:
+        start = meta['sections'][name]['offset']
+        payload[start:start + len(buffer) * buffer.itemsize] = buffer.tobytes()
+    checksum = zlib.crc32(payload, zlib.crc32(meta_bytes))
+
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, checksum, len(meta_bytes), data_start, len(payload)))
+        f.write(meta_bytes)
+        f.write(bytes(data_start - _HEADER.size - len(meta_bytes)))
+        f.write(payload)
+    os.replace(temporary, path)
+    return data_start + len(payload)
+
+
+class Snapshot:
+    """Istantanea aperta in sola lettura tramite mmap.
+
+    ``keys`` è una ``memoryview`` tipizzata sul file; prefiltro e indice
+    appreso usano viste sulle rispettive sezioni. Con ``verify`` il CRC32
+    viene controllato all'apertura (una passata in C sui byte del file).
+    Va chiusa con ``close()`` o usata con ``with``.
+    """
+
+    def __init__(self, path, verify=True):
+        self.path = path
+        self._views = []
+        self._map = None
+        with open(path, 'rb') as f:
+            # mmap rifiuta i file vuoti: il controllo della lunghezza viene prima della mappatura
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise SnapshotError(f"{path}: file troppo corto per un'istantanea")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open(verify)
+        except Exception:
+            self.close()
+            raise
+
+    def _view(self, start, length, typecode='B'):
+        raw = memoryview(self._map)[start:start + length]
+        view = raw.cast(typecode)
+        self._views += [raw, view]
+        return view
+
+    def _open(self, verify):
+        magic, version, checksum, meta_length, data_start, data_length = _HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise SnapshotError(f"{self.path}: non è un'istantanea")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(f"{self.path}: versione {version} non supportata")
+        if data_start + data_length > len(self._map):
+            raise SnapshotError(f"{self.path}: file troncato")
+        meta_bytes = self._map[_HEADER.size:_HEADER.size + meta_length]
+        if verify:
+            payload = self._view(data_start, data_length)
+            if zlib.crc32(payload, zlib.crc32(meta_bytes)) != checksum:
+                raise SnapshotError(f"{self.path}: checksum non valido")
+        try:
+            meta = json.loads(meta_bytes)
+        except ValueError as error:
+            # Possibile solo senza verifica del checksum: metadati corrotti
+            raise SnapshotError(f"{self.path}: metadati non validi ({error})") from None
+        self.meta = meta
+
+        def section(name):
+            info = meta['sections'][name]
+            itemsize = array(info['typecode']).itemsize
+            return self._view(data_start + info['offset'], info['count'] * itemsize, info['typecode'])
+
+        self.codec = codec_from_state(meta['codec'])
+        self.keys = section('keys')
+        self.prefilter = None
+        if meta['prefilter'] is not None:
+            self.prefilter = prefilter_from_state(meta['prefilter'], section('prefilter'))
+        self.learned = None
+        if meta['learned'] is not None:
+            segments = tuple(section(f'learned.{name}') for name in ('starts', 'positions', 'slopes'))
+            self.learned = LearnedIndex(self.keys, meta['learned']['max_error'], segments=segments)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def search(self, key):
+        """Indice della prima occorrenza del codice ``key`` oppure -1."""
+        if self.prefilter is not None and not self.prefilter.might_contain(key):
+            return -1
+        if self.learned is not None:
+            return self.learned.search(key)
+        index = bisect_left(self.keys, key)
+        return index if index < len(self.keys) and self.keys[index] == key else -1
+
+    def close(self):
+        """Rilascia le viste (e gli oggetti che le usano) e chiude la mappatura."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self.keys = self.prefilter = self.learned = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Crea, ispeziona e interroga istantanee binarie.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    create = commands.add_parser('create', help="genera, ordina, indicizza e salva chiavi casuali")
+    create.add_argument('path')
+    create.add_argument('--size', type=int, default=1_000_000, help="numero di chiavi")
+    create.add_argument('--seed', type=int, default=0, help="seme del generatore pseudocasuale")
+    create.add_argument('--fp-rate', type=float, default=0.01, help="falsi positivi del prefiltro")
+    create.add_argument('--max-error', type=int, default=DEFAULT_MAX_ERROR, help="errore dell'indice appreso")
+    query = commands.add_parser('query', help="apre un'istantanea e cerca le chiavi indicate")
+    query.add_argument('path')
+    query.add_argument('keys', nargs='*', help="chiavi da cercare (nel formato della codifica salvata)")
+    query.add_argument('--no-verify', action='store_true', help="salta il controllo del checksum")
+    args = parser.parse_args(argv)
+
+    if args.command == 'create':
+        start = time.perf_counter()
+        rng = random.Random(args.seed)
+        keys = make_array([rng.randrange(args.size * 4) for _ in range(args.size)])
+        parallel_counting_sort(keys)
+        size = save_snapshot(args.path, keys, prefilter=build_prefilter(keys, args.fp_rate),
+                             learned=LearnedIndex(keys, args.max_error))
+        print(f"💾 {args.path}: {len(keys)} chiavi, {size} byte in {time.perf_counter() - start:.2f} s")
+        return 0
+
+    start = time.perf_counter()
+    try:
+        snapshot = Snapshot(args.path, verify=not args.no_verify)
+    except (OSError, ValueError, KeyError) as error:
+        # SnapshotError è un ValueError; JSON non valido e sezioni mancanti arrivano senza verifica
+        print(f"❌ {error}")
+        return 1
+    status = 0
+    with snapshot:
+        opened = time.perf_counter()
+        print(f"📂 {args.path}: {len(snapshot)} chiavi ({snapshot.codec.name}) aperte in {(opened - start) * 1e3:.2f} ms")
+        for token in args.keys:
+            try:
+                code = snapshot.codec.encode(snapshot.codec.parse(token))
+            except ValueError:
+                print(f"  {token} → ❌ chiave non valida per {snapshot.codec.name}")
+                status = 1
+                continue
+            index = snapshot.search(code)
+            print(f"  {token} → {index if index != -1 else 'assente'}  "
+                  f"({(time.perf_counter() - opened) * 1e3:.3f} ms dall'apertura)")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
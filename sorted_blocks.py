@@ -0,0 +1,208 @@
+# Struttura dati a blocchi per il mantenimento incrementale di una sequenza ordinata
+# Permette inserimenti e cancellazioni sub-lineari senza riordinare l'intero array
+from bisect import bisect_left, bisect_right
+from array import array
+from typed_arrays import make_array, widen_for
+
+# Dimensione di riferimento di ciascun blocco: i blocchi vengono divisi quando
+# superano il doppio di questo valore e fusi quando scendono sotto la metà
+DEFAULT_LOAD = 64
+
+
+class BlockSortedList:
+    """Lista ordinata suddivisa in blocchi di dimensione limitata.
+
+    Ogni blocco è un buffer tipizzato ``array.array`` ordinato (gli interi
+    sono memorizzati in forma compatta, senza un oggetto Python ciascuno) e
+    l'indice ``_maxes`` contiene il massimo di ciascun blocco, così che la
+    localizzazione del blocco corretto richieda una ricerca binaria e
+    l'aggiornamento tocchi un solo blocco di al più ``2 * load`` elementi. Espone il protocollo di sequenza
+    (``len``, indicizzazione, iterazione) per poter sostituire ``self.array``
+    nell'interfaccia grafica senza modifiche al codice di rendering.
+    """
+
+    def __init__(self, values=(), load=DEFAULT_LOAD, typecode=None):
+        if load < 2:
+            raise ValueError("Il fattore di carico deve essere almeno 2")
+        self._load = load
+        self._len = 0
+        self._blocks = []
+        self._maxes = []
+        # Offset cumulativi dei blocchi, ricostruiti pigramente dopo ogni modifica
+        self._offsets = None
+        # Contatore delle modifiche, usato per invalidare gli indici derivati
+        self.version = 0
+        self._build(make_array(sorted(values), typecode))
+
+    @classmethod
+    def from_sorted(cls, ordered, load=DEFAULT_LOAD):
+        """Costruisce la lista da un buffer già ordinato, senza riordinarlo."""
+        instance = cls(load=load)
+        instance._build(make_array(ordered))
+        return instance
+
+    def _build(self, ordered):
+        """Ripartisce un buffer tipizzato già ordinato in blocchi di dimensione ``load``."""
+        load = self._load
+        self._typecode = ordered.typecode
+        self._blocks = [ordered[i:i + load] for i in range(0, len(ordered), load)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(ordered)
+        self._offsets = None
+        self.version += 1
+
+    @property
+    def typecode(self):
+        return self._typecode
+
+    @property
+    def itemsize(self):
+        return array(self._typecode).itemsize
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __contains__(self, value):
+        if not self._maxes:
+            return False
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        block = self._blocks[pos]
+        i = bisect_left(block, value)
+        return block[i] == value
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def _ensure_offsets(self):
+        """Ricalcola gli offset cumulativi dei blocchi in O(numero di blocchi)."""
+        if self._offsets is None:
+            offsets = []
+            total = 0
+            for block in self._blocks:
+                offsets.append(total)
+                total += len(block)
+            self._offsets = offsets
+        return self._offsets
+
+    def _locate(self, index):
+        """Converte un indice globale nella coppia (blocco, posizione nel blocco)."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("Indice fuori dai limiti della lista ordinata")
+        offsets = self._ensure_offsets()
+        pos = bisect_right(offsets, index) - 1
+        return pos, index - offsets[pos]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        pos, idx = self._locate(index)
+        return self._blocks[pos][idx]
+
+    def add(self, value):
+        """Inserisce ``value`` mantenendo l'ordinamento (duplicati ammessi).
+
+        Restituisce l'indice in cui è finito il nuovo elemento, dopo gli
+        eventuali duplicati già presenti.
+        """
+        self._widen(value)
+        if not self._maxes:
+            self._blocks.append(array(self._typecode, [value]))
+            self._maxes.append(value)
+            index = 0
+        else:
+            pos = bisect_right(self._maxes, value)
+            if pos == len(self._maxes):
+                # Il valore supera tutti i massimi: si accoda all'ultimo blocco
+                pos -= 1
+                index = self._ensure_offsets()[pos] + len(self._blocks[pos])
+                self._blocks[pos].append(value)
+                self._maxes[pos] = value
+            else:
+                idx = bisect_right(self._blocks[pos], value)
+                index = self._ensure_offsets()[pos] + idx
+                self._blocks[pos].insert(idx, value)
+            self._split(pos)
+        self._len += 1
+        self._offsets = None
+        self.version += 1
+        return index
+
+    def _widen(self, value):
+        """Converte i blocchi a un tipo più ampio se ``value`` non è rappresentabile."""
+        extremes = (self._blocks[0][0], self._maxes[-1]) if self._maxes else None
+        probe = widen_for(array(self._typecode), value, extremes)
+        if probe.typecode != self._typecode:
+            self._typecode = probe.typecode
+            self._blocks = [array(self._typecode, block) for block in self._blocks]
+
+    def _split(self, pos):
+        """Divide in due il blocco ``pos`` se ha superato la dimensione massima."""
+        block = self._blocks[pos]
+        if len(block) > 2 * self._load:
+            half = block[self._load:]
+            del block[self._load:]
+            self._maxes[pos] = block[-1]
+            self._blocks.insert(pos + 1, half)
+            self._maxes.insert(pos + 1, half[-1])
+
+    def discard(self, value):
+        """Rimuove un'occorrenza di ``value``; restituisce ``False`` se assente."""
+        if not self._maxes:
+            return False
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        block = self._blocks[pos]
+        idx = bisect_left(block, value)
+        if block[idx] != value:
+            return False
+        del block[idx]
+        self._len -= 1
+        self._offsets = None
+        self.version += 1
+        if not block:
+            del self._blocks[pos]
+            del self._maxes[pos]
+        else:
+            self._maxes[pos] = block[-1]
+            self._merge(pos)
+        return True
+
+    def remove(self, value):
+        """Rimuove un'occorrenza di ``value`` sollevando ``ValueError`` se assente."""
+        if not self.discard(value):
+            raise ValueError(f"{value!r} non è presente nella lista ordinata")
+
+    def _merge(self, pos):
+        """Fonde il blocco ``pos`` con il successivo se è sceso sotto metà carico."""
+        if len(self._blocks) < 2 or len(self._blocks[pos]) >= self._load // 2:
+            return
+        if pos == len(self._blocks) - 1:
+            pos -= 1
+        self._blocks[pos].extend(self._blocks[pos + 1])
+        del self._blocks[pos + 1]
+        del self._maxes[pos]
+        self._maxes[pos] = self._blocks[pos][-1]
+        self._split(pos)
+
+    def bisect_left(self, value):
+        """Restituisce la prima posizione in cui ``value`` può essere inserito."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._ensure_offsets()[pos] + bisect_left(self._blocks[pos], value)
+
+    def index(self, value):
+        """Restituisce l'indice della prima occorrenza di ``value``."""
+        idx = self.bisect_left(value)
+        if idx == self._len or self[idx] != value:
+            raise ValueError(f"{value!r} non è presente nella lista ordinata")
+        return idx
@@ -0,0 +1,26 @@
+# Misura dei tempi di avvio dell'interfaccia, dall'inizio degli import
+# Le tappe (prima visualizzazione, pannelli completi, prima ricerca) sono registrate
+# una sola volta ciascuna, così che le misure ripetute da script restino confrontabili
+import time
+
+# Tappe registrate dall'interfaccia
+FIRST_PAINT = "prima visualizzazione"
+PANELS_READY = "pannelli completi"
+FIRST_QUERY = "prima ricerca"
+
+
+class StartupTimer:
+    """Secondi trascorsi da ``started`` (per l'interfaccia: l'inizio degli import) a ogni tappa."""
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.marks = {}
+
+    def mark(self, name):
+        """Registra la tappa alla prima chiamata e restituisce i secondi trascorsi."""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.started
+        return self.marks[name]
+
+    def describe(self):
+        return " | ".join(f"import → {name}: {seconds * 1000:.1f} ms" for name, seconds in self.marks.items())
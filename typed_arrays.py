@@ -0,0 +1,97 @@
+# Supporto per buffer tipizzati contigui (array.array) al posto di liste di interi Python
+# Riduce l'occupazione di memoria per elemento e mantiene i dati densi per le scansioni
+from array import array
+
+# Codici di tipo in ordine di ampiezza crescente: int32 e int64 con segno,
+# più uint64 per i codici delle chiavi float e stringa (tutti non negativi)
+INT32 = 'i'
+INT64 = 'q'
+UINT64 = 'Q'
+
+# Intervalli rappresentabili per ciascun codice di tipo
+_LIMITS = {
+    INT32: (-(1 << 31), (1 << 31) - 1),
+    INT64: (-(1 << 63), (1 << 63) - 1),
+    UINT64: (0, (1 << 64) - 1),
+}
+
+
+def typecode_for(low, high):
+    """Restituisce il codice di tipo più compatto che contiene ``[low, high]``."""
+    for typecode in (INT32, INT64, UINT64):
+        lo, hi = _LIMITS[typecode]
+        if lo <= low and high <= hi:
+            return typecode
+    raise OverflowError("Valori fuori dall'intervallo degli interi a 64 bit")
+
+
+def make_array(values, typecode=None):
+    """Crea un buffer tipizzato dai valori, scegliendo il tipo se non indicato."""
+    if isinstance(values, array) and typecode in (None, values.typecode):
+        return array(values.typecode, values)
+    values = list(values)
+    if typecode is None:
+        typecode = typecode_for(min(values), max(values)) if values else INT32
+    return array(typecode, values)
+
+
+def zeros(length, typecode=INT64):
+    """Buffer tipizzato di ``length`` zeri allocato senza oggetti intermedi."""
+    return array(typecode, bytes(length * array(typecode).itemsize))
+
+
+def widened_typecode(values, value, extremes=None):
+    """Tipo più compatto per i valori presenti in ``values`` più ``value``.
+
+    Decide dai dati, non dai limiti del tipo attuale: ``[1, 2, 3]`` in un
+    buffer int32 accoglie 2**63 passando a uint64. ``extremes`` è la coppia
+    (minimo, massimo) se già nota (liste ordinate), altrimenti si calcola
+    con una passata sui valori.
+    """
+    if extremes is None:
+        extremes = (min(values, default=value), max(values, default=value))
+    low, high = extremes
+    return typecode_for(min(low, value), max(high, value))
+
+
+def widen_for(buffer, value, extremes=None):
+    """Restituisce ``buffer`` oppure una sua copia più ampia in grado di contenere ``value``."""
+    lo, hi = _LIMITS[buffer.typecode]
+    if lo <= value <= hi:
+        return buffer
+    return array(widened_typecode(buffer, value, extremes), buffer)
+
+
+def can_hold(sequence, value):
+    """``True`` se ``widen_for`` trova un tipo a 64 bit per il contenuto di ``sequence`` e ``value``.
+
+    Le sequenze senza buffer tipizzato (liste di codici oltre i 64 bit) accettano ogni valore.
+    """
+    typecode = getattr(sequence, 'typecode', None)
+    if typecode is None:
+        return True
+    lo, hi = _LIMITS[typecode]
+    if lo <= value <= hi:
+        return True
+    try:
+        widened_typecode(sequence, value)
+    except OverflowError:
+        return False
+    return True
+
+
+def as_view(sequence):
+    """Vista di sola lettura senza copia sui dati di un buffer tipizzato.
+
+    Per i buffer ``array.array`` restituisce un ``memoryview`` (da rilasciare
+    con ``release()`` o tramite ``with`` prima di ridimensionare il buffer);
+    le altre sequenze sono restituite invariate.
+    """
+    if isinstance(sequence, array):
+        return memoryview(sequence).toreadonly()
+    return sequence
+
+
+def itemsize_of(sequence):
+    """Byte occupati da ciascun elemento, se la sequenza ha un buffer tipizzato."""
+    return getattr(sequence, 'itemsize', None)
@@ -0,0 +1,204 @@
+# Lista ordinata a blocchi con versioni immutabili per letture concorrenti senza lock
+# Ogni scrittura copia solo il blocco toccato (copy-on-write) e pubblica una nuova versione
+# sostituendo un solo riferimento; i lettori (rendering, ricerche, server) fissano una versione
+# all'inizio del loro lavoro e la vedono invariata qualunque cosa facciano gli scrittori
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+
+from sorted_blocks import DEFAULT_LOAD
+from typed_arrays import make_array, widen_for
+
+
+class SortedVersion:
+    """Versione immutabile di una lista ordinata a blocchi.
+
+    Espone la stessa interfaccia di lettura di ``BlockSortedList`` (``len``,
+    indicizzazione, iterazione, ``in``, ``bisect_left``, ``index``). I blocchi
+    sono condivisi con le versioni vicine e non vengono mai modificati dopo
+    la pubblicazione; ``version`` cresce a ogni pubblicazione.
+    """
+
+    __slots__ = ('_blocks', '_maxes', '_offsets', '_len', '_typecode', 'version')
+
+    def __init__(self, blocks, maxes, typecode, version):
+        self._blocks = blocks
+        self._maxes = maxes
+        self._len = sum(len(block) for block in blocks)
+        self._typecode = typecode
+        self._offsets = None
+        self.version = version
+
+    @property
+    def typecode(self):
+        return self._typecode
+
+    @property
+    def itemsize(self):
+        return array(self._typecode).itemsize
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __contains__(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        block = self._blocks[pos]
+        return block[bisect_left(block, value)] == value
+
+    def __repr__(self):
+        return f"{type(self).__name__}(v{self.version}, {list(self)!r})"
+
+    def _ensure_offsets(self):
+        # Calcolo pigro: due lettori concorrenti producono la stessa tupla
+        if self._offsets is None:
+            offsets = []
+            total = 0
+            for block in self._blocks:
+                offsets.append(total)
+                total += len(block)
+            self._offsets = tuple(offsets)
+        return self._offsets
+
+    def _locate(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("Indice fuori dai limiti della lista ordinata")
+        offsets = self._ensure_offsets()
+        pos = bisect_right(offsets, index) - 1
+        return pos, index - offsets[pos]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        pos, idx = self._locate(index)
+        return self._blocks[pos][idx]
+
+    def bisect_left(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._ensure_offsets()[pos] + bisect_left(self._blocks[pos], value)
+
+    def index(self, value):
+        idx = self.bisect_left(value)
+        if idx == self._len or self[idx] != value:
+            raise ValueError(f"{value!r} non è presente nella lista ordinata")
+        return idx
+
+
+class VersionedSortedList:
+    """Scrittore delle versioni di una lista ordinata a blocchi.
+
+    ``current`` è l'ultima versione pubblicata; ``pin()`` la restituisce e
+    il lettore la usa finché vuole, senza lock: la pubblicazione è
+    l'assegnazione di un riferimento, per cui un lettore vede la versione
+    precedente o quella nuova, mai uno stato intermedio. Le scritture sono
+    serializzate da un lock e copiano solo il blocco modificato (più gli
+    indici dei blocchi, che contengono riferimenti), con le stesse regole di
+    divisione e fusione di ``BlockSortedList``.
+    """
+
+    def __init__(self, values=(), load=DEFAULT_LOAD):
+        if load < 2:
+            raise ValueError("Il fattore di carico deve essere almeno 2")
+        self._load = load
+        self._lock = threading.Lock()
+        self._version = 0
+        self.current = None
+        self.publish(sorted(values))
+
+    def pin(self):
+        """Versione corrente, che resta valida e invariata per chi la conserva."""
+        return self.current
+
+    def _publish(self, blocks, maxes, typecode):
+        self._version += 1
+        self.current = SortedVersion(tuple(blocks), tuple(maxes), typecode, self._version)
+        return self.current
+
+    def publish(self, ordered):
+        """Sostituisce il contenuto con il buffer già ordinato ``ordered``."""
+        ordered = make_array(ordered)
+        load = self._load
+        blocks = [ordered[i:i + load] for i in range(0, len(ordered), load)]
+        with self._lock:
+            return self._publish(blocks, [block[-1] for block in blocks], ordered.typecode)
+
+    def add(self, value):
+        """Pubblica una versione con ``value`` inserito (duplicati ammessi).
+
+        Restituisce la coppia (versione, indice del nuovo elemento), con il
+        nuovo elemento dopo gli eventuali duplicati già presenti.
+        """
+        with self._lock:
+            current = self.current
+            extremes = (current._blocks[0][0], current._maxes[-1]) if current._maxes else None
+            typecode = widen_for(array(current.typecode), value, extremes).typecode
+            if typecode != current.typecode:
+                # Valore non rappresentabile: tutti i blocchi passano al tipo più ampio
+                blocks = [array(typecode, block) for block in current._blocks]
+            else:
+                blocks = list(current._blocks)
+            maxes = list(current._maxes)
+            if not blocks:
+                blocks.append(array(typecode, [value]))
+                maxes.append(value)
+                index = 0
+            else:
+                pos = min(bisect_right(maxes, value), len(blocks) - 1)
+                block = array(typecode, blocks[pos])
+                idx = bisect_right(block, value)
+                block.insert(idx, value)
+                # La divisione del blocco non sposta l'elemento nella sequenza complessiva
+                index = current._ensure_offsets()[pos] + idx
+                blocks[pos] = block
+                maxes[pos] = block[-1]
+                self._split(blocks, maxes, pos)
+            return self._publish(blocks, maxes, typecode), index
+
+    def discard(self, value):
+        """Pubblica una versione senza un'occorrenza di ``value``; ``False`` se assente."""
+        with self._lock:
+            current = self.current
+            maxes = list(current._maxes)
+            pos = bisect_left(maxes, value)
+            if pos == len(maxes):
+                return False
+            block = current._blocks[pos]
+            idx = bisect_left(block, value)
+            if block[idx] != value:
+                return False
+            blocks = list(current._blocks)
+            block = block[:idx] + block[idx + 1:]
+            if not block:
+                del blocks[pos]
+                del maxes[pos]
+            else:
+                blocks[pos] = block
+                maxes[pos] = block[-1]
+                self._merge(blocks, maxes, pos)
+            self._publish(blocks, maxes, current.typecode)
+            return True
+
+    def _split(self, blocks, maxes, pos):
+        block = blocks[pos]
+        if len(block) > 2 * self._load:
+            blocks[pos:pos + 1] = [block[:self._load], block[self._load:]]
+            maxes[pos:pos + 1] = [blocks[pos][-1], block[-1]]
+
+    def _merge(self, blocks, maxes, pos):
+        if len(blocks) < 2 or len(blocks[pos]) >= self._load // 2:
+            return
+        if pos == len(blocks) - 1:
+            pos -= 1
+        # La concatenazione crea un blocco nuovo: i due originali restano alle versioni precedenti
+        blocks[pos:pos + 2] = [blocks[pos] + blocks[pos + 1]]
+        maxes[pos:pos + 2] = [blocks[pos][-1]]
+        self._split(blocks, maxes, pos)